@@ -212,17 +212,20 @@ export default function App() {
       const initClient = async () => {
         setConfigError(null);
         try {
-          const config = await getAppConfig();
+          // Fails (and retries) until the backend is up
+          await getAppConfig();
           const typesenseInstantsearchAdapter =
             new TypesenseInstantSearchAdapter({
               server: {
-                apiKey: config.typesense.api_key,
+                // Searches go through the backend, which caches results
+                apiKey: "backend",
                 nodes: [
                   {
-                    host: config.typesense.host,
-                    port: config.typesense.port,
-                    path: "",
-                    protocol: config.typesense.protocol,
+                    host: window.location.hostname,
+                    port: Number(window.location.port) ||
+                      (window.location.protocol === "https:" ? 443 : 80),
+                    path: "/api/v1/search",
+                    protocol: window.location.protocol.replace(":", ""),
                   },
                 ],
                 cacheSearchResultsForSeconds: 0,
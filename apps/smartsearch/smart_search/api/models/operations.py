@@ -16,6 +16,13 @@ class OperationType(str, Enum):
     DELETE = "delete"  # File deleted
 
 
+# Queue priorities: live file events are served ahead of the bulk crawl,
+# deletes first since they are cheap and remove stale results
+PRIORITY_CRAWL = 0
+PRIORITY_WATCH = 10
+PRIORITY_DELETE = 20
+
+
 class CrawlOperation(BaseModel):
     """
     Enhanced operation for the queue
@@ -15,6 +15,7 @@ from smart_search.api.models.crawler import (
     CrawlStatusResponse,
     MessageResponse,
 )
+from smart_search.core.config import settings as app_settings
 from smart_search.core.logging import logger
 from smart_search.database.models import get_db
 from smart_search.database.repositories import SettingsRepository, WatchPathRepository
@@ -56,6 +57,7 @@ def start_crawler(db: Session = Depends(get_db)):
                 "max_file_size_mb": "100",
                 "batch_size": "10",
                 "worker_queue_size": "1000",
+                "indexing_workers": str(app_settings.indexing_workers),
             }
         )
 
@@ -300,19 +302,21 @@ def clear_all_indexes(db: Session = Depends(get_db)):
 
 
 @router.get("/stats")
-def get_crawler_stats(db: Session = Depends(get_db)):
+async def get_crawler_stats():
     """
     Aggregate crawler statistics for UI using Typesense as the single source of truth.
     """
     try:
-        from smart_search.services.typesense_client import get_typesense_client
+        from fastapi.concurrency import run_in_threadpool
 
-        typesense_client = get_typesense_client()
+        from smart_search.services.async_typesense_client import get_async_typesense_client
+
+        typesense_client = get_async_typesense_client()
         crawl_manager = get_crawl_job_manager()
 
         # Get stats from Typesense
         try:
-            ts_stats = typesense_client.get_collection_stats()
+            ts_stats = await typesense_client.get_collection_stats()
             total_indexed = ts_stats.get("num_documents", 0)
             healthy = True
         except Exception as e:
@@ -322,13 +326,13 @@ def get_crawler_stats(db: Session = Depends(get_db)):
 
         # Get file type distribution from Typesense
         try:
-            file_types = typesense_client.get_file_type_distribution()
+            file_types = await typesense_client.get_file_type_distribution()
         except Exception as e:
             logger.warning(f"Failed to get file type distribution: {e}")
             file_types = {}
 
-        # Runtime state from CrawlJobManager
-        status_dict = crawl_manager.get_status()
+        # Runtime state from CrawlJobManager (read from the database when idle)
+        status_dict = await run_in_threadpool(crawl_manager.get_status)
         running = bool(status_dict.get("running", False))
 
         # Fix: Ensure consistency between discovered and indexed counts
@@ -356,134 +360,36 @@ def get_crawler_stats(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/stream")
-def stream_crawler_status(db: Session = Depends(get_db)):
+@router.get("/pipeline")
+def get_pipeline_stats():
     """
-    Server-Sent Events (SSE) stream that pushes crawl status + stats ONLY when state changes.
+    Per-stage queue depth, worker usage and throughput of the indexing pipeline.
     """
+    try:
+        crawl_manager = get_crawl_job_manager()
+        return {
+            "stages": crawl_manager.get_pipeline_stats(),
+            "timestamp": int(time.time() * 1000),
+        }
+    except Exception as e:
+        logger.error(f"Error getting pipeline stats: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-    def event_generator():
-        import json as _json
-
-        from fastapi.encoders import jsonable_encoder
-
-        from smart_search.services.typesense_client import get_typesense_client
 
-        previous_payload = None
-        last_heartbeat = time.time()
-        heartbeat_interval = 30
-
-        def payloads_equal(p1: dict | None, p2: dict | None) -> bool:
-            """Compare two payloads to detect changes, ignoring timestamp"""
-            if p1 is None or p2 is None:
-                return False
-            p1_copy = {k: v for k, v in p1.items() if k != "timestamp"}
-            p2_copy = {k: v for k, v in p2.items() if k != "timestamp"}
-            return p1_copy == p2_copy
-
-        while True:
-            try:
-                crawl_manager = get_crawl_job_manager()
-                status_dict = crawl_manager.get_status()
-                typesense_client = get_typesense_client()
-
-                # Get stats from Typesense
-                try:
-                    ts_stats = typesense_client.get_collection_stats()
-                    total_indexed = ts_stats.get("num_documents", 0)
-                    healthy = True
-                except Exception as e:
-                    error_str = str(e)
-                    if (
-                        "503" in error_str
-                        or "Not Ready" in error_str
-                        or "Lagging" in error_str
-                        or "Connection" in error_str
-                    ):
-                        logger.debug(f"Typesense unavailable in SSE stream: {e}")
-                    else:
-                        logger.warning(f"Error getting Typesense stats in SSE: {e}")
-                    total_indexed = 0
-                    healthy = False
-
-                # Get file type distribution from Typesense
-                try:
-                    file_types = typesense_client.get_file_type_distribution()
-                except Exception as e:
-                    logger.debug(f"Failed to get file type distribution in SSE: {e}")
-                    file_types = {}
-
-                # Get watch paths from database
-                try:
-                    watch_path_repo = WatchPathRepository(db)
-                    watch_path_models = watch_path_repo.get_all()
-                    watch_paths = [
-                        {
-                            "id": wp.id,
-                            "path": wp.path,
-                            "enabled": wp.enabled,
-                            "include_subdirectories": wp.include_subdirectories,
-                            "created_at": wp.created_at.isoformat() if wp.created_at else None,
-                            "updated_at": wp.updated_at.isoformat() if wp.updated_at else None,
-                        }
-                        for wp in watch_path_models
-                    ]
-                except Exception as e:
-                    logger.warning(f"Failed to get watch paths in SSE: {e}")
-                    watch_paths = []
-
-                indexed = int(total_indexed)
-                discovered = max(int(status_dict.get("files_discovered", 0)), indexed)
-
-                indexed_vs_discovered = float(indexed) / discovered if discovered > 0 else 0.0
-
-                payload = {
-                    "status": status_dict,
-                    "stats": {
-                        "totals": {
-                            "discovered": discovered,
-                            "indexed": indexed,
-                        },
-                        "ratios": {
-                            "indexed_vs_discovered": min(indexed_vs_discovered, 1.0),
-                        },
-                        "file_types": file_types,
-                        "runtime": {
-                            "running": bool(crawl_manager.is_running()),
-                        },
-                        "healthy": healthy,
-                    },
-                    "watch_paths": watch_paths,
-                    "timestamp": int(time.time() * 1000),
-                }
-
-                data = jsonable_encoder(payload)
-
-                if not payloads_equal(data, previous_payload):
-                    yield f"data: {_json.dumps(data)}\n\n"
-                    previous_payload = data
-                    last_heartbeat = time.time()
-                elif time.time() - last_heartbeat > heartbeat_interval:
-                    yield ":heartbeat\n\n"
-                    last_heartbeat = time.time()
-
-                current_phase = status_dict.get("current_phase", "idle")
-                if current_phase in ("verifying", "discovering", "indexing"):
-                    # Fast updates when active
-                    poll_interval = 0.5
-                else:
-                    # Responsive even when idle
-                    poll_interval = 1.0
-
-                time.sleep(poll_interval)
-            except Exception as e:
-                logger.error(f"Error in crawler SSE stream: {e}")
-                break
+@router.get("/stream")
+def stream_crawler_status():
+    """
+    Server-Sent Events (SSE) stream that pushes crawl status + stats ONLY when state changes.
 
+    Every connection subscribes to one shared snapshot, rebuilt when the crawl,
+    the index or the watch paths change (see CrawlerStatusStream).
+    """
     from fastapi.responses import StreamingResponse
 
+    from smart_search.services.crawler.status_stream import get_crawler_status_stream
+
     return StreamingResponse(
-        event_generator(),
+        get_crawler_status_stream().events(),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -504,6 +410,7 @@ def get_crawler_settings(db: Session = Depends(get_db)):
                 "max_file_size_mb": "100",
                 "batch_size": "10",
                 "worker_queue_size": "1000",
+                "indexing_workers": str(app_settings.indexing_workers),
             }
         )
 
@@ -522,9 +429,13 @@ def update_crawler_settings(settings: Dict[str, Any], db: Session = Depends(get_
         settings_repo = SettingsRepository(db)
 
         for key, value in settings.items():
-            if key in ["max_file_size_mb", "batch_size", "worker_queue_size"]:
+            if key in ["max_file_size_mb", "batch_size", "worker_queue_size", "indexing_workers"]:
                 settings_repo.set(key, value)
 
+        # Apply a new worker pool size right away
+        if "indexing_workers" in settings:
+            get_crawl_job_manager().apply_worker_settings()
+
         logger.info(f"Updated crawler settings: {settings}")
 
         return MessageResponse(
@@ -561,8 +472,7 @@ def verify_indexed_files(db: Session = Depends(get_db)):
         if not watch_paths:
             raise HTTPException(status_code=400, detail="No watch paths configured for verification")
 
-        # Placeholder
-        verification_stats = {}
+        verification_stats = crawl_manager.verify_index()
 
         logger.info(f"Manual index verification completed: {verification_stats}")
 
@@ -14,7 +14,10 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from smart_search.core.logging import logger
-from smart_search.services.typesense_client import TypesenseClient
+from smart_search.services.crawler.catalog import get_file_catalog
+from smart_search.services.crawler.index_stats import get_index_stats
+from smart_search.services.crawler.snapshots import get_directory_snapshot_store
+from smart_search.services.typesense_client import TypesenseClient, get_typesense_client
 
 router = APIRouter(prefix="/files", tags=["files"])
 
@@ -182,6 +185,10 @@ def forget_file_from_index(file_path: str, typesense_client: TypesenseClient) ->
 
         # Remove from Typesense index
         typesense_client.remove_from_index(file_path)
+        get_file_catalog().forget([file_path])
+        get_index_stats().forget([file_path])
+        # The file is still on disk: list its directory again on the next crawl
+        get_directory_snapshot_store().invalidate([os.path.dirname(file_path)])
 
         return True, "File removed from search index"
 
@@ -356,8 +363,10 @@ def delete_file_operation(request: FileOperationRequest):
         if success:
             # Immediately remove from search index to avoid slow watcher processing
             try:
-                typesense_client = TypesenseClient()
+                typesense_client = get_typesense_client()
                 typesense_client.remove_from_index(request.file_path)
+                get_file_catalog().forget([request.file_path])
+                get_index_stats().forget([request.file_path])
                 logger.info(f"Removed deleted file from search index: {request.file_path}")
             except Exception as e:
                 logger.warning(f"Failed to remove deleted file from index {request.file_path}: {e}")
@@ -395,8 +404,8 @@ def forget_file_operation(request: FileOperationRequest):
         if request.operation != "forget":
             raise HTTPException(status_code=400, detail="Invalid operation. Must be 'forget'")
 
-        # Initialize Typesense client
-        typesense_client = TypesenseClient()
+        # Global client: its search and stats caches are the ones searches read
+        typesense_client = get_typesense_client()
         success, message = forget_file_from_index(request.file_path, typesense_client)
 
         duration_ms = int((time.time() - start_time) * 1000)
@@ -442,8 +451,10 @@ def delete_multiple_files_operation(request: MultipleFileOperationRequest):
                     results.append(file_path)
                     # Immediately remove from search index
                     try:
-                        typesense_client = TypesenseClient()
+                        typesense_client = get_typesense_client()
                         typesense_client.remove_from_index(file_path)
+                        get_file_catalog().forget([file_path])
+                        get_index_stats().forget([file_path])
                     except Exception as e:
                         logger.warning(f"Failed to remove deleted file from index {file_path}: {e}")
                 else:
@@ -482,8 +493,8 @@ def forget_multiple_files_operation(request: MultipleFileOperationRequest):
         if request.operation != "forget":
             raise HTTPException(status_code=400, detail="Invalid operation. Must be 'forget'")
 
-        # Initialize Typesense client
-        typesense_client = TypesenseClient()
+        # Global client: its search and stats caches are the ones searches read
+        typesense_client = get_typesense_client()
 
         for file_path in request.file_paths:
             try:
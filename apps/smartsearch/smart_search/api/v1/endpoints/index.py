@@ -0,0 +1,67 @@
+"""
+Index export API
+
+Streams indexed documents as JSON Lines straight from Typesense's export
+endpoint, in one linear pass with constant memory, for backups and external
+tools.
+"""
+
+import json
+from typing import AsyncIterator, Optional
+
+import typesense
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from smart_search.core.logging import logger
+from smart_search.services.async_typesense_client import get_async_typesense_client
+
+router = APIRouter(prefix="/index", tags=["index"])
+
+
+@router.get("/export")
+async def export_index(
+    include_fields: Optional[str] = Query(default=None, description="Comma-separated fields to return"),
+    exclude_fields: Optional[str] = Query(
+        default="embedding", description="Comma-separated fields to leave out (embeddings by default)"
+    ),
+    filter_by: Optional[str] = Query(
+        default=None, description="Typesense filter, e.g. 'chunk_index:=0' for one document per file"
+    ),
+):
+    """
+    Export indexed chunk documents as JSON Lines (application/x-ndjson).
+
+    Errors raised before the first document (bad filter, Typesense
+    unavailable) are returned as HTTP errors; a failure mid-stream aborts the
+    transfer, so a truncated export is never a complete-looking response.
+    """
+    documents = get_async_typesense_client().export_documents(
+        include_fields=include_fields, exclude_fields=exclude_fields or None, filter_by=filter_by
+    )
+    try:
+        first = await anext(documents, None)
+    except typesense.exceptions.RequestMalformed as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except (typesense.exceptions.ServiceUnavailable, typesense.exceptions.Timeout) as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error exporting index: {e}")
+        raise HTTPException(status_code=502, detail=str(e))
+
+    async def stream() -> AsyncIterator[str]:
+        try:
+            if first is None:
+                return
+            yield json.dumps(first) + "\n"
+            async for document in documents:
+                yield json.dumps(document) + "\n"
+        except Exception as e:
+            # Abort the transfer so the client sees an incomplete response, not a short export
+            logger.error(f"Index export interrupted: {e}")
+            raise
+        finally:
+            # Also closes the Typesense export request when the client disconnects
+            await documents.aclose()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
@@ -0,0 +1,54 @@
+"""
+Search API
+
+Proxies InstantSearch multi_search requests to Typesense through the
+TypesenseClient search cache, so the browser does not talk to Typesense
+directly and repeated or type-ahead queries are answered from memory.
+Requests use the async Typesense client: a search waiting on Typesense does
+not hold a worker thread.
+
+The frontend's TypesenseInstantSearchAdapter points at this endpoint as its
+Typesense node (path /api/v1/search); the adapter appends /multi_search.
+"""
+
+from typing import Any, Dict, List
+
+import typesense
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel
+
+from smart_search.core.logging import logger
+from smart_search.services.async_typesense_client import get_async_typesense_client
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+# Query parameters sent by the adapter that are not search parameters
+_IGNORED_PARAMS = {"x-typesense-api-key"}
+
+
+class MultiSearchRequest(BaseModel):
+    searches: List[Dict[str, Any]]
+
+
+@router.post("")
+@router.post("/multi_search")
+async def multi_search(body: MultiSearchRequest, request: Request):
+    """
+    Run InstantSearch-compatible multi_search requests against the file index.
+
+    Query string parameters apply to every search, as with Typesense's own
+    endpoint. Searches always run against the configured collection.
+
+    Searches may also set search_mode ('keyword' while the user is typing,
+    'hybrid' or 'semantic') and hybrid_alpha; see TypesenseClient.multi_search.
+    """
+    common_params = {key: value for key, value in request.query_params.items() if key not in _IGNORED_PARAMS}
+    try:
+        return await get_async_typesense_client().multi_search(body.searches, common_params)
+    except (ValueError, typesense.exceptions.RequestMalformed) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except (typesense.exceptions.ServiceUnavailable, typesense.exceptions.Timeout) as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error proxying search: {e}")
+        raise HTTPException(status_code=502, detail=str(e))
@@ -13,19 +13,39 @@ from smart_search.core.logging import logger
 router = APIRouter(prefix="/stats", tags=["statistics"])
 
 
+def _get_index_stats():
+    """
+    Index statistics maintained by the indexer.
+
+    An index built before they existed is counted once, from an export of
+    the first chunk of every file.
+    """
+    from smart_search.services.crawler.index_stats import get_index_stats
+    from smart_search.services.typesense_client import get_typesense_client
+
+    store = get_index_stats()
+    store.ensure_initialized(
+        lambda: get_typesense_client().export_documents(
+            include_fields="file_path,file_extension,file_size,modified_time,indexed_at",
+            filter_by="chunk_index:=0",
+        )
+    )
+    return store
+
+
 @router.get("/recent-files")
-def get_recent_files(limit: int = Query(default=10, ge=1, le=50)):
+async def get_recent_files(limit: int = Query(default=10, ge=1, le=50)):
     """
     Get the most recently indexed files.
 
     Returns files sorted by indexed_at timestamp descending.
     """
     try:
-        from smart_search.services.typesense_client import get_typesense_client
+        from smart_search.services.async_typesense_client import get_async_typesense_client
 
-        client = get_typesense_client()
+        client = get_async_typesense_client()
 
-        results = client.client.collections[client.collection_name].documents.search(
+        results = await client.search(
             {
                 "q": "*",
                 "group_by": "file_path",
@@ -71,118 +91,14 @@ def get_indexing_activity(time_range: Literal["24h", "7d"] = Query(default="24h"
     Returns hourly counts for 24h range, or daily counts for 7d range.
     Buckets are aligned to the top of the hour/day.
     """
-    import time
-    from collections import defaultdict
-
     try:
-        from smart_search.services.typesense_client import get_typesense_client
-
-        client = get_typesense_client()
-        now_ts = time.time()
-
-        # Calculate time boundaries aligned to hour/day
-        if time_range == "24h":
-            # Last 24 hours (24 indices)
-            # Align end time to the next full hour so the current hour is the last bucket
-            # e.g. if now is 14:30, we want buckets up to 15:00 (which covers 14:00-15:00)
-            # Actually, typically "24h" history means [now-24h, now].
-            # To have clean buckets, let's align to the *start* of the current hour.
-            # If now is 16:30, current hour bucket is 16:00-17:00.
-            # We want 24 buckets ending with the current hour.
-
-            bucket_size_sec = 3600
-            bucket_size_ms = bucket_size_sec * 1000
-
-            # Current hour start timestamp
-            current_hour_start_sec = (int(now_ts) // 3600) * 3600
-            current_hour_start_ms = current_hour_start_sec * 1000
-
-            # Start of the range (23 hours ago)
-            # We want 24 buckets: [current-23h, ..., current]
-            start_ms = current_hour_start_ms - (23 * bucket_size_ms)
-
-            # End of the range (end of current hour)
-            # We query everything >= start_ms.
-            bucket_count = 24
-
-        else:
-            # Last 7 days
-            # Align to start of current day (00:00 UTC usually, or local? Server time serves as truth)
-            # Using simple division aligns to UTC day if system time is UTC based or just consistent chunks.
-            bucket_size_sec = 24 * 3600
-            bucket_size_ms = bucket_size_sec * 1000
-
-            current_day_start_sec = (int(now_ts) // bucket_size_sec) * bucket_size_sec
-            current_day_start_ms = current_day_start_sec * 1000
-
-            start_ms = current_day_start_ms - (6 * bucket_size_ms)
-            bucket_count = 7
-
-        # Query all files indexed in the time range
-        results = client.client.collections[client.collection_name].documents.search(
-            {
-                "q": "*",
-                "group_by": "file_path",
-                "group_limit": 1,
-                "filter_by": f"indexed_at:>={start_ms}",
-                "per_page": 250,  # Single page for stats might be enough if not excessively huge activity
-                "include_fields": "indexed_at",
-            }
-        )
-
-        # If we have more hits, we might need to paginate or use aggregation
-        # if Typesense supported time-series agg easily.
-        # For now, 250 might accurately reflect "recent" bumps,
-        # but if they indexed 1000 files in last hour, we miss counts.
-        # Let's bump per_page significantly for stats query, or rely on facets?
-        # Typesense doesn't do histogram facets on numeric fields easily without pre-defined ranges.
-        # We'll use a larger fetch limit for accuracy.
-
-        all_groups = results.get("grouped_hits", [])
-        found_total = results.get("found", 0)
-
-        # Determine strict upper bound for buckets to avoid future-timestamp weirdness
-        # (though likely won't happen with valid system time)
-
-        # Bucket the results
-        buckets = defaultdict(int)
-
-        # If more than 250 results, we might have partial data.
-        # For a true stats chart, we should ideally fetch all references or use facets.
-        # But fetching ids of 100k files is slow.
-        # Let's hope activity isn't THAT massive per day for this personal app,
-        # or accept sampled stats if capped.
-        # Actually, let's just paginate a few times if needed?
-        # For simplicity/speed in this context, we'll stick to one large-ish page (500).
-
-        for group in all_groups:
-            hits = group.get("hits", [])
-            if hits:
-                indexed_at = hits[0].get("document", {}).get("indexed_at", 0)
-                if indexed_at >= start_ms:
-                    # Calculate which bucket index (0 to bucket_count-1)
-                    # bucket 0 = start_ms to start_ms + size
-                    diff = indexed_at - start_ms
-                    bucket_index = int(diff // bucket_size_ms)
-
-                    if 0 <= bucket_index < bucket_count:
-                        buckets[bucket_index] += 1
-
-        # Build response filling gaps
-        activity = []
-        for i in range(bucket_count):
-            bucket_start_ts = start_ms + (i * bucket_size_ms)
-            activity.append(
-                {
-                    "timestamp": bucket_start_ts,
-                    "count": buckets[i],
-                }
-            )
+        store = _get_index_stats()
+        activity, total = store.indexing_activity(hourly=time_range == "24h")
 
         return {
             "range": time_range,
             "activity": activity,
-            "total": found_total,
+            "total": total,
         }
 
     except Exception as e:
@@ -195,7 +111,7 @@ def get_indexing_activity(time_range: Literal["24h", "7d"] = Query(default="24h"
 
 
 @router.get("/files-by-type")
-def get_files_by_type(
+async def get_files_by_type(
     ext: str = Query(..., description="File extension including dot, e.g. '.pdf'"),
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
@@ -206,15 +122,15 @@ def get_files_by_type(
     Used for drill-down from file type distribution chart.
     """
     try:
-        from smart_search.services.typesense_client import get_typesense_client
+        from smart_search.services.async_typesense_client import get_async_typesense_client
 
-        client = get_typesense_client()
+        client = get_async_typesense_client()
 
         # Normalize extension (ensure it starts with dot)
         if not ext.startswith("."):
             ext = f".{ext}"
 
-        results = client.client.collections[client.collection_name].documents.search(
+        results = await client.search(
             {
                 "q": "*",
                 "group_by": "file_path",
@@ -261,7 +177,7 @@ def get_files_by_type(
 
 
 @router.get("/files-by-age")
-def get_files_by_age(
+async def get_files_by_age(
     age_range: Literal["30d", "90d", "1y", "older"] = Query(...),
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
@@ -274,9 +190,9 @@ def get_files_by_age(
     import time
 
     try:
-        from smart_search.services.typesense_client import get_typesense_client
+        from smart_search.services.async_typesense_client import get_async_typesense_client
 
-        client = get_typesense_client()
+        client = get_async_typesense_client()
         now_ms = int(time.time() * 1000)
 
         # Calculate age range in milliseconds
@@ -297,7 +213,7 @@ def get_files_by_age(
 
         filter_by = f"modified_time:>={start_ms} && modified_time:<{end_ms}"
 
-        results = client.client.collections[client.collection_name].documents.search(
+        results = await client.search(
             {
                 "q": "*",
                 "group_by": "file_path",
@@ -346,42 +262,8 @@ def get_file_age_distribution():
 
     Returns counts for age buckets: 0-30 days, 30-90 days, 90d-1y, older than 1y.
     """
-    import time
-
     try:
-        from smart_search.services.typesense_client import get_typesense_client
-
-        client = get_typesense_client()
-        now_ms = int(time.time() * 1000)
-        day_ms = 24 * 60 * 60 * 1000
-
-        buckets = {
-            "30d": 0,
-            "90d": 0,
-            "1y": 0,
-            "older": 0,
-        }
-
-        thresholds = [
-            ("30d", now_ms - (30 * day_ms), now_ms),
-            ("90d", now_ms - (90 * day_ms), now_ms - (30 * day_ms)),
-            ("1y", now_ms - (365 * day_ms), now_ms - (90 * day_ms)),
-            ("older", 0, now_ms - (365 * day_ms)),
-        ]
-
-        for bucket_name, start_ms, end_ms in thresholds:
-            results = client.client.collections[client.collection_name].documents.search(
-                {
-                    "q": "*",
-                    "group_by": "file_path",
-                    "group_limit": 1,
-                    "filter_by": f"modified_time:>={start_ms} && modified_time:<{end_ms}",
-                    "per_page": 0,
-                }
-            )
-            buckets[bucket_name] = results.get("found", 0)
-
-        return {"distribution": buckets}
+        return {"distribution": _get_index_stats().age_distribution()}
 
     except Exception as e:
         logger.error(f"Error getting file age distribution: {e}")
@@ -396,50 +278,7 @@ def get_storage_by_type():
     Returns bytes per file extension for the doughnut chart "by size" view.
     """
     try:
-        from smart_search.services.typesense_client import get_typesense_client
-
-        client = get_typesense_client()
-
-        # Get all files with size info (paginated)
-        all_files = []
-        page = 1
-        while True:
-            results = client.client.collections[client.collection_name].documents.search(
-                {
-                    "q": "*",
-                    "group_by": "file_path",
-                    "group_limit": 1,
-                    "per_page": 250,
-                    "page": page,
-                    "include_fields": "file_extension,file_size",
-                }
-            )
-
-            groups = results.get("grouped_hits", [])
-            if not groups:
-                break
-
-            for group in groups:
-                hits = group.get("hits", [])
-                if hits:
-                    all_files.append(hits[0])
-            if len(groups) < 250:
-                break
-            page += 1
-
-            # Safety limit
-            if page > 100:
-                break
-
-        # Aggregate by extension
-        storage = {}
-        for hit in all_files:
-            doc = hit.get("document", {})
-            ext = doc.get("file_extension", "unknown")
-            size = doc.get("file_size", 0) or 0
-            storage[ext] = storage.get(ext, 0) + size
-
-        return {"storage": storage}
+        return {"storage": _get_index_stats().storage_by_extension()}
 
     except Exception as e:
         error_str = str(e)
@@ -17,6 +17,7 @@ from smart_search.api.models.crawler import (
 from smart_search.core.logging import logger
 from smart_search.database.models import get_db
 from smart_search.database.repositories import WatchPathRepository
+from smart_search.services.events import TOPIC_WATCH_PATHS, get_event_bus
 
 router = APIRouter(prefix="/config/watch-paths", tags=["configuration"])
 
@@ -96,6 +97,7 @@ def create_watch_path(
             watch_path = watch_path_repo.update(watch_path.id, {"enabled": request.enabled})
 
         logger.info(f"Added watch path: {request.path}")
+        get_event_bus().publish(TOPIC_WATCH_PATHS)
 
         # Track watch path addition
         telemetry.capture_event(
@@ -132,6 +134,7 @@ def clear_watch_paths(
     count = watch_path_repo.delete_all()
 
     logger.info(f"Cleared all watch paths via API: {count} removed")
+    get_event_bus().publish(TOPIC_WATCH_PATHS)
 
     # Track watch paths clear
     if count > 0:
@@ -166,6 +169,7 @@ def update_watch_path_by_id(
     updated_path = watch_path_repo.update(watch_path, update_data)
 
     logger.info(f"Updated watch path with ID {path_id} via API: {update_data}")
+    get_event_bus().publish(TOPIC_WATCH_PATHS)
 
     return WatchPathResponse(
         id=updated_path.id,
@@ -195,6 +199,7 @@ def delete_watch_path_by_id(
         raise HTTPException(status_code=404, detail="Watch path not found")
 
     logger.info(f"Deleted watch path with ID {path_id} via API")
+    get_event_bus().publish(TOPIC_WATCH_PATHS)
 
     # Track watch path removal
     telemetry.capture_event("watch_path_removed")
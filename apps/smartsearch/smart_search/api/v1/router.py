@@ -4,7 +4,20 @@ Main router for API v1
 
 from fastapi import APIRouter
 
-from .endpoints import config, crawler, files, fs, settings, stats_extended, system, system_stream, watch_paths, wizard
+from .endpoints import (
+    config,
+    crawler,
+    files,
+    fs,
+    index,
+    search,
+    settings,
+    stats_extended,
+    system,
+    system_stream,
+    watch_paths,
+    wizard,
+)
 
 api_router = APIRouter(prefix="/api/v1")
 
@@ -13,6 +26,8 @@ api_router.include_router(crawler.router)
 api_router.include_router(settings.router)
 api_router.include_router(watch_paths.router)
 api_router.include_router(files.router)
+api_router.include_router(search.router)
+api_router.include_router(index.router)
 api_router.include_router(fs.router)
 api_router.include_router(system.router)
 api_router.include_router(system_stream.router)
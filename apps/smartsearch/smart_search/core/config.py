@@ -3,6 +3,7 @@ Application configuration using pydantic-settings
 """
 
 import secrets
+from typing import Dict
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -45,10 +46,53 @@ class Settings(BaseSettings):
     typesense_collection_name: str = Field(default="files")
     typesense_connection_timeout: int = Field(default=10, description="Connection timeout in seconds")
     typesense_model_download_timeout: int = Field(default=120, description="Timeout for model downloads in seconds")
+    typesense_import_timeout: int = Field(
+        default=300, description="Timeout for bulk imports in seconds (documents are embedded server-side)"
+    )
+    typesense_import_batch_size: int = Field(default=100, description="Maximum documents per bulk import request")
+    typesense_import_max_bytes: int = Field(
+        default=8 * 1024 * 1024, description="Maximum JSONL payload size per bulk import request in bytes"
+    )
+    typesense_delete_batch_size: int = Field(default=100, description="Maximum files per delete-by-filter request")
+    typesense_delete_max_filter_length: int = Field(
+        default=4000, description="Maximum URL-encoded length of a delete-by-filter expression"
+    )
+    typesense_max_connections: int = Field(
+        default=100, description="Connections to Typesense pooled by the async client (concurrent requests)"
+    )
+    typesense_max_keepalive_connections: int = Field(
+        default=20, description="Idle connections the async client keeps open to Typesense"
+    )
+    typesense_http2: bool = Field(
+        default=False,
+        description="Opt in to HTTP/2 for the async client; needs Typesense over https and the h2 package "
+        "(pip install 'httpx[http2]'), otherwise HTTP/1.1 keep-alive is used",
+    )
+    search_cache_max_entries: int = Field(default=256, description="Search responses kept in memory (0 disables)")
+    search_cache_ttl_seconds: float = Field(default=60.0, description="Seconds a cached search response is served")
+    stats_cache_ttl_seconds: float = Field(
+        default=5.0, description="Seconds collection stats and file type counts are served from memory"
+    )
+    search_mode: str = Field(
+        default="hybrid",
+        description="Default search mode: 'keyword', 'hybrid' (keyword and vector) or 'semantic' (vector only)",
+    )
+    search_hybrid_alpha: float = Field(default=0.3, description="Weight of vector results in hybrid searches (0-1)")
+    query_embedding_cache_size: int = Field(default=2000, description="Query embeddings kept in memory")
+    query_embedding_max_stored: int = Field(
+        default=50000, description="Query embeddings kept in Typesense, shared across sessions and restarts"
+    )
 
     # Crawler
     watch_paths: str = Field(default="")  # Comma-separated paths
     max_file_size_mb: int = Field(default=100)
+    discovery_workers: int = Field(default=8, description="Parallel directory listing workers during discovery")
+    incremental_discovery: bool = Field(
+        default=True, description="Skip listing directories whose mtime is unchanged since the last crawl"
+    )
+    full_discovery_interval_hours: int = Field(
+        default=24, description="Force a full directory walk when the last one is older than this"
+    )
 
     # Frontend Development
     frontend_dev_url: str = Field(default="http://localhost:5173", description="URL for Vite dev server")
@@ -62,16 +106,56 @@ class Settings(BaseSettings):
     verification_batch_size: int = Field(
         default=100, description="Number of files to process in each verification batch"
     )
+    verification_workers: int = Field(default=8, description="Parallel stat workers during index verification")
     max_verification_files: int = Field(default=10000, description="Maximum number of files to verify in a single run")
     cleanup_orphaned_files: bool = Field(default=True, description="Automatically clean up orphaned index entries")
 
     # Processing
     batch_size: int = Field(default=10)
     worker_queue_size: int = Field(default=1000)
+    indexing_workers: int = Field(default=4, description="Number of extraction workers in the indexing pipeline")
+    pipeline_prepare_workers: int = Field(default=2, description="Stat/hash workers in the indexing pipeline")
+    pipeline_chunk_workers: int = Field(default=1, description="Chunking workers in the indexing pipeline")
+    pipeline_upsert_workers: int = Field(default=2, description="Bulk upsert workers in the indexing pipeline")
+    pipeline_queue_size: int = Field(default=32, description="Capacity of each queue between pipeline stages")
+    persistent_queue: bool = Field(
+        default=True, description="Keep pending crawl operations on disk so they survive a restart"
+    )
+    persistent_queue_batch_size: int = Field(default=500, description="Queue changes written to disk per transaction")
+    persistent_queue_flush_interval_ms: int = Field(
+        default=200, description="Maximum delay before queued changes are written to disk"
+    )
+
+    # File hashing
+    file_hash_algorithm: str = Field(
+        default="auto",
+        description="Content hash algorithm: 'auto' (fastest available), xxh3_128, blake3, blake2b, sha256 or md5",
+    )
+    file_hash_buffer_size: int = Field(default=1024 * 1024, description="Read buffer size for hashing in bytes")
+    file_hash_mmap_threshold: int = Field(
+        default=64 * 1024 * 1024, description="Memory-map files at least this large when hashing (0 disables)"
+    )
+    file_hash_quick_threshold_mb: int = Field(
+        default=0,
+        description="Hash only samples of files at least this large in MB (0 disables; misses edits between samples)",
+    )
 
     # Chunking
     chunk_size: int = Field(default=1000, description="Characters per chunk for indexing")
     chunk_overlap: int = Field(default=200, description="Overlapping characters between chunks")
+    chunk_strategy: str = Field(
+        default="fixed",
+        description=(
+            "How content is split: 'fixed' (character windows), or 'sentence', 'paragraph' or 'heading' "
+            "(boundary-aware chunks sized to chunk_max_tokens)"
+        ),
+    )
+    chunk_max_tokens: int = Field(
+        default=128, description="Token budget of boundary-aware chunks (input limit of the embedding model)"
+    )
+    chunk_overlap_tokens: int = Field(
+        default=0, description="Tokens of trailing sentences repeated at the start of the next boundary-aware chunk"
+    )
 
     # Tika Server (Docker-based)
     tika_host: str = Field(default="localhost")
@@ -79,6 +163,27 @@ class Settings(BaseSettings):
     tika_protocol: str = Field(default="http")
     tika_enabled: bool = Field(default=True)
     tika_client_only: bool = Field(default=True)
+    tika_max_concurrency: int = Field(default=8, description="Maximum simultaneous extractions sent to Tika")
+    tika_timeout: float = Field(default=120.0, description="Seconds allowed for Tika to extract one file")
+    tika_connection_timeout: float = Field(default=5.0, description="Seconds allowed to connect to Tika")
+
+    # Extraction routing
+    extraction_routes: Dict[str, str] = Field(
+        default_factory=dict,
+        description=(
+            "Overrides of the extraction routing table: extension ('.log') or MIME type ('video/*') "
+            "mapped to 'text', 'tika', 'archive' or 'skip'"
+        ),
+    )
+    extraction_archive_max_mb: int = Field(
+        default=50, description="Archives larger than this are indexed by name and metadata only"
+    )
+
+    # Extraction cache
+    extraction_cache_enabled: bool = Field(
+        default=True, description="Reuse extracted content of files with an already seen content hash"
+    )
+    extraction_cache_max_mb: int = Field(default=1024, description="Size cap of the extraction cache in MB")
 
     # PostHog Analytics
     posthog_project_api_key: str = Field(default="phc_cZAOKLFo8KyPxIs4VzoiQfg2a88Oyw7AeOfiHVR79t2")
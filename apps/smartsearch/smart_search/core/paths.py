@@ -36,6 +36,16 @@ class AppPaths:
         """Path to SQLite database file"""
         return self.data_dir / "smart_search.db"
 
+    @property
+    def crawl_queue_file(self) -> Path:
+        """Path to the SQLite file holding pending crawl operations"""
+        return self.data_dir / "crawl_queue.db"
+
+    @property
+    def extraction_cache_dir(self) -> Path:
+        """Directory for cached extraction results"""
+        return self.data_dir / "extraction-cache"
+
     @property
     def typesense_data_dir(self) -> Path:
         """Directory for Typesense data (index)"""
@@ -6,6 +6,12 @@ import hashlib
 import json
 from typing import Any, Dict
 
+# Fields the embedding is computed from; updates leaving them out keep the stored embedding
+EMBEDDING_SOURCE_FIELDS = ["title", "description", "subject", "keywords", "author", "content"]
+
+# Built-in Typesense model used for document and query embeddings
+EMBEDDING_MODEL = "ts/paraphrase-multilingual-mpnet-base-v2"
+
 
 def get_collection_schema(collection_name: str) -> Dict[str, Any]:
     """
@@ -71,15 +77,8 @@ def get_collection_schema(collection_name: str) -> Dict[str, Any]:
                 "name": "embedding",
                 "type": "float[]",
                 "embed": {
-                    "from": [
-                        "title",
-                        "description",
-                        "subject",
-                        "keywords",
-                        "author",
-                        "content",
-                    ],
-                    "model_config": {"model_name": "ts/paraphrase-multilingual-mpnet-base-v2"},
+                    "from": list(EMBEDDING_SOURCE_FIELDS),
+                    "model_config": {"model_name": EMBEDDING_MODEL},
                 },
             },
         ],
@@ -87,6 +86,34 @@ def get_collection_schema(collection_name: str) -> Dict[str, Any]:
     }
 
 
+def get_query_embedding_schema(collection_name: str) -> Dict[str, Any]:
+    """
+    Get Typesense collection schema for cached search query embeddings.
+
+    Each document holds a normalized query and its embedding, computed by
+    Typesense with the same model as the file chunks.
+
+    Args:
+        collection_name: Name of the collection
+
+    Returns:
+        Collection schema dictionary
+    """
+    return {
+        "name": collection_name,
+        "fields": [
+            {"name": "query", "type": "string"},
+            {"name": "created_at", "type": "int64"},
+            {
+                "name": "embedding",
+                "type": "float[]",
+                "embed": {"from": ["query"], "model_config": {"model_name": EMBEDDING_MODEL}},
+            },
+        ],
+        "default_sorting_field": "created_at",
+    }
+
+
 def get_schema_version() -> str:
     """
     Get a hash of the current schema definition.
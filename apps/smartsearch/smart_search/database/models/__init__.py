@@ -4,6 +4,9 @@ Database models package
 
 from .base import Base, SessionLocal, db_session, engine, get_db, init_db, init_default_data
 from .crawler_state import CrawlerState
+from .directory_snapshot import DirectorySnapshot
+from .file_state import FileState
+from .index_stats import IndexedFile, StatsAggregate
 from .setting import Setting
 from .watch_path import WatchPath
 from .wizard_state import WizardState
@@ -19,5 +22,9 @@ __all__ = [
     "WatchPath",
     "Setting",
     "CrawlerState",
+    "DirectorySnapshot",
+    "FileState",
+    "IndexedFile",
+    "StatsAggregate",
     "WizardState",
 ]
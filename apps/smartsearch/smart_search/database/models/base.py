@@ -69,11 +69,14 @@ def init_default_data(db):
         state = CrawlerState(id=1)
         db.add(state)
 
+    from smart_search.core.config import settings
+
     # Initialize default settings if not exist
     default_settings = {
         "max_file_size_mb": "100",
         "batch_size": "10",
         "worker_queue_size": "1000",
+        "indexing_workers": str(settings.indexing_workers),
         # Initial scan settings removed - now uses auto-resume based on previous state
     }
 
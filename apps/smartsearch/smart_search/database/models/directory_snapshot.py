@@ -0,0 +1,19 @@
+"""
+Directory snapshot model
+"""
+
+from sqlalchemy import Column, Integer, String, Text
+
+from .base import Base
+
+
+class DirectorySnapshot(Base):
+    """Directory state recorded by the last completed crawl (incremental discovery)"""
+
+    __tablename__ = "directory_snapshots"
+
+    id = Column(Integer, primary_key=True, index=True)
+    path = Column(String, unique=True, nullable=False, index=True)
+    mtime_ns = Column(Integer, nullable=False)
+    entry_count = Column(Integer, nullable=False)  # Files listed in the directory
+    subdirectories = Column(Text, nullable=False, default="[]")  # JSON list of child directory names
@@ -0,0 +1,23 @@
+"""
+File state model
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from .base import Base
+
+
+class FileState(Base):
+    """Stat signature and content hash of an indexed file (local file-state catalog)"""
+
+    __tablename__ = "file_states"
+
+    id = Column(Integer, primary_key=True, index=True)
+    path = Column(String, unique=True, nullable=False, index=True)
+    size = Column(Integer, nullable=False)
+    mtime_ns = Column(Integer, nullable=False)
+    inode = Column(Integer, nullable=False)
+    file_hash = Column(String, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
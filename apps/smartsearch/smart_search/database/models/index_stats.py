@@ -0,0 +1,33 @@
+"""
+Index statistics models
+"""
+
+from sqlalchemy import Column, Integer, String, UniqueConstraint
+
+from .base import Base
+
+
+class IndexedFile(Base):
+    """Per-file facts behind the index statistics, used to undo a file's contribution on edit or delete"""
+
+    __tablename__ = "indexed_files"
+
+    id = Column(Integer, primary_key=True, index=True)
+    path = Column(String, unique=True, nullable=False, index=True)
+    extension = Column(String, nullable=False)
+    size = Column(Integer, nullable=False)
+    modified_time = Column(Integer, nullable=False)  # ms
+    indexed_at = Column(Integer, nullable=False)  # ms
+
+
+class StatsAggregate(Base):
+    """Materialized file count and bytes of one statistics bucket (e.g. an extension or an hour)"""
+
+    __tablename__ = "stats_aggregates"
+    __table_args__ = (UniqueConstraint("kind", "bucket"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String, nullable=False)
+    bucket = Column(String, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    bytes = Column(Integer, nullable=False, default=0)
@@ -4,6 +4,9 @@ Repositories for database models
 
 from .base import BaseRepository
 from .crawler_state import CrawlerStateRepository
+from .directory_snapshot import DirectorySnapshotRepository
+from .file_state import FileStateRepository
+from .index_stats import IndexStatsRepository
 from .settings import SettingsRepository
 from .watch_path import WatchPathRepository
 from .wizard_state_repository import WizardStateRepository
@@ -13,5 +16,8 @@ __all__ = [
     "WatchPathRepository",
     "SettingsRepository",
     "CrawlerStateRepository",
+    "DirectorySnapshotRepository",
+    "FileStateRepository",
+    "IndexStatsRepository",
     "WizardStateRepository",
 ]
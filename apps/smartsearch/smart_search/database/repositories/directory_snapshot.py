@@ -0,0 +1,48 @@
+"""
+DirectorySnapshot repository
+"""
+
+from typing import Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from smart_search.database.models.directory_snapshot import DirectorySnapshot
+from smart_search.database.repositories.base import BaseRepository
+
+# Rows per bulk insert
+INSERT_BATCH_SIZE = 1000
+
+
+class DirectorySnapshotRepository(BaseRepository[DirectorySnapshot]):
+    """
+    Repository for DirectorySnapshot model
+    """
+
+    def __init__(self, db: Session):
+        super().__init__(DirectorySnapshot, db)
+
+    def load_all(self) -> List[DirectorySnapshot]:
+        """Get every directory snapshot"""
+        return self.db.query(DirectorySnapshot).all()
+
+    def replace_all(self, rows: List[Dict]) -> None:
+        """Replace all snapshots (dicts with path, mtime_ns, entry_count, subdirectories)"""
+        self.db.query(DirectorySnapshot).delete(synchronize_session=False)
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            self.db.execute(insert(DirectorySnapshot), rows[start : start + INSERT_BATCH_SIZE])
+        self.db.commit()
+
+    def delete_paths(self, paths: List[str]) -> int:
+        """Delete snapshots of the given directories"""
+        deleted = (
+            self.db.query(DirectorySnapshot).filter(DirectorySnapshot.path.in_(paths)).delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return deleted
+
+    def clear(self) -> int:
+        """Delete all snapshots"""
+        deleted = self.db.query(DirectorySnapshot).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
@@ -0,0 +1,77 @@
+"""
+FileState repository
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from smart_search.database.models.file_state import FileState
+from smart_search.database.repositories.base import BaseRepository
+
+# Stay well below SQLite's bound-parameter limit for IN (...) queries
+PATH_BATCH_SIZE = 500
+# Rows per multi-row upsert (six parameters per row)
+UPSERT_BATCH_SIZE = 100
+
+
+class FileStateRepository(BaseRepository[FileState]):
+    """
+    Repository for FileState model
+    """
+
+    def __init__(self, db: Session):
+        super().__init__(FileState, db)
+
+    def get_by_path(self, path: str) -> FileState | None:
+        """Get file state by path"""
+        return self.db.query(FileState).filter(FileState.path == path).first()
+
+    def get_by_paths(self, paths: Iterable[str]) -> Dict[str, FileState]:
+        """Get file states for many paths, keyed by path"""
+        paths = list(paths)
+        states: Dict[str, FileState] = {}
+        for start in range(0, len(paths), PATH_BATCH_SIZE):
+            batch = paths[start : start + PATH_BATCH_SIZE]
+            for state in self.db.query(FileState).filter(FileState.path.in_(batch)):
+                states[state.path] = state
+        return states
+
+    def upsert_many(self, entries: List[Dict]) -> None:
+        """Insert or update file states (dicts with path, size, mtime_ns, inode, file_hash)"""
+        if not entries:
+            return
+        now = datetime.utcnow()
+        rows = [{**entry, "updated_at": now} for entry in entries]
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = insert(FileState).values(rows[start : start + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[FileState.path],
+                set_={
+                    "size": stmt.excluded.size,
+                    "mtime_ns": stmt.excluded.mtime_ns,
+                    "inode": stmt.excluded.inode,
+                    "file_hash": stmt.excluded.file_hash,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            self.db.execute(stmt)
+        self.db.commit()
+
+    def delete_paths(self, paths: Iterable[str]) -> int:
+        """Delete file states for the given paths"""
+        paths = list(paths)
+        deleted = 0
+        for start in range(0, len(paths), PATH_BATCH_SIZE):
+            batch = paths[start : start + PATH_BATCH_SIZE]
+            deleted += self.db.query(FileState).filter(FileState.path.in_(batch)).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
+
+    def clear(self) -> int:
+        """Delete all file states"""
+        deleted = self.db.query(FileState).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
@@ -0,0 +1,97 @@
+"""
+Index statistics repository
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from smart_search.database.models.index_stats import IndexedFile, StatsAggregate
+from smart_search.database.repositories.base import BaseRepository
+
+# Stay well below SQLite's bound-parameter limit for IN (...) queries
+PATH_BATCH_SIZE = 500
+# Rows per multi-row upsert
+UPSERT_BATCH_SIZE = 100
+
+
+class IndexStatsRepository(BaseRepository[IndexedFile]):
+    """
+    Repository for IndexedFile facts and StatsAggregate counters
+
+    Writes are not committed; the caller commits facts and counters together.
+    """
+
+    def __init__(self, db: Session):
+        super().__init__(IndexedFile, db)
+
+    def get_by_paths(self, paths: Iterable[str]) -> Dict[str, IndexedFile]:
+        """Get file facts for many paths, keyed by path"""
+        paths = list(paths)
+        files: Dict[str, IndexedFile] = {}
+        for start in range(0, len(paths), PATH_BATCH_SIZE):
+            batch = paths[start : start + PATH_BATCH_SIZE]
+            for indexed_file in self.db.query(IndexedFile).filter(IndexedFile.path.in_(batch)):
+                files[indexed_file.path] = indexed_file
+        return files
+
+    def upsert_files(self, rows: List[Dict]) -> None:
+        """Insert or update file facts (dicts with path, extension, size, modified_time, indexed_at)"""
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = insert(IndexedFile).values(rows[start : start + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[IndexedFile.path],
+                set_={
+                    "extension": stmt.excluded.extension,
+                    "size": stmt.excluded.size,
+                    "modified_time": stmt.excluded.modified_time,
+                    "indexed_at": stmt.excluded.indexed_at,
+                },
+            )
+            self.db.execute(stmt)
+
+    def delete_paths(self, paths: Iterable[str]) -> None:
+        """Delete file facts for the given paths"""
+        paths = list(paths)
+        for start in range(0, len(paths), PATH_BATCH_SIZE):
+            batch = paths[start : start + PATH_BATCH_SIZE]
+            self.db.query(IndexedFile).filter(IndexedFile.path.in_(batch)).delete(synchronize_session=False)
+
+    def add_to_aggregates(self, deltas: Dict[Tuple[str, str], Tuple[int, int]]) -> None:
+        """Add (count, bytes) deltas to the (kind, bucket) counters, creating missing ones"""
+        rows = [
+            {"kind": kind, "bucket": bucket, "count": count, "bytes": size}
+            for (kind, bucket), (count, size) in deltas.items()
+            if count or size
+        ]
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = insert(StatsAggregate).values(rows[start : start + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[StatsAggregate.kind, StatsAggregate.bucket],
+                set_={
+                    "count": StatsAggregate.count + stmt.excluded.count,
+                    "bytes": StatsAggregate.bytes + stmt.excluded.bytes,
+                },
+            )
+            self.db.execute(stmt)
+
+    def get_aggregates(self, kind: str, include_empty: bool = False) -> Dict[str, Tuple[int, int]]:
+        """(count, bytes) of the buckets of a kind (without those counting no file, unless include_empty)"""
+        query = self.db.query(StatsAggregate).filter(StatsAggregate.kind == kind)
+        if not include_empty:
+            query = query.filter(StatsAggregate.count != 0)
+        return {row.bucket: (row.count, row.bytes) for row in query}
+
+    def delete_aggregates(self, kind: str, buckets: Iterable[str]) -> None:
+        """Delete counters of a kind"""
+        buckets = list(buckets)
+        if buckets:
+            self.db.query(StatsAggregate).filter(
+                StatsAggregate.kind == kind, StatsAggregate.bucket.in_(buckets)
+            ).delete(synchronize_session=False)
+
+    def clear(self) -> None:
+        """Delete all file facts and counters"""
+        self.db.query(IndexedFile).delete(synchronize_session=False)
+        self.db.query(StatsAggregate).delete(synchronize_session=False)
@@ -21,6 +21,7 @@ from smart_search.core.initialization import (
 )
 from smart_search.core.logging import logger
 from smart_search.core.telemetry import telemetry
+from smart_search.services.async_typesense_client import close_async_typesense_client
 from smart_search.services.crawler.manager import get_crawl_job_manager
 
 # Global variable to track Vite process
@@ -112,9 +113,8 @@ def perform_shutdown(vite_process=None):
             logger.info("✅ Vite dev server stopped")
 
         crawl_manager = get_crawl_job_manager()
-        if crawl_manager.is_running():
-            crawl_manager.stop_crawl()
-            logger.info("✅ Crawl manager stopped")
+        crawl_manager.shutdown()
+        logger.info("✅ Crawl manager stopped")
 
         # Shutdown telemetry (flushes batched events and captures shutdown event)
         logger.debug("📊 Shutting down telemetry...")
@@ -144,6 +144,7 @@ app = create_app()
 # Register startup and shutdown event handlers
 app.add_event_handler("startup", startup_handler)
 app.add_event_handler("shutdown", shutdown_handler)
+app.add_event_handler("shutdown", close_async_typesense_client)
 
 # Include API v1 router
 app.include_router(api_router)
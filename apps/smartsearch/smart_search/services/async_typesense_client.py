@@ -0,0 +1,333 @@
+"""
+Asyncio Typesense client
+
+Async endpoints use this client instead of the synchronous TypesenseClient
+(whose SDK makes blocking requests), so a request waiting on Typesense does
+not hold a threadpool slot. Requests go through one pooled httpx.AsyncClient
+with keep-alive connections. HTTP/2 is opt-in (typesense_http2) and only
+used when Typesense is served over TLS and the h2 package is installed.
+
+The search and stats caches are those of the global TypesenseClient, so both
+clients share cached results, and writes from either one invalidate them.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional
+
+import httpx
+import typesense
+
+from smart_search.core.config import settings
+from smart_search.core.logging import logger
+from smart_search.services.result_cache import ResultCache
+from smart_search.services.typesense_client import (
+    SEARCH_MODE_PARAMS,
+    STATS_COLLECTION,
+    STATS_COLLECTION_QUERY,
+    STATS_FILE_TYPES,
+    STATS_FILE_TYPES_QUERY,
+    TypesenseClient,
+    collection_stats,
+    file_type_distribution,
+    get_typesense_client,
+    log_stats_error,
+)
+
+# Typesense error responses, by status code, as raised by the SDK
+_ERRORS = {
+    400: typesense.exceptions.RequestMalformed,
+    401: typesense.exceptions.RequestUnauthorized,
+    403: typesense.exceptions.RequestForbidden,
+    404: typesense.exceptions.ObjectNotFound,
+    409: typesense.exceptions.ObjectAlreadyExists,
+    422: typesense.exceptions.ObjectUnprocessable,
+    500: typesense.exceptions.ServerError,
+    503: typesense.exceptions.ServiceUnavailable,
+}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class AsyncTypesenseClient:
+    """
+    Async counterpart of TypesenseClient for search, import, export, delete and stats.
+
+    Errors are raised as the typesense SDK's exceptions (RequestMalformed,
+    ServiceUnavailable, Timeout...), like the synchronous client.
+    """
+
+    def __init__(
+        self, sync_client: Optional[TypesenseClient] = None, transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            sync_client: Client whose caches and search helpers are shared (the global one by default)
+            transport: httpx transport (for tests)
+        """
+        self.sync_client = sync_client or get_typesense_client()
+        self.collection_name = self.sync_client.collection_name
+        http2 = settings.typesense_http2 and settings.typesense_protocol == "https"
+        if http2 and not _http2_available():
+            logger.warning("typesense_http2 is set but the h2 package is not installed; using HTTP/1.1")
+            http2 = False
+        self._http = httpx.AsyncClient(
+            base_url=settings.typesense_url,
+            headers={"X-TYPESENSE-API-KEY": settings.typesense_api_key},
+            timeout=httpx.Timeout(settings.typesense_connection_timeout),
+            limits=httpx.Limits(
+                max_connections=settings.typesense_max_connections,
+                max_keepalive_connections=settings.typesense_max_keepalive_connections,
+            ),
+            http2=http2,
+            transport=transport,
+        )
+        # Loads in progress, shared by concurrent requests for the same cache key
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def multi_search(
+        self, searches: List[Dict[str, Any]], common_params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run searches against the collection in one request, through the search cache.
+
+        Same parameters, caching and search modes as TypesenseClient.multi_search().
+        A query vector that is not in memory yet is computed on a worker thread.
+
+        Raises:
+            ValueError: For an unknown search_mode or an invalid hybrid_alpha
+        """
+        sync_client = self.sync_client
+        searches = [{**search, "collection": self.collection_name} for search in searches]
+        common_params = dict(common_params or {})
+        key = json.dumps([searches, common_params], sort_keys=True, default=str)
+
+        async def load() -> Dict[str, Any]:
+            vectors = {}
+            for search in searches:
+                query = sync_client._vector_query_text(search, common_params)
+                if query is not None and query not in vectors:
+                    vectors[query] = sync_client.query_embeddings.get_cached_vector(query)
+                    if vectors[query] is None:
+                        vectors[query] = await asyncio.to_thread(sync_client.query_embeddings.get_vector, query)
+            prepared = [sync_client._apply_search_mode(search, common_params, vectors.get) for search in searches]
+            params = {name: value for name, value in common_params.items() if name not in SEARCH_MODE_PARAMS}
+            try:
+                return await self._request("POST", "/multi_search", params=params, json={"searches": prepared})
+            except Exception as e:
+                logger.error(f"Search error: {e}")
+                raise
+
+        # Failed searches are reported inside the response; only complete responses are cached
+        return await self._cached(
+            sync_client.search_cache,
+            key,
+            load,
+            lambda response: not any("error" in result for result in response.get("results", [])),
+        )
+
+    async def search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one search against the collection (not cached)."""
+        return await self._request("GET", f"/collections/{self.collection_name}/documents/search", params=params)
+
+    async def get_collection_stats(self) -> Dict[str, Any]:
+        """File count and collection schema, cached like TypesenseClient.get_collection_stats()."""
+
+        async def load() -> Dict[str, Any]:
+            results = await self.search(dict(STATS_COLLECTION_QUERY))
+            collection = await self._request("GET", f"/collections/{self.collection_name}")
+            self.sync_client.collection_ready = True
+            return collection_stats(results, collection)
+
+        try:
+            return await self._cached(self.sync_client.stats_cache, STATS_COLLECTION, load)
+        except Exception as e:
+            log_stats_error("get_collection_stats", "stats", e)
+            raise
+
+    async def get_file_type_distribution(self) -> Dict[str, int]:
+        """Indexed files per extension (empty on errors), cached like get_collection_stats()."""
+
+        async def load() -> Dict[str, int]:
+            return file_type_distribution(await self.search(dict(STATS_FILE_TYPES_QUERY)))
+
+        try:
+            return await self._cached(self.sync_client.stats_cache, STATS_FILE_TYPES, load)
+        except Exception as e:
+            log_stats_error("get_file_type_distribution", "file type distribution", e)
+            return {}
+
+    async def index_chunks(self, documents: List[Dict[str, Any]], action: str = "upsert") -> Dict[str, Any]:
+        """
+        Import chunk documents in batches, like TypesenseClient.index_chunks().
+
+        Returns:
+            Dict with 'successful' and 'failed' counts, and 'errors' ({'id', 'file_path', 'error'})
+        """
+        successful = 0
+        errors: List[Dict[str, Any]] = []
+        timeout = httpx.Timeout(settings.typesense_import_timeout, connect=settings.typesense_connection_timeout)
+
+        for batch in TypesenseClient._split_import_batches(
+            documents, settings.typesense_import_batch_size, settings.typesense_import_max_bytes
+        ):
+            batch_docs = [doc for doc, _ in batch]
+            try:
+                response = await self._send(
+                    "POST",
+                    f"/collections/{self.collection_name}/documents/import",
+                    params={"action": action},
+                    content="\n".join(line for _, line in batch),
+                    timeout=timeout,
+                )
+                results = [json.loads(line) for line in response.text.splitlines() if line.strip()]
+            except Exception as e:
+                logger.error(f"Error importing batch of {len(batch_docs)} chunk(s): {e}")
+                errors.extend(
+                    {"id": doc.get("id"), "file_path": doc.get("file_path"), "error": str(e)} for doc in batch_docs
+                )
+                continue
+            successful += TypesenseClient._collect_import_results(batch_docs, results, errors)
+
+        if successful:
+            self.sync_client._index_written()
+        return {"successful": successful, "failed": len(errors), "errors": errors}
+
+    async def delete_documents(self, filter_by: str) -> int:
+        """
+        Delete the documents matching a filter.
+
+        Returns:
+            Number of documents deleted
+        """
+        try:
+            response = await self._request(
+                "DELETE", f"/collections/{self.collection_name}/documents", params={"filter_by": filter_by}
+            )
+        finally:
+            self.sync_client._index_written()
+        return response.get("num_deleted", 0)
+
+    async def export_documents(
+        self,
+        include_fields: Optional[str] = None,
+        exclude_fields: Optional[str] = None,
+        filter_by: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream documents from the export endpoint, like TypesenseClient.export_documents()."""
+        params = {
+            key: value
+            for key, value in {
+                "include_fields": include_fields,
+                "exclude_fields": exclude_fields,
+                "filter_by": filter_by,
+            }.items()
+            if value
+        }
+        timeout = httpx.Timeout(settings.typesense_import_timeout, connect=settings.typesense_connection_timeout)
+        try:
+            async with self._http.stream(
+                "GET", f"/collections/{self.collection_name}/documents/export", params=params, timeout=timeout
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                    self._raise_for_status(response)
+                async for line in response.aiter_lines():
+                    if line.strip():
+                        yield json.loads(line)
+        except httpx.TransportError as e:
+            raise self._transport_error(e) from e
+
+    async def _cached(
+        self,
+        cache: ResultCache,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Cached value, or the result of one load shared by concurrent callers."""
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        # A load started before an invalidation is not joined by later requests
+        flight_key = (id(cache), key, cache.generation)
+        flight = self._in_flight.get(flight_key)
+        if flight is None:
+            generation = cache.generation
+
+            async def load() -> Any:
+                value = await loader()
+                if cacheable is None or cacheable(value):
+                    cache.put(key, value, generation)
+                return value
+
+            flight = self._in_flight[flight_key] = asyncio.ensure_future(load())
+            flight.add_done_callback(lambda _: self._in_flight.pop(flight_key, None))
+        else:
+            cache.coalesced += 1
+        # A caller that goes away does not cancel the load for the others
+        return await asyncio.shield(flight)
+
+    async def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        response = await self._send(method, path, **kwargs)
+        return response.json()
+
+    async def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        try:
+            response = await self._http.request(method, path, **kwargs)
+        except httpx.TransportError as e:
+            raise self._transport_error(e) from e
+        self._raise_for_status(response)
+        return response
+
+    @staticmethod
+    def _transport_error(error: httpx.TransportError) -> typesense.exceptions.TypesenseClientError:
+        """SDK exception for a request that got no response."""
+        if isinstance(error, httpx.TimeoutException):
+            return typesense.exceptions.Timeout(str(error))
+        return typesense.exceptions.ServiceUnavailable(f"Connection error: {error}")
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
+        if response.is_success:
+            return
+        try:
+            message = response.json().get("message", response.text)
+        except ValueError:
+            message = response.text
+        error = _ERRORS.get(response.status_code, typesense.exceptions.TypesenseClientError)
+        raise error(f"[Errno {response.status_code}] {message}")
+
+
+# Global async client instance, bound to the event loop it was created in
+_async_client: Optional[AsyncTypesenseClient] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_async_typesense_client() -> AsyncTypesenseClient:
+    """Get or create the async Typesense client of the running event loop"""
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        _async_client = AsyncTypesenseClient()
+        _async_client_loop = loop
+    return _async_client
+
+
+async def close_async_typesense_client() -> None:
+    """Close the pooled connections of the async client (on application shutdown)."""
+    global _async_client, _async_client_loop
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+        _async_client_loop = None
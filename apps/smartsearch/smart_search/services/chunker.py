@@ -1,9 +1,58 @@
 """
 Text chunking service for splitting content into overlapping chunks.
+
+chunk_text() splits a whole string; iter_chunks() applies the same rules to
+an iterator of text blocks and yields the same chunks while only holding a
+window of about one chunk (plus the current block) in memory.
+
+Chunking strategies (selected by the chunk_strategy setting):
+- fixed:     iter_chunks() character windows with overlap
+- sentence:  whole sentences packed up to a token budget
+- paragraph: whole paragraphs packed up to a token budget, long ones split into sentences
+- heading:   like paragraph, but a chunk does not run past a heading into the next section
+
+The token budget defaults to the input limit of the embedding model, so
+boundary-aware chunks are embedded in full instead of being truncated.
 """
 
 import hashlib
-from typing import List
+import re
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
+
+from smart_search.core.config import settings
+from smart_search.core.logging import logger
+
+# How far around the target end a word boundary is searched for
+BOUNDARY_SEARCH = 100
+
+# Input limit of paraphrase-multilingual-mpnet-base-v2; longer text is truncated when embedded
+EMBEDDING_MAX_TOKENS = 128
+
+# Start and end tokens added to every embedded text
+SPECIAL_TOKENS = 2
+
+# Word characters per token assumed by estimate_tokens()
+WORD_CHARS_PER_TOKEN = 6
+
+# Average characters per token of prose, used for chunk count estimates
+CHARS_PER_TOKEN = 5
+
+# Longest text held back while waiting for a paragraph break
+MAX_PENDING_TEXT = 64 * 1024
+
+STRATEGY_FIXED = "fixed"
+STRATEGY_SENTENCE = "sentence"
+STRATEGY_PARAGRAPH = "paragraph"
+STRATEGY_HEADING = "heading"
+SEMANTIC_STRATEGIES = (STRATEGY_SENTENCE, STRATEGY_PARAGRAPH, STRATEGY_HEADING)
+
+# CJK characters, words, numbers and punctuation marks
+_TOKEN_PIECES = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]|[^\W\d_]+|\d+|[^\w\s]")
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n\s*")
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|(?<=[。！？])\s*|\n\s*")
+_MARKDOWN_HEADING = re.compile(r"#{1,6}[ \t]+\S")
+_NUMBERED_HEADING = re.compile(r"(\d+\.)*\d+\.?[ \t]+\S")
 
 
 def chunk_text(content: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
@@ -58,22 +107,316 @@ def chunk_text(content: str, chunk_size: int = 1000, overlap: int = 200) -> List
     return chunks
 
 
-def generate_chunk_hash(file_path: str, chunk_index: int, content: str) -> str:
+def iter_chunks(blocks: Iterable[str], chunk_size: int = 1000, overlap: int = 200) -> Iterator[str]:
+    """
+    Split streamed text into overlapping chunks.
+
+    Yields exactly what chunk_text() returns for the concatenated blocks.
+
+    Args:
+        blocks: Text blocks in document order (any sizes)
+        chunk_size: Maximum size of each chunk in characters
+        overlap: Number of overlapping characters between chunks
+
+    Yields:
+        Text chunks
+    """
+    blocks = iter(blocks)
+    buffer = ""  # Text from absolute position `base` on
+    base = 0
+    exhausted = False
+
+    def fill(position: int) -> None:
+        """Read blocks until the buffer reaches the absolute position (or the text ends)."""
+        nonlocal buffer, exhausted
+        pieces = [buffer]
+        available = base + len(buffer)
+        while available < position:
+            block = next(blocks, None)
+            if block is None:
+                exhausted = True
+                break
+            pieces.append(block)
+            available += len(block)
+        buffer = "".join(pieces)
+
+    # Empty or single-chunk content is returned as is
+    fill(chunk_size + 1)
+    if exhausted and len(buffer) <= chunk_size:
+        yield buffer
+        return
+
+    start = 0
+    while True:
+        # One character past the boundary search window tells whether the text goes on
+        end = start + chunk_size
+        fill(end + BOUNDARY_SEARCH + 1)
+        length = base + len(buffer)
+        if start >= length:
+            return
+
+        if end < length:
+            # Look for word boundary (space, newline) near the end
+            search_start = max(start + chunk_size - BOUNDARY_SEARCH, start) - base
+            search_end = min(end + BOUNDARY_SEARCH, length) - base
+            boundary = max(buffer.rfind(" ", search_start, search_end), buffer.rfind("\n", search_start, search_end))
+            if boundary + base > start:
+                end = boundary + base + 1
+
+        chunk = buffer[start - base : end - base].strip()
+        if chunk:
+            yield chunk
+
+        if end >= length:
+            return
+        start = end - overlap
+
+        # Drop consumed text once it makes up most of the buffer
+        if start - base > len(buffer) // 2:
+            buffer = buffer[start - base :]
+            base = start
+
+
+def generate_chunk_hash(file_path: str, chunk_index: int, content: str, context: str = "") -> str:
     """
     Generate a unique hash for a chunk.
 
+    The hash covers the whole chunk content, so it changes whenever the
+    chunk's embedding input does and can be used to skip re-embedding.
+
     Args:
         file_path: Path to the file
         chunk_index: Index of the chunk
         content: Content of the chunk
+        context: Other embedded inputs (e.g. title and author)
 
     Returns:
         SHA1 hash of the chunk identifier
     """
-    identifier = f"{file_path}:{chunk_index}:{content[:100]}"
+    identifier = f"{file_path}:{chunk_index}:{context}\x00{content}"
     return hashlib.sha1(identifier.encode()).hexdigest()
 
 
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate the number of tokens the embedding model's tokenizer produces.
+
+    Counts one token per started WORD_CHARS_PER_TOKEN characters of each word
+    or number, and one per CJK character or punctuation mark. Special tokens
+    are not included.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return sum(-(-(match.end() - match.start()) // WORD_CHARS_PER_TOKEN) for match in _TOKEN_PIECES.finditer(text))
+
+
+class ChunkingStrategy(Protocol):
+    """Protocol for chunking strategies."""
+
+    name: str
+
+    def chunk(self, blocks: Iterable[str]) -> Iterator[str]:
+        """
+        Split streamed text into chunks.
+
+        Args:
+            blocks: Text blocks in document order (any sizes)
+
+        Yields:
+            Text chunks, at least one (empty for empty content)
+        """
+        ...
+
+    def estimate_chunks(self, length: int) -> int:
+        """
+        Estimate the number of chunks for a text length, for progress reporting.
+
+        Args:
+            length: Text length in characters
+
+        Returns:
+            Estimated chunk count (at least 1)
+        """
+        ...
+
+
+class FixedSizeChunker:
+    """Character windows with overlap (iter_chunks)."""
+
+    name = STRATEGY_FIXED
+
+    def __init__(self, chunk_size: int = 1000, overlap: int = 200):
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+
+    def chunk(self, blocks: Iterable[str]) -> Iterator[str]:
+        return iter_chunks(blocks, self.chunk_size, self.overlap)
+
+    def estimate_chunks(self, length: int) -> int:
+        return max(1, -(-length // max(1, self.chunk_size - self.overlap)))
+
+
+class SemanticChunker:
+    """
+    Chunks made of whole sentences or paragraphs, sized to a token budget.
+
+    Text is split into paragraphs as blocks arrive; paragraphs over the budget
+    (or every paragraph, for the sentence strategy) are split into sentences,
+    and sentences over the budget are cut between words. The pieces are then
+    packed greedily into chunks of at most max_tokens tokens, special tokens
+    included.
+
+    With the heading strategy a heading starts a new chunk, unless the chunk
+    so far is under a quarter of the budget (a lone heading or a very short
+    section is kept with what follows).
+    """
+
+    def __init__(
+        self,
+        strategy: str = STRATEGY_PARAGRAPH,
+        max_tokens: Optional[int] = None,
+        overlap_tokens: Optional[int] = None,
+    ):
+        """
+        Args:
+            strategy: 'sentence', 'paragraph' or 'heading'
+            max_tokens: Token budget of a chunk (defaults to chunk_max_tokens)
+            overlap_tokens: Tokens of trailing sentences repeated in the next chunk (defaults to chunk_overlap_tokens)
+        """
+        if strategy not in SEMANTIC_STRATEGIES:
+            raise ValueError(f"Unknown chunking strategy '{strategy}' (expected one of {SEMANTIC_STRATEGIES})")
+        self.name = strategy
+        self.max_tokens = max_tokens or settings.chunk_max_tokens
+        self.overlap_tokens = settings.chunk_overlap_tokens if overlap_tokens is None else overlap_tokens
+        self._budget = max(1, self.max_tokens - SPECIAL_TOKENS)
+
+    def chunk(self, blocks: Iterable[str]) -> Iterator[str]:
+        empty = True
+        for chunk in self._pack(self._pieces(blocks)):
+            empty = False
+            yield chunk
+        if empty:
+            yield ""
+
+    def estimate_chunks(self, length: int) -> int:
+        return max(1, -(-length // (self._budget * CHARS_PER_TOKEN)))
+
+    def _pieces(self, blocks: Iterable[str]) -> Iterator[Tuple[str, int, bool]]:
+        """(text, tokens, starts a section) pieces of at most the budget, in order."""
+        for paragraph in _iter_paragraphs(blocks):
+            heading = self.name == STRATEGY_HEADING and _is_heading(paragraph)
+            tokens = estimate_tokens(paragraph)
+            if tokens <= self._budget and self.name != STRATEGY_SENTENCE:
+                yield paragraph, tokens, heading
+                continue
+            for sentence in _split(paragraph, _SENTENCE_BREAK):
+                tokens = estimate_tokens(sentence)
+                pieces = [(sentence, tokens)] if tokens <= self._budget else _cut(sentence, self._budget)
+                for text, tokens in pieces:
+                    yield text, tokens, heading
+                    heading = False
+
+    def _pack(self, pieces: Iterable[Tuple[str, int, bool]]) -> Iterator[str]:
+        current: List[Tuple[str, int]] = []
+        size = 0
+        for text, tokens, section_start in pieces:
+            if current and (size + tokens > self._budget or (section_start and size >= self._budget // 4)):
+                chunk = "".join(piece for piece, _ in current).strip()
+                if chunk:
+                    yield chunk
+                current = [] if section_start else self._overlap(current)
+                size = sum(piece_tokens for _, piece_tokens in current)
+                if size + tokens > self._budget:
+                    current, size = [], 0
+            current.append((text, tokens))
+            size += tokens
+
+        chunk = "".join(piece for piece, _ in current).strip()
+        if chunk:
+            yield chunk
+
+    def _overlap(self, pieces: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
+        """Trailing pieces (never all of them) fitting in the overlap budget."""
+        size = 0
+        count = 0
+        for _, tokens in reversed(pieces[1:]):
+            if size + tokens > self.overlap_tokens:
+                break
+            size += tokens
+            count += 1
+        return pieces[len(pieces) - count :] if count else []
+
+
+def _split(text: str, pattern: "re.Pattern[str]") -> List[str]:
+    """Split text after each match, keeping separators with the preceding piece."""
+    pieces = []
+    start = 0
+    for match in pattern.finditer(text):
+        if match.end() > start:
+            pieces.append(text[start : match.end()])
+            start = match.end()
+    if start < len(text):
+        pieces.append(text[start:])
+    return pieces
+
+
+def _cut(text: str, budget: int) -> List[Tuple[str, int]]:
+    """Cut text without sentence breaks into pieces of at most budget tokens, between words where possible."""
+    pieces = []
+    start = 0
+    size = 0
+    for match in _TOKEN_PIECES.finditer(text):
+        tokens = -(-(match.end() - match.start()) // WORD_CHARS_PER_TOKEN)
+        if size + tokens > budget and match.start() > start:
+            pieces.append((text[start : match.start()], size))
+            start, size = match.start(), 0
+        if tokens > budget:
+            # A single word longer than the budget
+            step = budget * WORD_CHARS_PER_TOKEN
+            while match.end() - start > step:
+                pieces.append((text[start : start + step], budget))
+                start += step
+            tokens = -(-(match.end() - start) // WORD_CHARS_PER_TOKEN)
+        size += tokens
+    if start < len(text):
+        pieces.append((text[start:], size))
+    return pieces
+
+
+def _iter_paragraphs(blocks: Iterable[str]) -> Iterator[str]:
+    """Paragraphs (with their trailing blank lines) of streamed text."""
+    buffer = ""
+    for block in blocks:
+        buffer += block
+        last = None
+        for last in _PARAGRAPH_BREAK.finditer(buffer):
+            pass
+        # A break at the very end may continue in the next block
+        if last is not None and last.end() < len(buffer):
+            yield from _split(buffer[: last.end()], _PARAGRAPH_BREAK)
+            buffer = buffer[last.end() :]
+        elif len(buffer) > MAX_PENDING_TEXT:
+            cut = max(buffer.rfind("\n"), buffer.rfind(" ")) + 1 or len(buffer)
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+    if buffer:
+        yield from _split(buffer, _PARAGRAPH_BREAK)
+
+
+def _is_heading(paragraph: str) -> bool:
+    """Markdown heading, or a short capitalized or numbered line without closing punctuation."""
+    text = paragraph.strip()
+    if _MARKDOWN_HEADING.match(text):
+        return True
+    if not text or "\n" in text or len(text) > 80 or len(text.split()) > 10 or text[-1] in ".!?,;:":
+        return False
+    return text[0].isupper() or bool(_NUMBERED_HEADING.match(text))
+
+
 def get_chunk_config() -> tuple[int, int]:
     """
     Get chunking configuration from environment variables.
@@ -90,3 +433,74 @@ def get_chunk_config() -> tuple[int, int]:
     chunk_size = int(getenv("CHUNK_SIZE", "1000"))
     overlap = int(getenv("CHUNK_OVERLAP", "200"))
     return chunk_size, overlap
+
+
+def get_chunker(strategy: Optional[str] = None) -> ChunkingStrategy:
+    """
+    Create the configured chunking strategy.
+
+    Args:
+        strategy: Strategy name (defaults to the chunk_strategy setting)
+
+    Returns:
+        ChunkingStrategy (fixed-size for unknown names)
+    """
+    strategy = (strategy or settings.chunk_strategy).lower()
+    if strategy in SEMANTIC_STRATEGIES:
+        return SemanticChunker(strategy)
+    if strategy != STRATEGY_FIXED:
+        logger.warning(f"Unknown chunking strategy '{strategy}', using '{STRATEGY_FIXED}'")
+    chunk_size, overlap = get_chunk_config()
+    return FixedSizeChunker(chunk_size, overlap)
+
+
+def benchmark_chunking(
+    texts: List[str], chunkers: Optional[List[ChunkingStrategy]] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compare the embedding cost of chunking strategies on sample texts.
+
+    Args:
+        texts: Sample document contents
+        chunkers: Strategies to compare (defaults to every strategy with the current settings)
+
+    Returns:
+        Per strategy name:
+        - chunks: number of chunks (one embedding each)
+        - tokens: estimated tokens of all chunks, special tokens included
+        - embedded_tokens: tokens within the model's input limit (the embedding cost)
+        - coverage: share of chunk tokens within the input limit (the rest is not embedded)
+        - seconds: time spent chunking
+    """
+    if chunkers is None:
+        chunkers = [get_chunker(STRATEGY_FIXED)] + [get_chunker(strategy) for strategy in SEMANTIC_STRATEGIES]
+
+    results: Dict[str, Dict[str, float]] = {}
+    for chunker in chunkers:
+        started = time.perf_counter()
+        chunks = [chunk for text in texts for chunk in chunker.chunk((text,)) if chunk]
+        seconds = time.perf_counter() - started
+        tokens = [estimate_tokens(chunk) + SPECIAL_TOKENS for chunk in chunks]
+        embedded = sum(min(count, EMBEDDING_MAX_TOKENS) for count in tokens)
+        results[chunker.name] = {
+            "chunks": len(chunks),
+            "tokens": sum(tokens),
+            "embedded_tokens": embedded,
+            "coverage": embedded / sum(tokens) if tokens else 1.0,
+            "seconds": seconds,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    # python -m smart_search.services.chunker FILE...
+    import sys
+    from pathlib import Path
+
+    samples = [Path(path).read_text(encoding="utf-8", errors="ignore") for path in sys.argv[1:]]
+    print(f"{'strategy':<10} {'chunks':>8} {'tokens':>10} {'embedded':>10} {'coverage':>9} {'seconds':>8}")
+    for name, stats in benchmark_chunking(samples).items():
+        print(
+            f"{name:<10} {stats['chunks']:>8} {stats['tokens']:>10} {stats['embedded_tokens']:>10} "
+            f"{stats['coverage']:>9.1%} {stats['seconds']:>8.3f}"
+        )
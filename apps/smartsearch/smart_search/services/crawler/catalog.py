@@ -0,0 +1,137 @@
+"""
+Local file-state catalog
+
+Remembers the stat signature (size, mtime_ns, inode) and content hash of every
+indexed file in the application database, so unchanged files can be skipped
+without reading them or asking Typesense.
+
+The catalog is a cache: lookups and writes never raise, and a missing or stale
+entry only means the file is hashed (and possibly re-indexed) again.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Callable, ContextManager, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from smart_search.core.logging import logger
+from smart_search.database.models import db_session
+from smart_search.database.repositories import FileStateRepository
+
+
+@dataclass(frozen=True)
+class FileSignature:
+    """Cheap identity of a file's current version, taken from stat()"""
+
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def from_stat(cls, stats: os.stat_result) -> "FileSignature":
+        return cls(size=stats.st_size, mtime_ns=stats.st_mtime_ns, inode=stats.st_ino)
+
+    def matches(self, other: "FileSignature") -> bool:
+        """Same size and mtime; inodes are compared only when both are known (scandir reports 0 on Windows)."""
+        if self.size != other.size or self.mtime_ns != other.mtime_ns:
+            return False
+        return not self.inode or not other.inode or self.inode == other.inode
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Catalogued state of an indexed file"""
+
+    signature: FileSignature
+    file_hash: str
+
+
+class FileCatalog:
+    """
+    Path -> (stat signature, content hash) catalog backed by the file_states table.
+    """
+
+    def __init__(self, session_factory: Callable[[], ContextManager[Session]] = db_session):
+        self._session_factory = session_factory
+
+    def get_entries(self, paths: Iterable[str]) -> Dict[str, CatalogEntry]:
+        """Catalog entries for the given paths (missing paths are omitted)."""
+        try:
+            with self._session_factory() as db:
+                states = FileStateRepository(db).get_by_paths(paths)
+                return {
+                    path: CatalogEntry(
+                        signature=FileSignature(size=state.size, mtime_ns=state.mtime_ns, inode=state.inode),
+                        file_hash=state.file_hash,
+                    )
+                    for path, state in states.items()
+                }
+        except Exception as e:
+            logger.warning(f"File catalog lookup failed: {e}")
+            return {}
+
+    def get_entry(self, path: str) -> Optional[CatalogEntry]:
+        """Catalog entry for a single path."""
+        return self.get_entries([path]).get(path)
+
+    def find_unchanged(self, signatures: Dict[str, FileSignature]) -> List[str]:
+        """Paths whose current signature matches the catalogued one."""
+        entries = self.get_entries(signatures.keys())
+        return [
+            path
+            for path, signature in signatures.items()
+            if path in entries and entries[path].signature.matches(signature)
+        ]
+
+    def record(self, entries: List[Tuple[str, FileSignature, str]]) -> None:
+        """Remember (path, signature, file_hash) for successfully indexed files."""
+        if not entries:
+            return
+        rows = [
+            {
+                "path": path,
+                "size": signature.size,
+                "mtime_ns": signature.mtime_ns,
+                "inode": signature.inode,
+                "file_hash": file_hash,
+            }
+            for path, signature, file_hash in entries
+        ]
+        try:
+            with self._session_factory() as db:
+                FileStateRepository(db).upsert_many(rows)
+        except Exception as e:
+            logger.warning(f"Failed to record {len(rows)} file(s) in catalog: {e}")
+
+    def forget(self, paths: Iterable[str]) -> None:
+        """Drop entries for files removed from the index."""
+        paths = list(paths)
+        if not paths:
+            return
+        try:
+            with self._session_factory() as db:
+                FileStateRepository(db).delete_paths(paths)
+        except Exception as e:
+            logger.warning(f"Failed to remove {len(paths)} file(s) from catalog: {e}")
+
+    def clear(self) -> None:
+        """Drop every entry (used when the search index is reset)."""
+        try:
+            with self._session_factory() as db:
+                deleted = FileStateRepository(db).clear()
+                logger.info(f"Cleared {deleted} file catalog entries")
+        except Exception as e:
+            logger.warning(f"Failed to clear file catalog: {e}")
+
+
+# Global catalog instance
+_catalog: Optional[FileCatalog] = None
+
+
+def get_file_catalog() -> FileCatalog:
+    """Get or create global file catalog"""
+    global _catalog
+    if _catalog is None:
+        _catalog = FileCatalog()
+    return _catalog
@@ -6,23 +6,46 @@ import os
 import queue
 import threading
 import time
-from typing import List
+from typing import List, Optional, Set
 
 from smart_search.api.models.operations import CrawlOperation, OperationType
+from smart_search.core.config import settings
 from smart_search.core.logging import logger
 from smart_search.database.models import WatchPath
+from smart_search.services.crawler.catalog import FileCatalog, FileSignature, get_file_catalog
 from smart_search.services.crawler.path_utils import PathFilter
+from smart_search.services.crawler.snapshots import (
+    DirectorySnapshotStore,
+    DirectoryState,
+    get_directory_snapshot_store,
+)
+from smart_search.services.crawler.walker import DirectoryFiles, ParallelWalker
 
 
 class FileDiscoverer:
     """
     Scans watch paths for files and yields crawl operations.
+
+    Files whose stat signature matches the file catalog, and files in
+    directories unchanged since the last snapshot, are counted in
+    files_skipped and not yielded.
     """
 
-    def __init__(self, watch_paths: List[WatchPath]):
+    def __init__(
+        self,
+        watch_paths: List[WatchPath],
+        catalog: Optional[FileCatalog] = None,
+        snapshot_store: Optional[DirectorySnapshotStore] = None,
+    ):
         self.watch_paths = watch_paths
+        self.catalog = catalog or get_file_catalog()
+        self.snapshot_store = snapshot_store or get_directory_snapshot_store()
+        self._walker: Optional[ParallelWalker] = None
+        self._full_walk = False
         self._stop_event = threading.Event()
         self.files_found = 0
+        self.files_skipped = 0
+        self._counter_lock = threading.Lock()
 
     def stop(self):
         """Signal the discovery process to stop."""
@@ -32,11 +55,26 @@ class FileDiscoverer:
         """Reset the discoverer state for a new crawl."""
         self._stop_event.clear()
         self.files_found = 0
+        self.files_skipped = 0
+        self._walker = None
+
+    def save_snapshot(self, exclude_dirs: Optional[Set[str]] = None) -> None:
+        """
+        Persist the directory snapshot of the last discovery.
+
+        Call only once the crawl completed without being stopped; directories
+        holding files that failed to index should be excluded so they are
+        listed again next time.
+        """
+        if self._walker is None:
+            return
+        self.snapshot_store.save(self._walker.snapshot, full_walk=self._full_walk, exclude=exclude_dirs)
 
     def discover(self):
         """
         Discover files in watch paths and yield crawl operations.
-        Uses a background thread and queue for non-blocking traversal.
+        Traversal runs on a ParallelWalker pool in the background; operations
+        are handed over through a bounded queue.
         """
         result_queue = queue.Queue(maxsize=1000)
 
@@ -50,51 +88,70 @@ class FileDiscoverer:
             excluded_paths=excluded_paths,
         )
 
+        # Incremental walk unless a periodic full walk is due
+        previous_snapshot = {} if self.snapshot_store.full_walk_due() else self.snapshot_store.load()
+        self._full_walk = not previous_snapshot
+        logger.info(f"Starting {'full' if self._full_walk else 'incremental'} discovery")
+
+        walker = ParallelWalker(
+            path_filter,
+            workers=settings.discovery_workers,
+            stop_event=self._stop_event,
+            previous_snapshot=previous_snapshot,
+        )
+        self._walker = walker
+
+        def on_directory(directory: str, files: DirectoryFiles):
+            """Turn one directory listing into crawl operations"""
+            if not files:
+                return
+
+            # One catalog query per directory
+            unchanged = set(
+                self.catalog.find_unchanged({path: FileSignature.from_stat(stats) for path, stats in files})
+            )
+
+            with self._counter_lock:
+                self.files_found += len(files)
+                self.files_skipped += len(unchanged)
+
+            for file_path, stats in files:
+                if self._stop_event.is_set():
+                    return
+                if file_path in unchanged:
+                    continue
+
+                op = CrawlOperation(
+                    operation=OperationType.CREATE,
+                    file_path=file_path,
+                    file_size=stats.st_size,
+                    modified_time=int(stats.st_mtime * 1000),
+                    created_time=int(stats.st_ctime * 1000),
+                    discovered_at=int(time.time() * 1000),
+                    source="crawl",
+                )
+                # Put into queue (blocking if full for backpressure)
+                result_queue.put(op)
+
+        def on_unchanged(directory: str, state: DirectoryState):
+            """Files of an unchanged directory were all handled by the last crawl"""
+            with self._counter_lock:
+                self.files_found += state.entry_count
+                self.files_skipped += state.entry_count
+
         def scan_worker():
             """Blocking filesystem traversal run in a thread"""
             try:
+                roots = []
                 for watch_path_model in included_paths:
-                    if self._stop_event.is_set():
-                        break
-
                     if not os.path.exists(watch_path_model.path):
                         continue
-
                     logger.info(f"Scanning directory: {watch_path_model.path}")
-                    for root, dirs, files in os.walk(watch_path_model.path, topdown=True):
-                        if self._stop_event.is_set():
-                            return
-
-                        # Prune excluded directories using shared PathFilter
-                        dirs[:] = [d for d in dirs if not path_filter.should_prune_directory(os.path.join(root, d))]
-
-                        if not watch_path_model.include_subdirectories:
-                            # If not recursive, clear dirs so we don't go deeper
-                            dirs[:] = []
-
-                        for filename in files:
-                            if self._stop_event.is_set():
-                                return
-
-                            file_path = os.path.join(root, filename)
-                            try:
-                                stats = os.stat(file_path)
-                                self.files_found += 1
-                                op = CrawlOperation(
-                                    operation=OperationType.CREATE,
-                                    file_path=file_path,
-                                    file_size=stats.st_size,
-                                    modified_time=int(stats.st_mtime * 1000),
-                                    created_time=int(stats.st_ctime * 1000),
-                                    discovered_at=int(time.time() * 1000),
-                                    source="crawl",
-                                )
-                                # Put into queue (blocking if full for backpressure)
-                                result_queue.put(op)
-                            except FileNotFoundError:
-                                continue
-                            except Exception as e:
-                                logger.warning(f"Error processing {file_path}: {e}")
+                    roots.append((watch_path_model.path, watch_path_model.include_subdirectories))
+
+                walker.walk(roots, on_directory, on_unchanged)
+            except Exception as e:
+                logger.error(f"Error during discovery: {e}")
             finally:
                 # Signal end of discovery
                 result_queue.put(None)
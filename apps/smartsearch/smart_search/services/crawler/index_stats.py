@@ -0,0 +1,281 @@
+"""
+Materialized index statistics
+
+File counts and bytes per extension, a histogram of modification days (for
+age buckets) and hourly/daily histograms of indexing times are kept as
+counters in the application database. The indexer updates them whenever a
+file is indexed or removed, so the statistics endpoints read a few counter
+rows instead of paging through the Typesense collection.
+
+Each indexed file's facts (extension, size, modification and indexing time)
+are stored as well, so an edit or delete subtracts exactly what the file
+added before. Indexing-time buckets are only kept for as long as the
+statistics look back (hourly: 48 hours, daily: 14 days).
+
+An index built before the statistics existed is counted once, from a
+Typesense export, the first time they are read.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from smart_search.core.logging import logger
+from smart_search.database.models import db_session
+from smart_search.database.repositories import IndexStatsRepository
+
+HOUR_MS = 3600 * 1000
+DAY_MS = 24 * HOUR_MS
+
+KIND_TOTAL = "total"
+KIND_EXTENSION = "extension"
+KIND_MODIFIED_DAY = "modified_day"
+KIND_INDEXED_HOUR = "indexed_hour"
+KIND_INDEXED_DAY = "indexed_day"
+KIND_META = "meta"
+
+# Marker counter set once the statistics cover the whole index
+INITIALIZED_BUCKET = "initialized"
+
+HOURLY_RETENTION_MS = 48 * HOUR_MS
+DAILY_RETENTION_MS = 14 * DAY_MS
+
+# Age buckets: name -> (min age, max age) in days
+AGE_BUCKETS = {"30d": (0, 30), "90d": (30, 90), "1y": (90, 365), "older": (365, None)}
+
+# Files recorded per transaction when counting an existing index
+BACKFILL_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class IndexedFileFacts:
+    """What an indexed file contributes to the statistics"""
+
+    path: str
+    extension: str
+    size: int
+    modified_time: int  # ms
+    indexed_at: int  # ms
+
+    @classmethod
+    def from_document(cls, document: Dict[str, Any]) -> "IndexedFileFacts":
+        """Facts of a file from one of its chunk documents"""
+        return cls(
+            path=document["file_path"],
+            extension=document.get("file_extension") or "unknown",
+            size=int(document.get("file_size") or 0),
+            modified_time=int(document.get("modified_time") or 0),
+            indexed_at=int(document.get("indexed_at") or 0),
+        )
+
+
+class IndexStatsStore:
+    """
+    Counters of indexed files backed by the indexed_files and stats_aggregates tables.
+
+    Like the file catalog, writes never raise; a failed update is logged.
+    """
+
+    def __init__(self, session_factory: Callable[[], ContextManager[Session]] = db_session):
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+        self._last_prune: Optional[float] = None
+
+    def record(self, files: List[IndexedFileFacts]) -> None:
+        """Count newly indexed or re-indexed files (replacing their previous contribution)."""
+        if not files:
+            return
+        now_ms = int(time.time() * 1000)
+        latest = {facts.path: facts for facts in files}
+        try:
+            with self._lock, self._session_factory() as db:
+                repo = IndexStatsRepository(db)
+                deltas: Dict[Tuple[str, str], List[int]] = defaultdict(lambda: [0, 0])
+                for previous in repo.get_by_paths(latest).values():
+                    self._add(deltas, self._facts(previous), -1, now_ms)
+                for facts in latest.values():
+                    self._add(deltas, facts, 1, now_ms)
+                repo.upsert_files([facts.__dict__ for facts in latest.values()])
+                repo.add_to_aggregates({key: (count, size) for key, (count, size) in deltas.items()})
+                self._prune(repo, now_ms)
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to update index statistics for {len(latest)} file(s): {e}")
+
+    def forget(self, paths: Iterable[str]) -> None:
+        """Uncount files removed from the index."""
+        paths = list(paths)
+        if not paths:
+            return
+        now_ms = int(time.time() * 1000)
+        try:
+            with self._lock, self._session_factory() as db:
+                repo = IndexStatsRepository(db)
+                previous = repo.get_by_paths(paths)
+                if not previous:
+                    return
+                deltas: Dict[Tuple[str, str], List[int]] = defaultdict(lambda: [0, 0])
+                for indexed_file in previous.values():
+                    self._add(deltas, self._facts(indexed_file), -1, now_ms)
+                repo.delete_paths(previous)
+                repo.add_to_aggregates({key: (count, size) for key, (count, size) in deltas.items()})
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to remove {len(paths)} file(s) from index statistics: {e}")
+
+    def clear(self) -> None:
+        """Reset every counter (used when the search index is reset)."""
+        try:
+            with self._lock, self._session_factory() as db:
+                repo = IndexStatsRepository(db)
+                repo.clear()
+                # An empty index is fully counted
+                repo.add_to_aggregates({(KIND_META, INITIALIZED_BUCKET): (1, 0)})
+                db.commit()
+                self._initialized = True
+        except Exception as e:
+            logger.warning(f"Failed to clear index statistics: {e}")
+
+    def ensure_initialized(self, export: Callable[[], Iterable[Dict[str, Any]]]) -> None:
+        """
+        Count the files of an index built before the statistics existed.
+
+        Args:
+            export: Streams one chunk document (file_path, file_extension,
+                file_size, modified_time, indexed_at) per indexed file
+
+        Raises:
+            Exception: If the export fails (the next call tries again)
+        """
+        if self._initialized:
+            return
+        with self._init_lock:
+            if not self._initialized:
+                self._backfill(export)
+
+    def _backfill(self, export: Callable[[], Iterable[Dict[str, Any]]]) -> None:
+        with self._session_factory() as db:
+            if IndexStatsRepository(db).get_aggregates(KIND_META).get(INITIALIZED_BUCKET):
+                self._initialized = True
+                return
+
+        logger.info("Counting indexed files for index statistics...")
+        batch: List[IndexedFileFacts] = []
+        counted = 0
+        for document in export():
+            batch.append(IndexedFileFacts.from_document(document))
+            if len(batch) >= BACKFILL_BATCH_SIZE:
+                self.record(batch)
+                counted += len(batch)
+                batch = []
+        self.record(batch)
+        counted += len(batch)
+
+        with self._lock, self._session_factory() as db:
+            repo = IndexStatsRepository(db)
+            if not repo.get_aggregates(KIND_META).get(INITIALIZED_BUCKET):
+                repo.add_to_aggregates({(KIND_META, INITIALIZED_BUCKET): (1, 0)})
+            db.commit()
+        self._initialized = True
+        logger.info(f"Index statistics initialized with {counted} file(s)")
+
+    def total_files(self) -> int:
+        return self._read(KIND_TOTAL).get("", (0, 0))[0]
+
+    def extension_counts(self) -> Dict[str, int]:
+        """Indexed files per extension."""
+        return {extension: count for extension, (count, _) in self._read(KIND_EXTENSION).items()}
+
+    def storage_by_extension(self) -> Dict[str, int]:
+        """Bytes of indexed files per extension."""
+        return {extension: size for extension, (count, size) in self._read(KIND_EXTENSION).items()}
+
+    def age_distribution(self, now_ms: Optional[int] = None) -> Dict[str, int]:
+        """Indexed files per modification age bucket (by day)."""
+        today = (now_ms if now_ms is not None else int(time.time() * 1000)) // DAY_MS
+        distribution = {name: 0 for name in AGE_BUCKETS}
+        for day, (count, _) in self._read(KIND_MODIFIED_DAY).items():
+            age = today - int(day)
+            for name, (min_age, max_age) in AGE_BUCKETS.items():
+                if age >= min_age and (max_age is None or age < max_age):
+                    distribution[name] += count
+                    break
+        return distribution
+
+    def indexing_activity(self, hourly: bool, now_ms: Optional[int] = None) -> Tuple[List[Dict[str, int]], int]:
+        """
+        Files per indexing hour (last 24) or day (last 7), by their latest indexing time.
+
+        Returns:
+            (buckets of {'timestamp', 'count'} oldest first, total files in the range)
+        """
+        now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+        if hourly:
+            kind, bucket_ms, bucket_count = KIND_INDEXED_HOUR, HOUR_MS, 24
+        else:
+            kind, bucket_ms, bucket_count = KIND_INDEXED_DAY, DAY_MS, 7
+        start_ms = (now_ms // bucket_ms - (bucket_count - 1)) * bucket_ms
+        counts = self._read(kind)
+        activity = [
+            {"timestamp": start_ms + i * bucket_ms, "count": counts.get(str(start_ms + i * bucket_ms), (0, 0))[0]}
+            for i in range(bucket_count)
+        ]
+        return activity, sum(bucket["count"] for bucket in activity)
+
+    def _read(self, kind: str) -> Dict[str, Tuple[int, int]]:
+        with self._session_factory() as db:
+            return IndexStatsRepository(db).get_aggregates(kind)
+
+    @staticmethod
+    def _facts(indexed_file) -> IndexedFileFacts:
+        return IndexedFileFacts(
+            path=indexed_file.path,
+            extension=indexed_file.extension,
+            size=indexed_file.size,
+            modified_time=indexed_file.modified_time,
+            indexed_at=indexed_file.indexed_at,
+        )
+
+    @staticmethod
+    def _add(deltas: Dict[Tuple[str, str], List[int]], facts: IndexedFileFacts, sign: int, now_ms: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) a file's contribution to every bucket it falls in."""
+        keys = [
+            (KIND_TOTAL, ""),
+            (KIND_EXTENSION, facts.extension),
+            (KIND_MODIFIED_DAY, str(facts.modified_time // DAY_MS)),
+        ]
+        if facts.indexed_at >= now_ms - HOURLY_RETENTION_MS:
+            keys.append((KIND_INDEXED_HOUR, str(facts.indexed_at // HOUR_MS * HOUR_MS)))
+        if facts.indexed_at >= now_ms - DAILY_RETENTION_MS:
+            keys.append((KIND_INDEXED_DAY, str(facts.indexed_at // DAY_MS * DAY_MS)))
+        for key in keys:
+            deltas[key][0] += sign
+            deltas[key][1] += sign * facts.size
+
+    def _prune(self, repo: IndexStatsRepository, now_ms: int) -> None:
+        """Drop indexing-time buckets past their retention, at most once an hour."""
+        if self._last_prune is not None and time.monotonic() - self._last_prune < 3600:
+            return
+        self._last_prune = time.monotonic()
+        for kind, retention_ms in ((KIND_INDEXED_HOUR, HOURLY_RETENTION_MS), (KIND_INDEXED_DAY, DAILY_RETENTION_MS)):
+            buckets = repo.get_aggregates(kind, include_empty=True)
+            expired = [bucket for bucket in buckets if int(bucket) < now_ms - retention_ms]
+            repo.delete_aggregates(kind, expired)
+
+
+# Global index statistics instance
+_store: Optional[IndexStatsStore] = None
+
+
+def get_index_stats() -> IndexStatsStore:
+    """Get or create global index statistics store"""
+    global _store
+    if _store is None:
+        _store = IndexStatsStore()
+    return _store
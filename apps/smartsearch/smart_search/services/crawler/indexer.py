@@ -2,26 +2,66 @@
 File Indexer component
 """
 
-import hashlib
+import json
 import os
 import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+from smart_search.api.models.file_event import DocumentContent
 from smart_search.api.models.operations import CrawlOperation, OperationType
 from smart_search.core.logging import logger
+from smart_search.core.typesense_schema import EMBEDDING_SOURCE_FIELDS
+from smart_search.services.crawler.catalog import FileSignature, get_file_catalog
+from smart_search.services.crawler.index_stats import IndexedFileFacts, get_index_stats
+from smart_search.services.extraction.cache import get_extraction_cache
 from smart_search.services.extraction.extractor import get_extractor
+from smart_search.services.extraction.protocol import DocumentBlocks
+from smart_search.services.hashing import hash_file, hash_matches
 from smart_search.services.typesense_client import get_typesense_client
 
 
+@dataclass
+class FileJob:
+    """
+    State of one file moving through the indexing stages.
+
+    result stays None while the file still needs work, and is set to True/False
+    by the stage that finishes it (skip, failure or successful upsert).
+    """
+
+    operation: CrawlOperation
+    file_hash: str = ""
+    signature: Optional[FileSignature] = None
+    # Extracted content; streamed text (DocumentBlocks) is read by the chunk stage
+    document: Optional[Union[DocumentContent, DocumentBlocks]] = None
+    documents: List[Dict[str, Any]] = field(default_factory=list)
+    result: Optional[bool] = None
+
+    @property
+    def file_path(self) -> str:
+        return self.operation.file_path
+
+    @property
+    def done(self) -> bool:
+        return self.result is not None
+
+
 class FileIndexer:
     """
     Handles indexing of a single file.
+
+    Indexing is split into stages (prepare -> extract -> chunk -> upsert) so the
+    IndexingPipeline can run them concurrently; index_file() runs them in turn.
     """
 
     def __init__(self):
         self.typesense = get_typesense_client()
         self.extractor = get_extractor()
+        self.extraction_cache = get_extraction_cache()
+        self.catalog = get_file_catalog()
+        self.index_stats = get_index_stats()
         self._stop_event = threading.Event()
 
     def stop(self):
@@ -38,81 +78,242 @@ class FileIndexer:
         """
         Index a single file.
         """
+        job = self.prepare(operation)
+        if not job.done:
+            self.extract(job)
+        if not job.done:
+            self.chunk(job, progress_callback)
+        if not job.done:
+            self.upsert([job])
+        return bool(job.result)
+
+    def prepare(self, operation: CrawlOperation) -> FileJob:
+        """
+        Stage 1: handle deletes, check the file and hash it.
+
+        Files whose stat signature (file catalog) or content hash matches the
+        indexed version finish here.
+        """
+        job = FileJob(operation=operation)
+
         if self._stop_event.is_set():
-            return False
+            job.result = False
+            return job
 
         if operation.operation == OperationType.DELETE:
-            return self._handle_delete_operation(operation)
-        else:
-            return self._handle_create_edit_operation(operation, progress_callback)
+            job.result = self._handle_delete_operation(operation)
+            return job
 
-    def _handle_create_edit_operation(
-        self, operation: CrawlOperation, progress_callback: Optional[Callable[[int, int], None]] = None
-    ) -> bool:
         file_path = operation.file_path
 
         if not self._check_file_accessibility(file_path)[0]:
             logger.warning(f"File not accessible: {file_path}")
-            return False
+            job.result = False
+            return job
+
+        try:
+            job.signature = FileSignature.from_stat(os.stat(file_path))
+        except OSError as e:
+            logger.warning(f"Cannot stat {file_path}: {e}")
+            job.result = False
+            return job
 
         max_size_mb = int(os.getenv("MAX_FILE_SIZE_MB", "100"))
         max_size_bytes = max_size_mb * 1024 * 1024
-        if operation.file_size and operation.file_size > max_size_bytes:
+        if job.signature.size > max_size_bytes:
             logger.warning(f"File too large: {file_path}")
-            return False
+            job.result = False
+            return job
 
-        file_hash = self._calculate_file_hash(file_path)
-        if not file_hash:
-            return False
+        # Unchanged stat signature: skip without reading the file
+        entry = self.catalog.get_entry(file_path)
+        if entry and entry.signature.matches(job.signature):
+            logger.debug(f"Skipping unchanged file (catalog): {file_path}")
+            job.result = True
+            return job
+
+        job.file_hash = self._calculate_file_hash(file_path)
+        if not job.file_hash:
+            job.result = False
+            return job
 
-        existing_doc = self.typesense.get_doc_by_path(file_path)
-        if existing_doc and existing_doc.get("file_hash") == file_hash:
+        # Touched but identical content: refresh the signature and skip
+        if entry:
+            indexed_hash = entry.file_hash
+        else:
+            existing_doc = self.typesense.get_doc_by_path(file_path)
+            indexed_hash = existing_doc.get("file_hash") if existing_doc else None
+        if hash_matches(file_path, indexed_hash, job.file_hash):
             logger.debug(f"Skipping unchanged file: {file_path}")
-            return True
+            self.catalog.record([(file_path, job.signature, job.file_hash)])
+            job.result = True
+
+        return job
+
+    def extract(self, job: FileJob) -> None:
+        """
+        Stage 2: extract document content (or reuse the cached result for the same content).
 
-        # Extract document content
-        document_content = self.extractor.extract(file_path)
+        Text read natively is not extracted here but streamed into the chunk stage.
+        """
+        cache = self.extraction_cache
+        if cache:
+            job.document = cache.get(job.file_hash)
+            if job.document is not None:
+                logger.debug(f"Using cached extraction for {job.file_path}")
+                return
+
+        try:
+            job.document = self.extractor.extract_blocks(job.file_path)
+        except Exception as e:
+            logger.error(f"Error extracting {job.file_path}: {e}")
+            job.result = False
+            return
 
+        # Streamed text is cheap to read again and too large to keep
+        if cache and isinstance(job.document, DocumentContent) and job.document.content:
+            cache.put(job.file_hash, job.document)
+
+    def chunk(self, job: FileJob, progress_callback: Optional[Callable[[int, int], None]] = None) -> None:
+        """
+        Stage 3: split content into chunks and build the chunk documents.
+
+        Streamed text goes from the file into the chunker block by block, but
+        every chunk document is kept until the upsert stage (which diffs them
+        against the indexed chunks), so memory still grows with the file size.
+        """
         # Import chunking utilities
-        from smart_search.services.chunker import chunk_text, generate_chunk_hash, get_chunk_config
+        from smart_search.services.chunker import generate_chunk_hash, get_chunker
 
-        # Get chunking configuration
-        chunk_size, overlap = get_chunk_config()
+        operation = job.operation
+        file_path = job.file_path
+        document_content = job.document
+        # Content is no longer needed once chunk documents exist
+        job.document = None
 
-        # Split content into chunks
-        content_chunks = chunk_text(document_content.content, chunk_size, overlap)
-        total_chunks = len(content_chunks)
+        if isinstance(document_content, DocumentBlocks):
+            # Text length is unknown until read; the file size is close enough for progress
+            blocks, text_length = document_content.blocks, operation.file_size or 0
+        else:
+            blocks, text_length = (document_content.content,), len(document_content.content)
 
-        logger.info(f"Indexing {file_path} as {total_chunks} chunk(s)")
+        # Get the configured chunking strategy
+        chunker = get_chunker()
+        estimated_chunks = chunker.estimate_chunks(text_length)
 
-        # Index each chunk with complete metadata
-        for chunk_index, chunk_content in enumerate(content_chunks):
+        # Build every chunk document with complete metadata
+        embedding_context = None
+        for chunk_index, chunk_content in enumerate(chunker.chunk(blocks)):
             if progress_callback:
-                progress_callback(chunk_index, total_chunks)
+                progress_callback(chunk_index, max(estimated_chunks, chunk_index + 1))
 
-            chunk_hash = generate_chunk_hash(file_path, chunk_index, chunk_content)
-
-            # All chunks get complete metadata
-            self.typesense.index_file(
+            document = self.typesense.build_chunk_document(
                 file_path=file_path,
                 content=chunk_content,
                 chunk_index=chunk_index,
-                chunk_total=total_chunks,
-                chunk_hash=chunk_hash,
+                chunk_total=0,  # Known once every chunk is built
+                chunk_hash="",
                 file_extension=Path(file_path).suffix.lower(),
                 file_size=operation.file_size,
                 mime_type=document_content.metadata.get("mime_type") or "application/octet-stream",
                 modified_time=int(operation.modified_time) if operation.modified_time is not None else 0,
                 created_time=int(operation.created_time) if operation.created_time is not None else 0,
-                file_hash=file_hash,
+                file_hash=job.file_hash,
                 metadata=document_content.metadata,
             )
+            if embedding_context is None:
+                embedding_context = self._embedding_context(document)
+            document["chunk_hash"] = generate_chunk_hash(file_path, chunk_index, chunk_content, embedding_context)
+            job.documents.append(document)
+
+        total_chunks = len(job.documents)
+        for document in job.documents:
+            document["chunk_total"] = total_chunks
+        logger.info(f"Indexing {file_path} as {total_chunks} chunk(s)")
+
+    def upsert(self, jobs: List[FileJob]) -> None:
+        """
+        Stage 4: upsert the chunk documents of one or more files in bulk.
+
+        Chunks are diffed against the indexed chunk hashes: only new or changed
+        chunks are upserted (and embedded), unchanged ones get a metadata-only
+        update, and chunks past the new chunk count are deleted.
+
+        Each job succeeds only if all of its chunks were accepted.
+        """
+        indexed_hashes = self._get_indexed_chunk_hashes([job.file_path for job in jobs if job.documents])
+
+        changed: List[Dict[str, Any]] = []
+        unchanged: List[Dict[str, Any]] = []
+        stale_ids: List[str] = []
+        for job in jobs:
+            indexed = indexed_hashes.get(job.file_path, {})
+            for document in job.documents:
+                if indexed.get(document["chunk_index"]) == document["chunk_hash"]:
+                    unchanged.append(self.typesense.metadata_update(document))
+                else:
+                    changed.append(document)
+            stale_ids.extend(
+                self.typesense.generate_doc_id(job.file_path, index) for index in indexed if index >= len(job.documents)
+            )
+
+        failed_paths = set()
+        for documents, action in ((changed, "upsert"), (unchanged, "update")):
+            if documents:
+                result = self.typesense.index_chunks(documents, action=action)
+                failed_paths.update(error["file_path"] for error in result["errors"])
+
+        if stale_ids:
+            try:
+                self.typesense.remove_chunks(stale_ids)
+            except Exception as e:
+                logger.warning(f"Failed to remove {len(stale_ids)} stale chunk(s): {e}")
+
+        if unchanged or stale_ids:
+            logger.debug(
+                f"Upserted {len(changed)} changed chunk(s), refreshed {len(unchanged)} unchanged, "
+                f"removed {len(stale_ids)} stale"
+            )
+
+        indexed = []
+        facts = []
+        for job in jobs:
+            if job.file_path in failed_paths:
+                logger.warning(f"Failed to index chunk(s) of {job.file_path}")
+                job.result = False
+            else:
+                job.result = True
+                if job.signature:
+                    indexed.append((job.file_path, job.signature, job.file_hash))
+                if job.documents:
+                    facts.append(IndexedFileFacts.from_document(job.documents[0]))
+            job.documents = []
+
+        self.catalog.record(indexed)
+        self.index_stats.record(facts)
+
+    def _get_indexed_chunk_hashes(self, file_paths: List[str]) -> Dict[str, Dict[int, str]]:
+        """Indexed chunk hashes of the files; empty (so every chunk is upserted) if the lookup fails."""
+        if not file_paths:
+            return {}
+        try:
+            return self.typesense.get_chunk_hashes(file_paths)
+        except Exception as e:
+            logger.warning(f"Failed to read indexed chunk hashes, upserting every chunk: {e}")
+            return {}
 
-        return True
+    @staticmethod
+    def _embedding_context(document: Dict[str, Any]) -> str:
+        """Embedded fields other than the content, as part of each chunk hash."""
+        return json.dumps(
+            [document.get(field) for field in EMBEDDING_SOURCE_FIELDS if field != "content"], ensure_ascii=False
+        )
 
     def _handle_delete_operation(self, operation: CrawlOperation) -> bool:
         try:
             self.typesense.remove_from_index(operation.file_path)
+            self.catalog.forget([operation.file_path])
+            self.index_stats.forget([operation.file_path])
             return True
         except Exception as e:
             logger.error(f"Error deleting {operation.file_path} from index: {e}")
@@ -128,13 +329,9 @@ class FileIndexer:
         return True, "File is accessible"
 
     def _calculate_file_hash(self, file_path: str) -> str:
-        """Calculate MD5 hash of file (runs in current thread)."""
+        """Calculate the tagged content hash of file (runs in current thread)."""
         try:
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            return hash_file(file_path)
         except Exception as e:
             logger.error(f"Error calculating file hash for {file_path}: {e}")
             return ""
@@ -2,22 +2,30 @@
 Crawl Job Manager - coordinates discovery and indexing
 """
 
+import os
 import threading
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
-from smart_search.api.models.operations import CrawlOperation
+from smart_search.api.models.operations import CrawlOperation, OperationType
+from smart_search.core.config import settings
 from smart_search.core.logging import logger
+from smart_search.core.paths import app_paths
 from smart_search.core.telemetry import telemetry
 from smart_search.database.models import WatchPath, db_session
-from smart_search.database.repositories import CrawlerStateRepository
+from smart_search.database.repositories import CrawlerStateRepository, SettingsRepository
+from smart_search.services.crawler.catalog import get_file_catalog
 from smart_search.services.crawler.discoverer import FileDiscoverer
-from smart_search.services.crawler.indexer import FileIndexer
+from smart_search.services.crawler.indexer import FileIndexer, FileJob
 from smart_search.services.crawler.monitor import FileMonitorService
+from smart_search.services.crawler.persistent_queue import PersistentDedupQueue
+from smart_search.services.crawler.pipeline import IndexingPipeline
 from smart_search.services.crawler.progress import CrawlProgressTracker
 from smart_search.services.crawler.queue import DedupQueue
+from smart_search.services.crawler.snapshots import get_directory_snapshot_store
 from smart_search.services.crawler.verification import IndexVerifier
+from smart_search.services.events import TOPIC_CRAWL_STATUS, get_event_bus
 from smart_search.services.typesense_client import get_typesense_client
 
 
@@ -31,13 +39,18 @@ class CrawlJobManager:
         self.discoverer = FileDiscoverer(self.watch_paths)
         self.indexer = FileIndexer()
         self.verifier = IndexVerifier()
-        self.queue = DedupQueue[CrawlOperation]()  # Shared queue
+        self.queue = self._create_queue()  # Shared queue
         self.monitor = FileMonitorService(self.queue)  # Pass queue to monitor
         self._stop_event = threading.Event()
         self._running = False
 
-        # Background indexing thread
-        self._indexing_thread: threading.Thread | None = None
+        # Directories holding files that failed to index during the current crawl
+        self._failed_dirs: Set[str] = set()
+
+        # Staged indexing pipeline, fed from the shared queue by a dispatcher thread
+        self.pipeline: Optional[IndexingPipeline] = None
+        self._dispatch_thread: threading.Thread | None = None
+        self._pipeline_lock = threading.Lock()
 
         # Progress tracking
         self.tracker = CrawlProgressTracker()
@@ -49,6 +62,25 @@ class CrawlJobManager:
         # Restore monitoring state on init
         self._restore_monitoring_state()
 
+        # Resume operations left pending by the previous run
+        if self.queue.qsize() > 0:
+            logger.info(f"Resuming {self.queue.qsize()} pending operation(s) from the previous run")
+            self._ensure_indexing_workers()
+
+    @staticmethod
+    def _create_queue() -> DedupQueue[CrawlOperation]:
+        """Shared operation queue, kept on disk unless persistence is disabled or unavailable."""
+        if settings.persistent_queue:
+            try:
+                return PersistentDedupQueue[CrawlOperation](
+                    app_paths.crawl_queue_file,
+                    serialize=lambda operation: operation.model_dump_json(),
+                    deserialize=CrawlOperation.model_validate_json,
+                )
+            except Exception as e:
+                logger.warning(f"Persistent crawl queue unavailable, using an in-memory queue: {e}")
+        return DedupQueue[CrawlOperation]()
+
     def _restore_monitoring_state(self):
         """Check DB and restart monitor if it was active"""
         with db_session() as db:
@@ -88,11 +120,12 @@ class CrawlJobManager:
 
             # Ensure consistency even in idle state
             files_indexed = state.files_indexed or 0
-            files_discovered = max(state.files_discovered or 0, files_indexed)
+            files_skipped = state.files_skipped or 0
+            files_discovered = max(state.files_discovered or 0, files_indexed + files_skipped)
 
             indexing_progress = 0
             if files_discovered > 0:
-                indexing_progress = int((files_indexed / files_discovered) * 100)
+                indexing_progress = int(((files_indexed + files_skipped) / files_discovered) * 100)
 
             return {
                 "running": False,
@@ -105,7 +138,7 @@ class CrawlJobManager:
                 "verification_progress": 0,
                 "files_discovered": files_discovered,
                 "files_indexed": files_indexed,
-                "files_skipped": 0,
+                "files_skipped": files_skipped,
                 "queue_size": 0,
                 "monitoring_active": state.monitoring_active or False,
                 "estimated_completion": None,
@@ -133,12 +166,15 @@ class CrawlJobManager:
 
         # Indexing progress
         files_indexed = self.indexing_progress.files_indexed
+        # Files skipped by the discoverer (unchanged per the file catalog) count as done
+        self.discovery_progress.files_skipped = self.discoverer.files_skipped
+        files_skipped = self.discovery_progress.files_skipped
         # Use discoverer.files_found as the source of truth for discovered files
         # Do NOT include files_to_index as it includes monitor events
         total_known = max(
             self.discoverer.files_found,
             self.discovery_progress.files_found,
-            files_indexed,  # Ensure we never show less discovered than indexed
+            files_indexed + files_skipped,  # Ensure we never show less discovered than indexed
         )
 
         indexing_pct = self.tracker.get_indexing_percent(total_known)
@@ -161,32 +197,73 @@ class CrawlJobManager:
             "verification_progress": verification_pct,
             "files_discovered": total_known,
             "files_indexed": files_indexed,
-            "files_skipped": self.discovery_progress.files_skipped,
-            "queue_size": max(0, total_known - files_indexed),
+            "files_skipped": files_skipped,
+            "queue_size": max(0, total_known - files_indexed - files_skipped),
+            "active_workers": len(self.indexing_progress.get_current_files()),
             "monitoring_active": self.monitor.is_running(),
             "estimated_completion": None,
             "orphan_count": self.verification_progress.orphaned_count,
         }
 
-    def _ensure_indexing_thread(self):
-        """Ensure indexing thread is running."""
-        if self._indexing_thread is None or not self._indexing_thread.is_alive():
-            logger.info("Starting indexing worker thread")
-            self._indexing_thread = threading.Thread(target=self._process_queue, daemon=True, name="indexing_worker")
-            self._indexing_thread.start()
+    def _get_worker_count(self) -> int:
+        """Configured size of the indexing worker pool (DB setting overrides env config)."""
+        try:
+            with db_session() as db:
+                count = SettingsRepository(db).get_int("indexing_workers", settings.indexing_workers)
+        except Exception as e:
+            logger.warning(f"Failed to read indexing_workers setting: {e}")
+            count = settings.indexing_workers
+        return max(1, count)
+
+    def _ensure_indexing_workers(self):
+        """Ensure the indexing pipeline and its dispatcher are running with the configured worker count."""
+        with self._pipeline_lock:
+            worker_count = self._get_worker_count()
+            if self.pipeline is None:
+                logger.info(f"Starting indexing pipeline with {worker_count} extraction worker(s)")
+                self.pipeline = IndexingPipeline(
+                    self.indexer,
+                    on_complete=self._on_file_complete,
+                    on_start=lambda worker, job: self.indexing_progress.start_file(worker, job.file_path),
+                    on_chunk=lambda worker, index, total: self.indexing_progress.update_chunk(worker, index, total),
+                    on_finish=lambda worker: self.indexing_progress.finish_file(worker),
+                    extract_workers=worker_count,
+                )
+            else:
+                self.pipeline.set_extract_workers(worker_count)
+
+            if self._dispatch_thread is None or not self._dispatch_thread.is_alive():
+                logger.info("Starting indexing dispatcher thread")
+                self._dispatch_thread = threading.Thread(
+                    target=self._process_queue, daemon=True, name="indexing_worker"
+                )
+                self._dispatch_thread.start()
+
+    def apply_worker_settings(self):
+        """Resize a running indexing pipeline after the indexing_workers setting changed."""
+        if self.pipeline is not None:
+            self._ensure_indexing_workers()
+
+    def get_pipeline_stats(self) -> List[Dict[str, Any]]:
+        """Per-stage queue depth and throughput of the indexing pipeline."""
+        if self.pipeline is None:
+            return []
+        return self.pipeline.get_stats()
 
     def start_crawl(self) -> bool:
         if self._running:
             logger.warning("Crawl job already running.")
             return False
 
-        # Ensure indexing thread is running
-        self._ensure_indexing_thread()
+        # Ensure indexing workers are running
+        self._ensure_indexing_workers()
 
         self._running = True
         self._stop_event.clear()
         self._start_time = datetime.utcnow()
 
+        self._failed_dirs = set()
+
         # Reset component stop events
         self.discoverer.reset()
         self.indexer.reset()
@@ -218,13 +295,19 @@ class CrawlJobManager:
         # Run in background thread
         crawl_thread = threading.Thread(target=self._run_crawl, daemon=True, name="crawl_worker")
         crawl_thread.start()
+        get_event_bus().publish(TOPIC_CRAWL_STATUS)
         return True
 
     def _process_queue(self):
         """
-        Persistent worker that processes operations from the shared queue.
+        Persistent dispatcher that feeds operations from the shared queue into the pipeline.
+
+        Submitting blocks while the pipeline's first stage is full, so the shared
+        queue keeps absorbing (and deduplicating) operations under backpressure.
+        The queue serves a path again only after task_done(path) for its previous
+        operation, so a path is never in the pipeline twice at once.
         """
-        logger.info("Indexing worker started")
+        logger.info("Indexing dispatcher started")
         while True:
             try:
                 operation = self.queue.get()
@@ -233,31 +316,81 @@ class CrawlJobManager:
                 # but currently we run forever until app stop.
                 # If we want to support graceful shutdown we can check for None.
 
-                self.indexing_progress.files_to_index += 1
+                self.indexing_progress.increment("files_to_index")
+                try:
+                    self.pipeline.submit(operation)
+                except Exception:
+                    self.indexing_progress.increment("files_failed")
+                    self.queue.task_done(operation.file_path)
+                    raise
 
-                def progress_cb(chunk_idx, chunk_total):
-                    self.indexing_progress.current_chunk_index = chunk_idx
-                    self.indexing_progress.current_chunk_total = chunk_total
+            except Exception as e:
+                logger.error(f"Error in indexing dispatcher: {e}")
+                time.sleep(1)  # Prevent tight loop on error
+
+    def _on_file_complete(self, job: FileJob):
+        """Pipeline callback: a file finished (indexed, skipped or failed)."""
+        indexing_progress = self.indexing_progress
+        if job.result:
+            files_indexed = indexing_progress.increment("files_indexed")
+            # Track file indexed (batched)
+            telemetry.track_batched_event("file_indexed")
+        else:
+            files_indexed = indexing_progress.files_indexed
+            indexing_progress.increment("files_failed")
+            self._failed_dirs.add(os.path.dirname(job.file_path))
+
+        self.queue.task_done(job.file_path)
+
+        # Periodically update DB
+        if job.result and files_indexed % 20 == 0:
+            self._update_db_progress()
+
+    def _requeue_drifted(self, file_paths: List[str]):
+        """
+        Re-index files that changed since they were indexed.
 
-                # Process the operation
-                success = self.indexer.index_file(operation, progress_callback=progress_cb)
+        Their catalog entries and directory snapshots are dropped, so the
+        discovery phase of a running crawl yields them. Outside a crawl they
+        are queued for indexing directly.
+        """
+        get_file_catalog().forget(file_paths)
+        get_directory_snapshot_store().invalidate({os.path.dirname(path) for path in file_paths})
 
-                if success:
-                    self.indexing_progress.files_indexed += 1
-                    # Track file indexed (batched)
-                    telemetry.track_batched_event("file_indexed")
-                else:
-                    self.indexing_progress.files_failed += 1
+        if self._running:
+            return
 
-                self.queue.task_done()
+        self._ensure_indexing_workers()
+        for file_path in file_paths:
+            try:
+                stats = os.stat(file_path)
+            except OSError as e:
+                logger.warning(f"Failed to stat drifted file {file_path}: {e}")
+                continue
+            operation = CrawlOperation(
+                operation=OperationType.EDIT,
+                file_path=file_path,
+                file_size=stats.st_size,
+                modified_time=int(stats.st_mtime * 1000),
+                created_time=int(stats.st_ctime * 1000),
+                source="crawl",
+            )
+            self.queue.put(file_path, operation)
 
-                # Periodically update DB
-                if self.indexing_progress.files_indexed % 20 == 0:
-                    self._update_db_progress()
+    def verify_index(self) -> Dict[str, int]:
+        """Run index verification outside a crawl; drifted files are queued for indexing."""
+        self.verifier.reset()
+        self.verification_progress = self.verifier.progress
+        self.verifier.verify_index(on_drift=self._requeue_drifted)
 
-            except Exception as e:
-                logger.error(f"Error in indexing worker: {e}")
-                time.sleep(1)  # Prevent tight loop on error
+        progress = self.verifier.progress
+        return {
+            "total_indexed": progress.total_indexed,
+            "processed": progress.processed_count,
+            "orphaned": progress.orphaned_count,
+            "drifted": progress.drifted_count,
+            "errors": progress.verification_errors,
+        }
 
     def _run_crawl(self):
         """Run discovery and fill the shared queue"""
@@ -265,7 +398,7 @@ class CrawlJobManager:
         # Phase 1: Verify Index
         try:
             logger.info("Starting index verification phase...")
-            self.verifier.verify_index()
+            self.verifier.verify_index(on_drift=self._requeue_drifted)
             logger.info("Index verification phase completed.")
         except Exception as e:
             logger.error(f"Index verification failed: {e}")
@@ -273,6 +406,7 @@ class CrawlJobManager:
 
         if self._stop_event.is_set():
             self._running = False
+            get_event_bus().publish(TOPIC_CRAWL_STATUS)
             return
 
         # Phase 2: Discovery
@@ -303,6 +437,8 @@ class CrawlJobManager:
                 # Note: files_found might be > processed if queue is not empty
                 if self.queue.qsize() == 0 and total_processed >= self.discovery_progress.files_found:
                     logger.info("Indexing job completed (queue empty and all files processed)")
+                    # Only a completed crawl leaves a trustworthy directory snapshot
+                    self.discoverer.save_snapshot(exclude_dirs=self._failed_dirs)
                     break
 
                 time.sleep(1)
@@ -338,7 +474,9 @@ class CrawlJobManager:
                     indexing_progress=final_status["indexing_progress"],
                     files_discovered=final_status["files_discovered"],
                     files_indexed=final_status["files_indexed"],
+                    files_skipped=final_status["files_skipped"],
                 )
+            get_event_bus().publish(TOPIC_CRAWL_STATUS)
 
     def _update_db_progress(self):
         with db_session() as db:
@@ -349,6 +487,7 @@ class CrawlJobManager:
                 indexing_progress=int(status["indexing_progress"]),
                 files_discovered=status["files_discovered"],
                 files_indexed=status["files_indexed"],
+                files_skipped=status["files_skipped"],
             )
 
     def stop_crawl(self):
@@ -370,6 +509,7 @@ class CrawlJobManager:
             # 1. Reset search collection (drop and recreate with latest schema)
             typesense = get_typesense_client()
             logger.info("Dropping and recreating Typesense collection with latest schema...")
+            # Also clears the file catalog, directory snapshots and index statistics
             typesense.reset_collection()
 
             with db_session() as db:
@@ -378,6 +518,7 @@ class CrawlJobManager:
                 state_repo.reset_stats()
 
                 logger.info("✅ Collection reset and statistics cleared")
+            get_event_bus().publish(TOPIC_CRAWL_STATUS)
             return True
         except Exception as e:
             logger.error(f"Error resetting collection: {e}")
@@ -387,8 +528,8 @@ class CrawlJobManager:
         """Start file monitoring"""
         logger.info("Starting file monitoring...")
 
-        # Ensure indexing thread is running to process monitored file events
-        self._ensure_indexing_thread()
+        # Ensure indexing workers are running to process monitored file events
+        self._ensure_indexing_workers()
 
         # Get enabled paths
         if not self.watch_paths:
@@ -414,12 +555,19 @@ class CrawlJobManager:
             with db_session() as db:
                 repo = CrawlerStateRepository(db)
                 repo.update_state(monitoring_active=True)
+            get_event_bus().publish(TOPIC_CRAWL_STATUS)
 
             return True
         except Exception as e:
             logger.error(f"Failed to start monitoring: {e}")
             return False
 
+    def shutdown(self):
+        """Stop the crawl and commit pending queue changes to disk."""
+        self.stop_crawl()
+        if isinstance(self.queue, PersistentDedupQueue):
+            self.queue.close()
+
     def stop_monitoring(self):
         """Stop file monitoring"""
         logger.info("Stopping file monitoring...")
@@ -433,6 +581,7 @@ class CrawlJobManager:
             with db_session() as db:
                 repo = CrawlerStateRepository(db)
                 repo.update_state(monitoring_active=False)
+            get_event_bus().publish(TOPIC_CRAWL_STATUS)
         except Exception as e:
             logger.error(f"Failed to stop monitoring: {e}")
 
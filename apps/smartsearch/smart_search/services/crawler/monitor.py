@@ -16,7 +16,7 @@ from watchdog.events import (
 )
 from watchdog.observers import Observer
 
-from smart_search.api.models.operations import CrawlOperation, OperationType
+from smart_search.api.models.operations import PRIORITY_DELETE, PRIORITY_WATCH, CrawlOperation, OperationType
 from smart_search.core.logging import logger
 from smart_search.database.models import WatchPath
 from smart_search.services.crawler.path_utils import PathFilter
@@ -61,14 +61,18 @@ class FileEventHandler(FileSystemEventHandler):
 
         try:
             if event_type == "deleted":
-                operation = CrawlOperation(operation=OperationType.DELETE, file_path=file_path, source="watch")
+                operation = CrawlOperation(
+                    operation=OperationType.DELETE, file_path=file_path, source="watch", priority=PRIORITY_DELETE
+                )
                 self.queue.put(file_path, operation)
             else:
                 target_path = file_path
                 if isinstance(event, FileMovedEvent):
                     target_path = event.dest_path
                     # Also handle the old path as delete
-                    old_path_op = CrawlOperation(operation=OperationType.DELETE, file_path=file_path, source="watch")
+                    old_path_op = CrawlOperation(
+                        operation=OperationType.DELETE, file_path=file_path, source="watch", priority=PRIORITY_DELETE
+                    )
                     self.queue.put(file_path, old_path_op)
 
                 if os.path.exists(target_path):
@@ -91,6 +95,7 @@ class FileEventHandler(FileSystemEventHandler):
                             modified_time=int(stat.st_mtime * 1000),
                             created_time=int(stat.st_ctime * 1000),
                             source="watch",
+                            priority=PRIORITY_WATCH,
                         )
                         self.queue.put(target_path, operation)
                     except Exception as e:
@@ -0,0 +1,176 @@
+"""
+Disk-backed crawl queue
+
+A DedupQueue whose pending items are mirrored to a SQLite table in WAL mode,
+so operations queued before a restart are picked up again instead of being
+rediscovered by a new crawl.
+
+Items stay in memory for serving; every put and acknowledgement is appended
+to a write buffer that a background thread commits in batches. A row is only
+deleted once its item has been processed (task_done with its key), so items
+in flight at a crash are served again. A crash loses at most the changes of
+the last flush interval.
+
+The queue uses its own database file rather than the application database:
+enqueueing runs at the discoverer's file rate and must not contend with the
+ORM sessions of the API and the indexer.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+from smart_search.core.config import settings
+from smart_search.core.logging import logger
+from smart_search.services.crawler.queue import DedupQueue
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pending_operations (
+    key TEXT PRIMARY KEY,
+    item TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    arrival INTEGER NOT NULL
+)
+"""
+
+# A replaced row keeps its arrival position, so a restored queue keeps its order
+_UPSERT = """
+INSERT INTO pending_operations (key, item, priority, version, arrival) VALUES (?, ?, ?, ?, ?4)
+ON CONFLICT(key) DO UPDATE SET item = excluded.item, priority = excluded.priority, version = excluded.version
+"""
+
+# Only removes the row if it was not replaced after the acknowledged item was taken
+_DELETE = "DELETE FROM pending_operations WHERE key = ? AND version <= ?"
+
+
+class PersistentDedupQueue(DedupQueue[T]):
+    """
+    DedupQueue that keeps pending items in a SQLite file across restarts.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        serialize: Callable[[T], str],
+        deserialize: Callable[[str], T],
+        batch_size: Optional[int] = None,
+        flush_interval_ms: Optional[int] = None,
+    ):
+        super().__init__()
+        self._serialize = serialize
+        self._deserialize = deserialize
+        self._batch_size = max(1, batch_size or settings.persistent_queue_batch_size)
+        self._flush_interval = max(1, flush_interval_ms or settings.persistent_queue_flush_interval_ms) / 1000
+
+        # Latest written version per key, and versions of items taken but not yet acknowledged
+        self._version = 0
+        self._versions: Dict[str, int] = {}
+        self._in_flight: Dict[str, List[int]] = {}
+
+        # Buffered changes, committed by the writer thread
+        self._upserts: List[Tuple[str, str, int, int]] = []
+        self._deletes: List[Tuple[str, int]] = []
+        self._write_lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._restore()
+
+        self._closed = threading.Event()
+        self._wake = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True, name="crawl_queue_writer")
+        self._writer.start()
+
+    def _restore(self) -> None:
+        """Load the items left pending by the previous run."""
+        rows = self._conn.execute(
+            "SELECT key, item, priority, version FROM pending_operations ORDER BY arrival"
+        ).fetchall()
+        stale: List[Tuple[str, int]] = []
+        with self._lock:
+            for key, payload, priority, version in rows:
+                try:
+                    item = self._deserialize(payload)
+                except Exception as e:
+                    logger.warning(f"Dropping unreadable queued operation for {key}: {e}")
+                    stale.append((key, version))
+                    continue
+                self._enqueue(key, item, priority)
+                self._versions[key] = version
+                self._version = max(self._version, version)
+        if stale:
+            self._conn.executemany(_DELETE, stale)
+        if self._items:
+            logger.info(f"Restored {len(self._items)} pending operation(s) from the crawl queue")
+
+    def _on_put(self, key: str, item: T, priority: int) -> None:
+        self._version += 1
+        self._versions[key] = self._version
+        self._upserts.append((key, self._serialize(item), priority, self._version))
+        if len(self._upserts) >= self._batch_size:
+            self._wake.set()
+
+    def _on_get(self, key: str) -> None:
+        self._in_flight.setdefault(key, []).append(self._versions[key])
+
+    def task_done(self, key: Optional[str] = None):
+        """
+        Mark a previously fetched item as processed and drop it from disk.
+
+        Args:
+            key: Key of the processed item; without it the item stays on disk and is served again after a restart
+        """
+        super().task_done(key)
+        if key is None:
+            return
+        with self._lock:
+            versions = self._in_flight.get(key)
+            if not versions:
+                return
+            version = versions.pop(0)
+            if not versions:
+                del self._in_flight[key]
+            if self._versions.get(key) == version and key not in self._items:
+                del self._versions[key]
+            self._deletes.append((key, version))
+
+    def flush(self) -> None:
+        """Commit all buffered changes."""
+        with self._write_lock:
+            with self._lock:
+                upserts, self._upserts = self._upserts, []
+                deletes, self._deletes = self._deletes, []
+            if not upserts and not deletes:
+                return
+            try:
+                self._conn.execute("BEGIN")
+                # Upserts first: a delete never removes a newer version of its key
+                self._conn.executemany(_UPSERT, upserts)
+                self._conn.executemany(_DELETE, deletes)
+                self._conn.execute("COMMIT")
+            except Exception as e:
+                logger.warning(f"Failed to persist {len(upserts) + len(deletes)} crawl queue change(s): {e}")
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+
+    def _write_loop(self) -> None:
+        while not self._closed.is_set():
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the writer and commit outstanding changes."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._wake.set()
+        self._writer.join(timeout=5.0)
+        self.flush()
+        self._conn.close()
@@ -0,0 +1,262 @@
+"""
+Staged indexing pipeline
+
+Splits FileIndexer work into stages connected by bounded queues:
+
+    prepare (stat/hash) -> extract (ContentExtractor) -> chunk -> upsert (bulk import)
+
+Each stage has its own worker threads, so disk-bound hashing, Tika-bound
+extraction and Typesense-bound upserts overlap. A full queue blocks the stage
+feeding it (backpressure), which keeps the number of files held in memory bounded.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+from smart_search.api.models.operations import CrawlOperation
+from smart_search.core.config import settings
+from smart_search.core.logging import logger
+from smart_search.services.crawler.indexer import FileIndexer, FileJob
+
+# Window used to compute per-stage throughput
+THROUGHPUT_WINDOW_SECONDS = 10.0
+
+
+class PipelineStage:
+    """
+    One pipeline stage: an input queue and the worker threads consuming it.
+    """
+
+    def __init__(self, name: str, workers: int, queue_size: int, handler: Callable[[str, Any], None]):
+        self.name = name
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._handler = handler
+        self._worker_count = 0
+        self._threads: Dict[int, threading.Thread] = {}
+        self._lock = threading.Lock()
+
+        # Stats
+        self.processed = 0
+        self.busy_workers = 0
+        self._completions: deque = deque()
+
+        self.set_workers(workers)
+
+    def set_workers(self, count: int) -> None:
+        """Start missing workers; surplus workers retire after their current item."""
+        with self._lock:
+            self._worker_count = max(1, count)
+            for worker_index in range(self._worker_count):
+                thread = self._threads.get(worker_index)
+                if thread is None or not thread.is_alive():
+                    thread = threading.Thread(
+                        target=self._run,
+                        args=(worker_index,),
+                        daemon=True,
+                        name=f"pipeline_{self.name}_{worker_index}",
+                    )
+                    self._threads[worker_index] = thread
+                    thread.start()
+
+    def put(self, item: Any) -> None:
+        """Enqueue an item, blocking while the stage is saturated."""
+        self.queue.put(item)
+
+    def _run(self, worker_index: int) -> None:
+        worker_name = threading.current_thread().name
+        while True:
+            item = self.queue.get()
+            with self._lock:
+                self.busy_workers += 1
+            try:
+                self._handler(worker_name, item)
+            except Exception as e:
+                logger.error(f"Error in pipeline stage '{self.name}': {e}")
+            finally:
+                with self._lock:
+                    self.busy_workers -= 1
+                self.queue.task_done()
+
+            if worker_index >= self._worker_count:
+                with self._lock:
+                    if self._threads.get(worker_index) is threading.current_thread():
+                        del self._threads[worker_index]
+                return
+
+    def record_processed(self, count: int = 1) -> None:
+        """Count items that left this stage (used for throughput)."""
+        now = time.monotonic()
+        with self._lock:
+            self.processed += count
+            self._completions.append((now, count))
+            while self._completions and now - self._completions[0][0] > THROUGHPUT_WINDOW_SECONDS:
+                self._completions.popleft()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, worker usage and throughput of this stage."""
+        now = time.monotonic()
+        with self._lock:
+            recent = sum(count for ts, count in self._completions if now - ts <= THROUGHPUT_WINDOW_SECONDS)
+            return {
+                "stage": self.name,
+                "workers": self._worker_count,
+                "busy_workers": self.busy_workers,
+                "queue_depth": self.queue.qsize(),
+                "queue_capacity": self.queue.maxsize,
+                "processed": self.processed,
+                "throughput_per_second": round(recent / THROUGHPUT_WINDOW_SECONDS, 2),
+            }
+
+
+class IndexingPipeline:
+    """
+    Runs FileIndexer stages concurrently with bounded queues between them.
+
+    Callbacks (all optional, called from worker threads):
+    - on_start(worker, job): a stage worker picked up a file
+    - on_chunk(worker, chunk_index, chunk_total): chunk-level progress
+    - on_finish(worker): a stage worker is done with its current file
+    - on_complete(job): the file left the pipeline; job.result holds the outcome
+    """
+
+    def __init__(
+        self,
+        indexer: FileIndexer,
+        on_complete: Callable[[FileJob], None],
+        on_start: Optional[Callable[[str, FileJob], None]] = None,
+        on_chunk: Optional[Callable[[str, int, int], None]] = None,
+        on_finish: Optional[Callable[[str], None]] = None,
+        extract_workers: Optional[int] = None,
+    ):
+        self.indexer = indexer
+        self._on_complete = on_complete
+        self._on_start = on_start or (lambda worker, job: None)
+        self._on_chunk = on_chunk or (lambda worker, index, total: None)
+        self._on_finish = on_finish or (lambda worker: None)
+
+        queue_size = settings.pipeline_queue_size
+        # Created downstream-first so every stage can hand off to the next one
+        self.upsert_stage = PipelineStage("upsert", settings.pipeline_upsert_workers, queue_size, self._upsert)
+        self.chunk_stage = PipelineStage("chunk", settings.pipeline_chunk_workers, queue_size, self._chunk)
+        self.extract_stage = PipelineStage(
+            "extract", extract_workers or settings.indexing_workers, queue_size, self._extract
+        )
+        self.prepare_stage = PipelineStage("prepare", settings.pipeline_prepare_workers, queue_size, self._prepare)
+        self.stages: List[PipelineStage] = [
+            self.prepare_stage,
+            self.extract_stage,
+            self.chunk_stage,
+            self.upsert_stage,
+        ]
+
+    def submit(self, operation: CrawlOperation) -> None:
+        """Feed an operation into the pipeline (blocks while the first stage is full)."""
+        self.prepare_stage.put(operation)
+
+    def set_extract_workers(self, count: int) -> None:
+        """Resize the extraction stage (the usual bottleneck)."""
+        self.extract_stage.set_workers(count)
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """Per-stage stats, in pipeline order."""
+        return [stage.get_stats() for stage in self.stages]
+
+    def in_flight(self) -> int:
+        """Number of items queued or being processed in any stage."""
+        return sum(stage.queue.unfinished_tasks for stage in self.stages)
+
+    def _complete(self, job: FileJob) -> None:
+        if job.result is None:
+            job.result = False
+        try:
+            self._on_complete(job)
+        except Exception as e:
+            logger.error(f"Error completing {job.file_path}: {e}")
+
+    def _handoff(self, stage: PipelineStage, job: FileJob, next_stage: Optional[PipelineStage]) -> None:
+        stage.record_processed()
+        if job.done or next_stage is None:
+            self._complete(job)
+        else:
+            next_stage.put(job)
+
+    def _prepare(self, worker: str, operation: CrawlOperation) -> None:
+        job = FileJob(operation=operation)
+        self._on_start(worker, job)
+        try:
+            job = self.indexer.prepare(operation)
+        except Exception as e:
+            logger.error(f"Error preparing {operation.file_path}: {e}")
+            job.result = False
+        finally:
+            self._on_finish(worker)
+        self._handoff(self.prepare_stage, job, self.extract_stage)
+
+    def _extract(self, worker: str, job: FileJob) -> None:
+        self._on_start(worker, job)
+        try:
+            self.indexer.extract(job)
+        except Exception as e:
+            logger.error(f"Error extracting {job.file_path}: {e}")
+            job.result = False
+        finally:
+            self._on_finish(worker)
+        self._handoff(self.extract_stage, job, self.chunk_stage)
+
+    def _chunk(self, worker: str, job: FileJob) -> None:
+        self._on_start(worker, job)
+        try:
+            self.indexer.chunk(job, lambda index, total: self._on_chunk(worker, index, total))
+        except Exception as e:
+            logger.error(f"Error chunking {job.file_path}: {e}")
+            job.result = False
+        finally:
+            self._on_finish(worker)
+        self._handoff(self.chunk_stage, job, self.upsert_stage)
+
+    def _upsert(self, worker: str, job: FileJob) -> None:
+        # Batch small files together: drain already-queued jobs until the
+        # batch holds an import request's worth of chunk documents. A later
+        # job for a path already in the batch supersedes the earlier one, as
+        # their chunk ids would collide in one import.
+        batch: Dict[str, FileJob] = {job.file_path: job}
+        superseded: List[FileJob] = []
+        drained = 0
+        document_count = len(job.documents)
+        while document_count < settings.typesense_import_batch_size:
+            try:
+                next_job = self.upsert_stage.queue.get_nowait()
+            except queue.Empty:
+                break
+            drained += 1
+            previous = batch.pop(next_job.file_path, None)
+            if previous is not None:
+                superseded.append(previous)
+                document_count -= len(previous.documents)
+            batch[next_job.file_path] = next_job
+            document_count += len(next_job.documents)
+        jobs = list(batch.values())
+
+        self._on_start(worker, job)
+        try:
+            self.indexer.upsert(jobs)
+        except Exception as e:
+            logger.error(f"Error upserting batch of {len(jobs)} file(s): {e}")
+            for batch_job in jobs:
+                batch_job.result = False
+        finally:
+            self._on_finish(worker)
+            for batch_job in jobs:
+                self.upsert_stage.record_processed()
+                self._complete(batch_job)
+            # A superseded job shares the outcome of the job that replaced it
+            for stale_job in superseded:
+                stale_job.result = batch[stale_job.file_path].result
+                self.upsert_stage.record_processed()
+                self._complete(stale_job)
+            # Extra jobs were taken off the queue directly; balance task_done
+            for _ in range(drained):
+                self.upsert_stage.queue.task_done()
@@ -5,9 +5,10 @@ Extracted from CrawlJobManager to follow Single Responsibility Principle.
 Tracks progress for discovery, indexing, and verification phases.
 """
 
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -23,17 +24,68 @@ class DiscoveryProgress:
 
 
 @dataclass
-class IndexingProgress:
-    """Progress tracking for file indexing"""
+class WorkerProgress:
+    """Progress of a single indexing worker"""
 
-    files_to_index: int = 0
-    files_indexed: int = 0
-    files_failed: int = 0
     current_file: Optional[str] = None
     # Chunk-level progress
     current_chunk_index: int = 0
     current_chunk_total: int = 0
+
+
+@dataclass
+class IndexingProgress:
+    """
+    Progress tracking for file indexing.
+
+    Updated concurrently by the indexing worker pool: counters must be changed
+    through increment() and per-worker state through the worker helpers.
+    """
+
+    files_to_index: int = 0
+    files_indexed: int = 0
+    files_failed: int = 0
+    workers: Dict[str, WorkerProgress] = field(default_factory=dict)
     start_time: Optional[float] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def increment(self, counter: str, amount: int = 1) -> int:
+        """Atomically increment a counter and return its new value."""
+        with self._lock:
+            value = getattr(self, counter) + amount
+            setattr(self, counter, value)
+            return value
+
+    def start_file(self, worker: str, file_path: str) -> None:
+        """Record the file a worker has started on."""
+        with self._lock:
+            self.workers[worker] = WorkerProgress(current_file=file_path)
+
+    def update_chunk(self, worker: str, chunk_index: int, chunk_total: int) -> None:
+        """Record chunk-level progress of a worker's current file."""
+        with self._lock:
+            progress = self.workers.setdefault(worker, WorkerProgress())
+            progress.current_chunk_index = chunk_index
+            progress.current_chunk_total = chunk_total
+
+    def finish_file(self, worker: str) -> None:
+        """Clear a worker's current file once it is done."""
+        with self._lock:
+            self.workers.pop(worker, None)
+
+    def get_chunk_fraction(self) -> float:
+        """Sum of the completed fraction of every file currently being indexed."""
+        with self._lock:
+            return sum(
+                w.current_chunk_index / w.current_chunk_total
+                for w in self.workers.values()
+                if w.current_chunk_total > 0
+            )
+
+    def get_current_files(self) -> List[str]:
+        """Files currently being indexed, one per busy worker."""
+        with self._lock:
+            return [w.current_file for w in self.workers.values() if w.current_file]
 
 
 @dataclass
@@ -98,23 +150,18 @@ class CrawlProgressTracker:
             discovered_files,
             self.discovery.files_found,
             self.indexing.files_to_index,
-            files_indexed,
+            files_indexed + self.discovery.files_skipped,
         )
 
         if total_known == 0:
             return 0.0
 
-        # Calculate base progress from completed files
-        progress_files = files_indexed
-
-        # Add fractional progress from current file chunks
-        if self.indexing.current_chunk_total > 0:
-            # Chunk index is 0-based, so completed chunks is essentially current_chunk_index
-            # (or maybe current_chunk_index + 1 if we want to show current work)
-            # Let's assume current_chunk_index is the one BEING processed.
-            # So completed is current_chunk_index.
-            chunk_fraction = self.indexing.current_chunk_index / self.indexing.current_chunk_total
-            progress_files += chunk_fraction
+        # Calculate base progress from completed files, plus the fractional
+        # progress of the files currently being chunked/indexed by the workers.
+        # Chunk index is 0-based and refers to the chunk BEING processed,
+        # so completed chunks is current_chunk_index.
+        # Files skipped during discovery (unchanged) are already done.
+        progress_files = files_indexed + self.discovery.files_skipped + self.indexing.get_chunk_fraction()
 
         pct = (progress_files / total_known) * 100
         return round(min(pct, 100.0), 2)
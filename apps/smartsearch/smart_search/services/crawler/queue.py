@@ -1,47 +1,122 @@
-import queue
+import heapq
+import itertools
 import threading
-from typing import Dict, Generic, TypeVar
+from typing import Dict, Generic, List, Optional, Set, Tuple, TypeVar
 
 T = TypeVar("T")
 
+# Heap entry: (negated priority, arrival sequence, key)
+_HeapEntry = Tuple[int, int, str]
+
 
 class DedupQueue(Generic[T]):
     """
-    A thread-safe queue that deduplicates items based on a key.
+    A thread-safe priority queue that deduplicates items based on a key.
     If an item with the same key is already in the queue,
-    the old item is replaced by the new one (LIFO behavior for data, FIFO for processing).
+    the old item is replaced by the new one (LIFO behavior for data).
+
+    Items are served by priority (higher first), then in arrival order, so
+    watch and delete events overtake a long backlog of crawl operations.
+    A replaced item keeps its place unless the new item raises its priority.
+
+    A key taken with get() stays in process until task_done(key): an item
+    queued for it meanwhile is held back, so concurrent consumers never work
+    on the same key at once and operations on a key are applied in order.
     """
 
     def __init__(self):
-        self._queue = queue.Queue()
-        self._items: Dict[str, T] = {}
+        self._heap: List[_HeapEntry] = []
+        # key -> (item, priority, live heap entry)
+        self._items: Dict[str, Tuple[T, int, _HeapEntry]] = {}
+        self._counter = itertools.count()
+        # Keys taken but not acknowledged, and heap entries held back for them
+        self._processing: Set[str] = set()
+        self._held: Dict[str, _HeapEntry] = {}
+        self._unfinished_tasks = 0
         self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
 
-    def put(self, key: str, item: T):
+    def put(self, key: str, item: T, priority: Optional[int] = None):
         """
         Put an item into the queue.
-        If key exists, the item is updated (replaced).
-        We still push the key to the queue if it's not already there.
+        If key exists, the item is updated (replaced) and keeps the higher of both priorities.
+
+        Args:
+            key: Deduplication key
+            item: Item to queue
+            priority: Higher numbers are served first (defaults to item.priority, or 0)
         """
-        with self._lock:
-            is_new = key not in self._items
-            self._items[key] = item
-            if is_new:
-                self._queue.put(key)
+        if priority is None:
+            priority = getattr(item, "priority", 0) or 0
+
+        with self._not_empty:
+            priority = self._enqueue(key, item, priority)
+            self._on_put(key, item, priority)
+
+    def _enqueue(self, key: str, item: T, priority: int) -> int:
+        """Queue or replace an item (lock held); returns its effective priority."""
+        existing = self._items.get(key)
+        if existing is not None and existing[1] >= priority:
+            self._items[key] = (item, existing[1], existing[2])
+            return existing[1]
+
+        # New key, or a raised priority: the previous heap entry (if any) goes stale
+        entry = (-priority, next(self._counter), key)
+        heapq.heappush(self._heap, entry)
+        self._items[key] = (item, priority, entry)
+        if existing is None:
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+        return priority
 
     def get(self) -> T:
         """
-        Get the next item (blocking).
+        Get the highest-priority item (blocking).
         """
-        key = self._queue.get()
+        with self._not_empty:
+            while True:
+                while not self._heap:
+                    self._not_empty.wait()
+                entry = heapq.heappop(self._heap)
+                key = entry[2]
+                current = self._items.get(key)
+                # Skip entries superseded by a priority raise
+                if current is None or current[2] is not entry:
+                    continue
+                if key in self._processing:
+                    # Served again once the previous item for the key is done
+                    self._held[key] = entry
+                    continue
+                del self._items[key]
+                self._processing.add(key)
+                self._on_get(key)
+                return current[0]
 
-        with self._lock:
-            # Pop the item.
-            item = self._items.pop(key)
-            return item
+    def task_done(self, key: Optional[str] = None):
+        """
+        Mark a previously fetched item as processed.
 
-    def task_done(self):
-        self._queue.task_done()
+        Args:
+            key: Key of the processed item; releases an item held back for the same key
+        """
+        with self._lock:
+            if self._unfinished_tasks <= 0:
+                raise ValueError("task_done() called too many times")
+            self._unfinished_tasks -= 1
+            if key is None:
+                return
+            self._processing.discard(key)
+            entry = self._held.pop(key, None)
+            current = self._items.get(key)
+            if entry is not None and current is not None and current[2] is entry:
+                heapq.heappush(self._heap, entry)
+                self._not_empty.notify()
 
     def qsize(self):
         return len(self._items)
+
+    def _on_put(self, key: str, item: T, priority: int) -> None:
+        """Hook called with the lock held after an item was queued or replaced."""
+
+    def _on_get(self, key: str) -> None:
+        """Hook called with the lock held after an item was taken from the queue."""
@@ -0,0 +1,134 @@
+"""
+Directory snapshots for incremental discovery
+
+After a completed crawl, the mtime, file count and subdirectory names of every
+listed directory are persisted. The next crawl does not list a directory whose
+mtime is unchanged: its files are counted as unchanged and its subdirectories
+are taken from the snapshot (each one is still checked by its own mtime).
+
+A directory's mtime only changes when entries are added, removed or renamed,
+not when a file inside is edited in place. Such edits are picked up by the
+file monitor while it runs, and by the full walk forced every
+full_discovery_interval_hours.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Callable, ContextManager, Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from smart_search.core.config import settings
+from smart_search.core.logging import logger
+from smart_search.database.models import db_session
+from smart_search.database.repositories import DirectorySnapshotRepository, SettingsRepository
+
+# Settings key holding the completion time (epoch seconds) of the last full walk
+LAST_FULL_WALK_KEY = "last_full_discovery_at"
+
+
+@dataclass(frozen=True)
+class DirectoryState:
+    """Recorded state of one directory"""
+
+    mtime_ns: int
+    entry_count: int
+    subdirectories: Tuple[str, ...]  # Child directory names
+
+
+class DirectorySnapshotStore:
+    """
+    Loads and saves directory snapshots and tracks when a full walk is due.
+    """
+
+    def __init__(self, session_factory: Callable[[], ContextManager[Session]] = db_session):
+        self._session_factory = session_factory
+
+    def load(self) -> Dict[str, DirectoryState]:
+        """Snapshot of the last completed crawl, keyed by directory path."""
+        try:
+            with self._session_factory() as db:
+                return {
+                    row.path: DirectoryState(
+                        mtime_ns=row.mtime_ns,
+                        entry_count=row.entry_count,
+                        subdirectories=tuple(json.loads(row.subdirectories or "[]")),
+                    )
+                    for row in DirectorySnapshotRepository(db).load_all()
+                }
+        except Exception as e:
+            logger.warning(f"Failed to load directory snapshots: {e}")
+            return {}
+
+    def save(self, states: Dict[str, DirectoryState], full_walk: bool, exclude: Optional[Set[str]] = None) -> None:
+        """
+        Replace the stored snapshot.
+
+        Args:
+            states: Directory states seen by the crawl
+            full_walk: Whether every directory was listed (records the full-walk time)
+            exclude: Directories to leave out so they are listed again (e.g. they held failed files)
+        """
+        exclude = exclude or set()
+        rows = [
+            {
+                "path": path,
+                "mtime_ns": state.mtime_ns,
+                "entry_count": state.entry_count,
+                "subdirectories": json.dumps(list(state.subdirectories)),
+            }
+            for path, state in states.items()
+            if path not in exclude
+        ]
+        try:
+            with self._session_factory() as db:
+                DirectorySnapshotRepository(db).replace_all(rows)
+                if full_walk:
+                    SettingsRepository(db).set(LAST_FULL_WALK_KEY, int(time.time()))
+            logger.info(f"Saved {len(rows)} directory snapshot(s) (full walk: {full_walk})")
+        except Exception as e:
+            logger.warning(f"Failed to save directory snapshots: {e}")
+
+    def invalidate(self, paths: Iterable[str]) -> None:
+        """Forget the given directories so the next crawl lists them."""
+        paths = list(paths)
+        if not paths:
+            return
+        try:
+            with self._session_factory() as db:
+                DirectorySnapshotRepository(db).delete_paths(paths)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate directory snapshots: {e}")
+
+    def clear(self) -> None:
+        """Drop all snapshots, forcing the next crawl to be a full walk."""
+        try:
+            with self._session_factory() as db:
+                DirectorySnapshotRepository(db).clear()
+        except Exception as e:
+            logger.warning(f"Failed to clear directory snapshots: {e}")
+
+    def full_walk_due(self) -> bool:
+        """Whether the next crawl must list every directory."""
+        if not settings.incremental_discovery:
+            return True
+        try:
+            with self._session_factory() as db:
+                last_full_walk = SettingsRepository(db).get_int(LAST_FULL_WALK_KEY, 0)
+        except Exception as e:
+            logger.warning(f"Failed to read last full walk time: {e}")
+            return True
+        return time.time() - last_full_walk >= settings.full_discovery_interval_hours * 3600
+
+
+# Global snapshot store instance
+_store: Optional[DirectorySnapshotStore] = None
+
+
+def get_directory_snapshot_store() -> DirectorySnapshotStore:
+    """Get or create global directory snapshot store"""
+    global _store
+    if _store is None:
+        _store = DirectorySnapshotStore()
+    return _store
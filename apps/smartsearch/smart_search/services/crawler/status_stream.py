@@ -0,0 +1,246 @@
+"""
+Crawler status stream
+
+One producer thread builds the crawl status snapshot sent to /crawler/stream
+clients, however many are connected. It is driven by the event bus:
+
+- crawl status is re-read (in memory, or one database row when idle) on
+  every refresh, and polled while a crawl runs since progress counters do
+  not publish events;
+- index statistics are read from Typesense only after the index was written
+  to (retried while Typesense is unavailable);
+- watch paths are read from the database only after they were edited.
+
+Refreshes are at most refresh_interval apart, so bursts of index writes
+coalesce into one Typesense query. An idle system with no events makes no
+queries at all. Clients receive the full snapshot whenever it changes, and a
+heartbeat comment otherwise.
+"""
+
+import json
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from fastapi.encoders import jsonable_encoder
+
+from smart_search.core.logging import logger
+from smart_search.database.models import db_session
+from smart_search.database.repositories import WatchPathRepository
+from smart_search.services.events import TOPIC_CRAWL_STATUS, TOPIC_INDEX, TOPIC_WATCH_PATHS, EventBus, get_event_bus
+
+ALL_TOPICS = {TOPIC_CRAWL_STATUS, TOPIC_INDEX, TOPIC_WATCH_PATHS}
+
+
+class CrawlerStatusStream:
+    """
+    Shared crawl status snapshot, rebuilt on events and pushed to subscribers.
+    """
+
+    def __init__(
+        self,
+        bus: Optional[EventBus] = None,
+        refresh_interval: float = 0.5,
+        retry_interval: float = 5.0,
+        heartbeat_interval: float = 30.0,
+    ):
+        """
+        Args:
+            bus: Event bus to follow (the global one by default)
+            refresh_interval: Minimum seconds between two refreshes (and the polling interval during a crawl)
+            retry_interval: Seconds between attempts to read index statistics while Typesense is unavailable
+            heartbeat_interval: Seconds without changes after which subscribers get a heartbeat
+        """
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self.heartbeat_interval = heartbeat_interval
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        # Topics changed since the last refresh; everything is read on the first one
+        self._dirty: Set[str] = set(ALL_TOPICS)
+        self._subscribers = 0
+        self._producer: Optional[threading.Thread] = None
+
+        # Latest snapshot, numbered so subscribers can tell a new one
+        self._version = 0
+        self._payload: Optional[Dict[str, Any]] = None
+
+        # Last values of the parts read on events
+        self._index_stats: Dict[str, Any] = {"indexed": 0, "file_types": {}, "healthy": False}
+        self._watch_paths: List[Dict[str, Any]] = []
+        self._stats_retry_at: Optional[float] = None
+
+        (bus or get_event_bus()).subscribe(self._on_event)
+
+    def events(self) -> Iterator[str]:
+        """
+        Server-Sent Events of this subscriber: the current snapshot, then
+        every changed snapshot, with heartbeats in between.
+        """
+        self._add_subscriber()
+        try:
+            seen = 0
+            while True:
+                with self._changed:
+                    self._changed.wait_for(lambda: self._version > seen, timeout=self.heartbeat_interval)
+                    version, payload = self._version, self._payload
+                if version > seen:
+                    seen = version
+                    yield f"data: {json.dumps(payload)}\n\n"
+                else:
+                    yield ":heartbeat\n\n"
+        finally:
+            self._remove_subscriber()
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._subscribers
+
+    def _on_event(self, topic: str) -> None:
+        with self._lock:
+            self._dirty.add(topic)
+        self._wake.set()
+
+    def _add_subscriber(self) -> None:
+        with self._lock:
+            self._subscribers += 1
+            if self._producer is None:
+                self._producer = threading.Thread(target=self._run, daemon=True, name="crawler_status_stream")
+                self._producer.start()
+
+    def _remove_subscriber(self) -> None:
+        with self._lock:
+            self._subscribers -= 1
+        self._wake.set()
+
+    def _run(self) -> None:
+        """Producer loop; exits when the last subscriber leaves."""
+        from smart_search.services.crawler.manager import get_crawl_job_manager
+
+        logger.debug("Crawler status stream started")
+        manager = get_crawl_job_manager()
+        while True:
+            with self._lock:
+                if self._subscribers <= 0:
+                    self._producer = None
+                    logger.debug("Crawler status stream stopped (no subscribers)")
+                    return
+                topics, self._dirty = self._dirty, set()
+
+            try:
+                self._refresh(manager, topics)
+            except Exception as e:
+                logger.error(f"Error refreshing crawler status stream: {e}")
+
+            # Coalesce events arriving while the snapshot was built
+            time.sleep(self.refresh_interval)
+            self._wake.wait(self._next_wait(manager))
+            self._wake.clear()
+
+    def _next_wait(self, manager) -> Optional[float]:
+        """Seconds to wait for an event before refreshing anyway (None: only on events)."""
+        if manager.is_running():
+            return 0
+        if self._stats_retry_at is not None:
+            return max(0.0, self._stats_retry_at - time.monotonic())
+        return None
+
+    def _refresh(self, manager, topics: Set[str]) -> None:
+        status = manager.get_status()
+
+        if TOPIC_INDEX in topics or (self._stats_retry_at is not None and time.monotonic() >= self._stats_retry_at):
+            self._index_stats = self._read_index_stats()
+            self._stats_retry_at = None if self._index_stats["healthy"] else time.monotonic() + self.retry_interval
+
+        if TOPIC_WATCH_PATHS in topics:
+            self._watch_paths = self._read_watch_paths()
+
+        indexed = int(self._index_stats["indexed"])
+        discovered = max(int(status.get("files_discovered", 0)), indexed)
+        indexed_vs_discovered = float(indexed) / discovered if discovered > 0 else 0.0
+
+        payload = jsonable_encoder(
+            {
+                "status": status,
+                "stats": {
+                    "totals": {
+                        "discovered": discovered,
+                        "indexed": indexed,
+                    },
+                    "ratios": {
+                        "indexed_vs_discovered": min(indexed_vs_discovered, 1.0),
+                    },
+                    "file_types": self._index_stats["file_types"],
+                    "runtime": {
+                        "running": bool(manager.is_running()),
+                    },
+                    "healthy": self._index_stats["healthy"],
+                },
+                "watch_paths": self._watch_paths,
+            }
+        )
+
+        with self._changed:
+            if self._payload is not None and {k: v for k, v in self._payload.items() if k != "timestamp"} == payload:
+                return
+            payload["timestamp"] = int(time.time() * 1000)
+            self._payload = payload
+            self._version += 1
+            self._changed.notify_all()
+
+    @staticmethod
+    def _read_index_stats() -> Dict[str, Any]:
+        from smart_search.services.typesense_client import get_typesense_client
+
+        typesense_client = get_typesense_client()
+        try:
+            indexed = typesense_client.get_collection_stats().get("num_documents", 0)
+        except Exception as e:
+            error_str = str(e)
+            if "503" in error_str or "Not Ready" in error_str or "Lagging" in error_str or "Connection" in error_str:
+                logger.debug(f"Typesense unavailable in crawler status stream: {e}")
+            else:
+                logger.warning(f"Error getting Typesense stats in crawler status stream: {e}")
+            return {"indexed": 0, "file_types": {}, "healthy": False}
+
+        try:
+            file_types = typesense_client.get_file_type_distribution()
+        except Exception as e:
+            logger.debug(f"Failed to get file type distribution in crawler status stream: {e}")
+            file_types = {}
+        return {"indexed": indexed, "file_types": file_types, "healthy": True}
+
+    @staticmethod
+    def _read_watch_paths() -> List[Dict[str, Any]]:
+        try:
+            with db_session() as db:
+                return [
+                    {
+                        "id": wp.id,
+                        "path": wp.path,
+                        "enabled": wp.enabled,
+                        "include_subdirectories": wp.include_subdirectories,
+                        "created_at": wp.created_at.isoformat() if wp.created_at else None,
+                        "updated_at": wp.updated_at.isoformat() if wp.updated_at else None,
+                    }
+                    for wp in WatchPathRepository(db).get_all()
+                ]
+        except Exception as e:
+            logger.warning(f"Failed to get watch paths in crawler status stream: {e}")
+            return []
+
+
+# Global crawler status stream instance
+_status_stream: Optional[CrawlerStatusStream] = None
+_status_stream_lock = threading.Lock()
+
+
+def get_crawler_status_stream() -> CrawlerStatusStream:
+    """Get or create global crawler status stream"""
+    global _status_stream
+    with _status_stream_lock:
+        if _status_stream is None:
+            _status_stream = CrawlerStatusStream()
+        return _status_stream
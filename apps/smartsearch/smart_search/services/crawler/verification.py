@@ -3,17 +3,29 @@ Index Verification Service
 """
 
 import os
+import stat
 import threading
-import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+from smart_search.core.config import settings
 from smart_search.core.logging import logger
 from smart_search.database.models import get_db
 from smart_search.database.repositories import WatchPathRepository
+from smart_search.services.crawler.catalog import FileSignature, get_file_catalog
+from smart_search.services.crawler.index_stats import get_index_stats
 from smart_search.services.crawler.path_utils import PathFilter
 from smart_search.services.typesense_client import get_typesense_client
 
+# Fields needed from each indexed file (chunk 0 carries the file metadata)
+VERIFY_FIELDS = "file_path,file_hash,file_size,modified_time"
+
+# Outcome of checking one indexed file
+FILE_OK = "ok"
+FILE_ORPHANED = "orphaned"
+FILE_DRIFTED = "drifted"
+
 
 @dataclass
 class VerificationProgress:
@@ -22,6 +34,7 @@ class VerificationProgress:
     total_indexed: int = 0
     processed_count: int = 0
     orphaned_count: int = 0
+    drifted_count: int = 0
     verification_errors: int = 0
     current_file: Optional[str] = None
     is_complete: bool = False
@@ -30,11 +43,13 @@ class VerificationProgress:
 class IndexVerifier:
     """
     Verifies that all indexed files still exist on the filesystem.
-    Removes orphaned entries.
+    Removes orphaned entries and reports files that changed since indexing.
     """
 
     def __init__(self):
         self.typesense = get_typesense_client()
+        self.catalog = get_file_catalog()
+        self.index_stats = get_index_stats()
         self._stop_event = threading.Event()
         self.progress = VerificationProgress()
 
@@ -47,10 +62,18 @@ class IndexVerifier:
         self._stop_event.clear()
         self.progress = VerificationProgress()
 
-    def verify_index(self):
+    def verify_index(self, on_drift: Optional[Callable[[List[str]], None]] = None):
         """
-        Iterate through all indexed files and verify their existence.
-        Yields progress updates.
+        Stream indexed files from Typesense and check them against the filesystem.
+
+        The index is read through the export endpoint (one document per file) and
+        checked in batches, each stat'ed on a thread pool:
+        - missing files and files outside the watch paths are removed from the index
+        - files whose size/mtime (or catalog entry) no longer match the index are
+          passed to on_drift so they can be indexed again
+
+        Args:
+            on_drift: Receives batches of drifted file paths
         """
         try:
             # 1. Get total count for progress tracking
@@ -64,83 +87,137 @@ class IndexVerifier:
             logger.info(f"Starting index verification for {total_count} files...")
 
             # 2. Get watch paths configuration and create PathFilter
-            db = next(get_db())
-            try:
-                watch_path_repo = WatchPathRepository(db)
-                watch_paths = watch_path_repo.get_enabled()
-
-                included_paths = [wp for wp in watch_paths if not wp.is_excluded]
-                excluded_paths = [wp.path for wp in watch_paths if wp.is_excluded]
-
-                path_filter = PathFilter(
-                    included_paths=[wp.path for wp in included_paths],
-                    excluded_paths=excluded_paths,
-                )
-            finally:
-                db.close()
+            path_filter = self._build_path_filter()
 
-            # 3. Iterate through index in batches
-            batch_size = 100
-            offset = 0
+            # 3. Stream the index and verify it in batches
+            batch_size = max(1, settings.verification_batch_size)
+            seen: Set[str] = set()
+            batch: List[Dict[str, Any]] = []
 
-            while offset < total_count:
-                if self._stop_event.is_set():
-                    break
-
-                # Fetch batch of documents
-                documents = self.typesense.get_all_indexed_files(limit=batch_size, offset=offset)
-
-                if not documents:
-                    break
-
-                orphaned_ids = []
-                orphaned_paths = []
-
-                for doc in documents:
+            with ThreadPoolExecutor(
+                max_workers=max(1, settings.verification_workers), thread_name_prefix="index_verifier"
+            ) as executor:
+                for doc in self.typesense.export_documents(include_fields=VERIFY_FIELDS, filter_by="chunk_index:=0"):
                     if self._stop_event.is_set():
                         break
 
+                    # Older indexes may hold several documents per file
                     file_path = doc.get("file_path")
-                    if not file_path:
-                        continue
-
-                    self.progress.current_file = file_path
-                    self.progress.processed_count += 1
-
-                    # 1. Check if file exists
-                    if not os.path.exists(file_path):
-                        orphaned_ids.append(doc.get("id"))
-                        orphaned_paths.append(file_path)
-                        self.progress.orphaned_count += 1
-                        logger.debug(f"Found orphaned file (missing): {file_path}")
+                    if not file_path or file_path in seen:
                         continue
+                    seen.add(file_path)
 
-                    # 2. Check if file is still in a valid watch path using PathFilter
-                    if not path_filter.is_valid_path(file_path):
-                        orphaned_ids.append(doc.get("id"))
-                        orphaned_paths.append(file_path)
-                        self.progress.orphaned_count += 1
-                        logger.debug(f"Found orphaned file (excluded/no-watch): {file_path}")
-
-                # 3. Batch delete orphaned files
-                if orphaned_ids:
-                    logger.info(f"Removing {len(orphaned_ids)} orphaned files from index...")
-                    # We can use the client to delete by ID or by path.
-                    # typeense_client.batch_remove_files takes paths.
-                    self.typesense.batch_remove_files(orphaned_paths)
+                    batch.append(doc)
+                    if len(batch) >= batch_size:
+                        self._verify_batch(batch, path_filter, executor, on_drift)
+                        batch = []
 
-                offset += len(documents)
-
-                # Small delay to avoid tight loop
-                time.sleep(0.01)
+                if batch and not self._stop_event.is_set():
+                    self._verify_batch(batch, path_filter, executor, on_drift)
 
             self.progress.is_complete = True
             logger.info(
                 f"Index verification completed. Processed: {self.progress.processed_count}, "
-                f"Orphans removed: {self.progress.orphaned_count}"
+                f"Orphans removed: {self.progress.orphaned_count}, Drifted: {self.progress.drifted_count}"
             )
 
         except Exception as e:
             logger.error(f"Error during index verification: {e}")
             self.progress.verification_errors += 1
             raise
+
+    def _build_path_filter(self) -> PathFilter:
+        db = next(get_db())
+        try:
+            watch_path_repo = WatchPathRepository(db)
+            watch_paths = watch_path_repo.get_enabled()
+
+            included_paths = [wp for wp in watch_paths if not wp.is_excluded]
+            excluded_paths = [wp.path for wp in watch_paths if wp.is_excluded]
+
+            return PathFilter(
+                included_paths=[wp.path for wp in included_paths],
+                excluded_paths=excluded_paths,
+            )
+        finally:
+            db.close()
+
+    def _verify_batch(
+        self,
+        documents: List[Dict[str, Any]],
+        path_filter: PathFilter,
+        executor: Executor,
+        on_drift: Optional[Callable[[List[str]], None]],
+    ) -> None:
+        results = list(executor.map(lambda doc: self._check_file(doc, path_filter), documents))
+
+        # Files with a catalog entry are compared against it rather than the indexed
+        # mtime: a touched file with unchanged content keeps its old indexed mtime.
+        entries = self.catalog.get_entries(doc["file_path"] for doc in documents)
+
+        orphaned_paths: List[str] = []
+        drifted_paths: List[str] = []
+        for doc, (status, stats) in zip(documents, results):
+            file_path = doc["file_path"]
+            entry = entries.get(file_path)
+            if status != FILE_ORPHANED and stats is not None and entry is not None:
+                signature_matches = entry.signature.matches(FileSignature.from_stat(stats))
+                in_sync = signature_matches and entry.file_hash == doc.get("file_hash")
+                status = FILE_OK if in_sync else FILE_DRIFTED
+
+            if status == FILE_ORPHANED:
+                orphaned_paths.append(file_path)
+                logger.debug(f"Found orphaned file: {file_path}")
+            elif status == FILE_DRIFTED:
+                drifted_paths.append(file_path)
+                logger.debug(f"Found drifted file: {file_path}")
+
+        self.progress.processed_count += len(documents)
+        self.progress.current_file = documents[-1]["file_path"]
+
+        # Batch delete orphaned files (every chunk, in a few filter requests)
+        if orphaned_paths:
+            logger.info(f"Removing {len(orphaned_paths)} orphaned files from index...")
+            result = self.typesense.batch_remove_files(orphaned_paths)
+            # Files whose delete failed stay indexed (and counted) until the next verification
+            failed = set(result["failed_paths"])
+            removed = [path for path in orphaned_paths if path not in failed]
+            self.catalog.forget(removed)
+            self.index_stats.forget(removed)
+            self.progress.orphaned_count += len(removed)
+            self.progress.verification_errors += len(failed)
+
+        if drifted_paths:
+            self.progress.drifted_count += len(drifted_paths)
+            if on_drift:
+                on_drift(drifted_paths)
+
+    @staticmethod
+    def _check_file(doc: Dict[str, Any], path_filter: PathFilter) -> Tuple[str, Optional[os.stat_result]]:
+        """Stat one indexed file (runs on the verification thread pool)."""
+        file_path = doc["file_path"]
+
+        # Still inside a valid watch path?
+        if not path_filter.is_valid_path(file_path):
+            return FILE_ORPHANED, None
+
+        try:
+            stats = os.stat(file_path)
+        except FileNotFoundError:
+            return FILE_ORPHANED, None
+        except OSError as e:
+            # Unreachable (permissions, network mount down): keep the entry
+            logger.debug(f"Cannot verify {file_path}: {e}")
+            return FILE_OK, None
+
+        if not stat.S_ISREG(stats.st_mode):
+            return FILE_ORPHANED, None
+
+        indexed_mtime = doc.get("modified_time") or 0
+        if indexed_mtime and indexed_mtime != int(stats.st_mtime * 1000):
+            return FILE_DRIFTED, stats
+        indexed_size = doc.get("file_size")
+        if indexed_size is not None and indexed_size != stats.st_size:
+            return FILE_DRIFTED, stats
+
+        return FILE_OK, stats
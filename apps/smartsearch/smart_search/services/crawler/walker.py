@@ -0,0 +1,183 @@
+"""
+Parallel directory walker
+
+A pool of scandir workers pulling directories from a shared work queue. Each
+directory is listed once, subdirectories are pruned through PathFilter and
+queued for any idle worker, and file stats come from DirEntry.stat() instead
+of a second os.stat() per file.
+
+High-latency filesystems (NAS, network mounts) benefit most, since several
+directory listings are in flight at once.
+
+Given the snapshot of a previous walk, directories whose mtime is unchanged
+are not listed again (see snapshots.py). Every walk records a new snapshot.
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from smart_search.core.logging import logger
+from smart_search.services.crawler.path_utils import PathFilter
+from smart_search.services.crawler.snapshots import DirectoryState
+
+# (file path, stat result) pairs of one directory
+DirectoryFiles = List[Tuple[str, os.stat_result]]
+
+# Directories modified this recently are not snapshotted: a further change
+# within the same mtime tick would go unnoticed.
+RECENT_MTIME_GRACE_NS = 2_000_000_000
+
+
+class ParallelWalker:
+    """
+    Walks directory trees with a pool of scandir workers.
+    """
+
+    def __init__(
+        self,
+        path_filter: PathFilter,
+        workers: int = 8,
+        stop_event: Optional[threading.Event] = None,
+        previous_snapshot: Optional[Dict[str, DirectoryState]] = None,
+    ):
+        self.path_filter = path_filter
+        self.workers = max(1, workers)
+        self._stop_event = stop_event or threading.Event()
+        self._previous_snapshot = previous_snapshot or {}
+        # Directory states seen by this walk
+        self.snapshot: Dict[str, DirectoryState] = {}
+        self._snapshot_lock = threading.Lock()
+
+    def walk(
+        self,
+        roots: List[Tuple[str, bool]],
+        on_directory: Callable[[str, DirectoryFiles], None],
+        on_unchanged: Optional[Callable[[str, DirectoryState], None]] = None,
+    ) -> None:
+        """
+        Walk the given roots and call on_directory once per listed directory.
+
+        Blocks until every directory has been processed (or stop is signalled).
+        Callbacks are called concurrently from worker threads.
+
+        Args:
+            roots: (path, recursive) pairs; non-recursive roots are listed without descending
+            on_directory: Receives the directory path and its files with their stats
+            on_unchanged: Receives directories skipped because the previous snapshot is still valid
+        """
+        work: queue.Queue = queue.Queue()
+        for root, recursive in roots:
+            work.put((root, recursive))
+
+        threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(work, on_directory, on_unchanged),
+                daemon=True,
+                name=f"discovery_walker_{i}",
+            )
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        work.join()
+
+        # Release the workers
+        for _ in threads:
+            work.put(None)
+        for thread in threads:
+            thread.join(timeout=1.0)
+
+    def _worker(
+        self,
+        work: queue.Queue,
+        on_directory: Callable[[str, DirectoryFiles], None],
+        on_unchanged: Optional[Callable[[str, DirectoryState], None]],
+    ) -> None:
+        while True:
+            item = work.get()
+            if item is None:
+                work.task_done()
+                return
+            try:
+                if not self._stop_event.is_set():
+                    self._process_directory(work, *item, on_directory, on_unchanged)
+            except Exception as e:
+                logger.warning(f"Error walking {item[0]}: {e}")
+            finally:
+                work.task_done()
+
+    def _process_directory(
+        self,
+        work: queue.Queue,
+        directory: str,
+        recursive: bool,
+        on_directory: Callable[[str, DirectoryFiles], None],
+        on_unchanged: Optional[Callable[[str, DirectoryState], None]],
+    ) -> None:
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            return
+        except OSError:
+            mtime_ns = None
+
+        previous = self._previous_snapshot.get(directory)
+        if previous is not None and previous.mtime_ns == mtime_ns:
+            # Same entries as last time: reuse the snapshot instead of listing
+            self._record(directory, previous)
+            if recursive:
+                self._queue_subdirectories(work, directory, previous.subdirectories)
+            if on_unchanged:
+                on_unchanged(directory, previous)
+            return
+
+        files, subdirectories = self.scan_directory(directory)
+        if mtime_ns is not None and time.time_ns() - mtime_ns >= RECENT_MTIME_GRACE_NS:
+            self._record(directory, DirectoryState(mtime_ns, len(files), tuple(subdirectories)))
+        if recursive:
+            self._queue_subdirectories(work, directory, subdirectories)
+        on_directory(directory, files)
+
+    def _queue_subdirectories(self, work: queue.Queue, directory: str, names: Iterable[str]) -> None:
+        for name in names:
+            path = os.path.join(directory, name)
+            if not self.path_filter.should_prune_directory(path):
+                work.put((path, True))
+
+    def _record(self, directory: str, state: DirectoryState) -> None:
+        with self._snapshot_lock:
+            self.snapshot[directory] = state
+
+    def scan_directory(self, directory: str) -> Tuple[DirectoryFiles, List[str]]:
+        """
+        List one directory.
+
+        Returns:
+            (files with stats, names of all subdirectories)
+        """
+        files: DirectoryFiles = []
+        subdirectories: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if self._stop_event.is_set():
+                        break
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(entry.name)
+                        elif entry.is_file():
+                            files.append((entry.path, entry.stat()))
+                    except FileNotFoundError:
+                        continue
+                    except OSError as e:
+                        logger.warning(f"Error processing {entry.path}: {e}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Cannot list directory {directory}: {e}")
+        return files, subdirectories
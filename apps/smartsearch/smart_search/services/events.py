@@ -0,0 +1,75 @@
+"""
+In-process event bus
+
+Components announce that something observable changed (a crawl started, the
+index was written to, watch paths were edited) by publishing a topic. Any
+details are read back from the component by the subscriber, so events carry
+no payload and publishing is cheap enough for hot paths.
+"""
+
+import threading
+from typing import Callable, List, Optional
+
+from smart_search.core.logging import logger
+
+# Crawl or file monitoring started, stopped or changed phase
+TOPIC_CRAWL_STATUS = "crawl_status"
+# Documents were indexed into or removed from the search index
+TOPIC_INDEX = "index"
+# Watch paths were added, edited or removed
+TOPIC_WATCH_PATHS = "watch_paths"
+
+EventHandler = Callable[[str], None]
+
+
+class EventBus:
+    """
+    Synchronous publish/subscribe of topics.
+
+    Handlers run on the publishing thread and must return quickly (typically
+    by setting a flag or an event); an error in a handler is logged and does
+    not reach the publisher.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handlers: List[EventHandler] = []
+
+    def subscribe(self, handler: EventHandler) -> Callable[[], None]:
+        """
+        Call a handler with the topic of every published event.
+
+        Returns:
+            A function that unsubscribes the handler
+        """
+        with self._lock:
+            self._handlers = [*self._handlers, handler]
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._handlers = [h for h in self._handlers if h is not handler]
+
+        return unsubscribe
+
+    def publish(self, topic: str) -> None:
+        """Notify every subscribed handler that a topic changed."""
+        # Handlers are replaced, never mutated, so iterating needs no lock
+        for handler in self._handlers:
+            try:
+                handler(topic)
+            except Exception as e:
+                logger.warning(f"Event handler failed for '{topic}': {e}")
+
+
+# Global event bus instance
+_event_bus: Optional[EventBus] = None
+_event_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    """Get or create global event bus"""
+    global _event_bus
+    with _event_bus_lock:
+        if _event_bus is None:
+            _event_bus = EventBus()
+        return _event_bus
@@ -5,14 +5,28 @@ Provides content extraction from various file types using pluggable strategies.
 """
 
 from smart_search.services.extraction.basic_strategy import BasicExtractionStrategy
+from smart_search.services.extraction.cache import ExtractionCache, get_extraction_cache
 from smart_search.services.extraction.extractor import ContentExtractor, get_extractor
-from smart_search.services.extraction.protocol import ExtractionStrategy
+from smart_search.services.extraction.protocol import BlockExtractionStrategy, DocumentBlocks, ExtractionStrategy
+from smart_search.services.extraction.routing import ExtractionRouter
+from smart_search.services.extraction.skip_strategy import SkipExtractionStrategy
+from smart_search.services.extraction.text_strategy import TextExtractionStrategy
+from smart_search.services.extraction.tika_client import TikaClient, get_tika_client
 from smart_search.services.extraction.tika_strategy import TikaExtractionStrategy
 
 __all__ = [
     "ExtractionStrategy",
+    "BlockExtractionStrategy",
+    "DocumentBlocks",
     "TikaExtractionStrategy",
+    "TikaClient",
+    "get_tika_client",
     "BasicExtractionStrategy",
+    "TextExtractionStrategy",
+    "SkipExtractionStrategy",
+    "ExtractionRouter",
     "ContentExtractor",
     "get_extractor",
+    "ExtractionCache",
+    "get_extraction_cache",
 ]
@@ -2,16 +2,56 @@
 Basic Extraction Strategy
 
 Fallback strategy for basic text extraction from any file.
+
+Files are read in blocks: the encoding is sniffed from a prefix sample, blocks
+are decoded incrementally and non-printable characters are removed with a
+precompiled regex, so memory stays at a few blocks and no Python code runs
+per character. extract_blocks() hands the blocks to the caller (the chunker)
+without joining them.
 """
 
+import codecs
 import re
-from typing import Optional
+import sys
+from functools import lru_cache
+from itertools import islice
+from typing import BinaryIO, Iterator, List, Optional
 
 import chardet
 
 from smart_search.api.models.file_event import DocumentContent
 from smart_search.core.logging import logger
-from smart_search.services.extraction.protocol import ExtractionStrategy
+from smart_search.services.extraction.protocol import BlockExtractionStrategy, DocumentBlocks, strip_blocks
+
+# Bytes read per block
+BLOCK_SIZE = 256 * 1024
+
+# Prefix used to detect the encoding
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Decoded text needs this many words to count as text
+MIN_VALID_WORDS = 10
+
+# ASCII strings pulled from binary files need to add up to more than this many characters
+MIN_STRINGS_LENGTH = 50
+
+_ASCII_STRINGS = re.compile(rb"[\x20-\x7e]{4,}")
+_PRINTABLE_BYTES = bytes(range(0x20, 0x7F))
+
+
+@lru_cache(maxsize=1)
+def _non_printable_pattern() -> "re.Pattern[str]":
+    """Regex matching every character str.isprintable() rejects, except newlines and tabs."""
+    ranges: List[str] = []
+    start = None
+    for code in range(sys.maxunicode + 2):
+        removed = code <= sys.maxunicode and not chr(code).isprintable() and chr(code) not in "\n\r\t"
+        if removed and start is None:
+            start = code
+        elif not removed and start is not None:
+            ranges.append(f"\\U{start:08x}-\\U{code - 1:08x}")
+            start = None
+    return re.compile(f"[{''.join(ranges)}]+")
 
 
 class BasicExtractionStrategy:
@@ -25,7 +65,7 @@ class BasicExtractionStrategy:
         """Extract content using basic text detection."""
         logger.info(f"Attempting basic extraction for: {file_path}")
 
-        text = self._extract_smart_text(file_path)
+        text = "".join(self.iter_text(file_path)).strip()
 
         if text:
             logger.info(f"Smart text extraction successful: {len(text)} characters")
@@ -45,49 +85,116 @@ class BasicExtractionStrategy:
             },
         )
 
-    def _extract_smart_text(
+    def extract_blocks(self, file_path: str) -> DocumentBlocks:
+        """Stream the text extract() would return; the file is read as the blocks are consumed."""
+        return DocumentBlocks(
+            blocks=strip_blocks(self.iter_text(file_path)),
+            metadata={"extraction_method": "smart_text"},
+        )
+
+    def iter_text(
         self,
         file_path: str,
         min_word_length: int = 3,
         max_text_size: int = 10 * 1024 * 1024,
-    ) -> Optional[str]:
+    ) -> Iterator[str]:
         """
-        Smart text extraction from any file.
+        Smart text extraction from any file, yielded in blocks.
         Attempts to extract strings from binary files.
+        Yields nothing when no text is found.
         """
         try:
             with open(file_path, "rb") as f:
-                data = f.read(max_text_size)
-
-            result = chardet.detect(data)
-            encoding = result.get("encoding", "utf-8")
-            confidence = result.get("confidence", 0)
-
-            if confidence > 0.8:
-                try:
-                    text = data.decode(encoding, errors="ignore")
-                    text = "".join(c for c in text if c.isprintable() or c in "\n\r\t")
-
-                    words = text.split()
-                    valid_words = [w for w in words if len(w) >= min_word_length]
-                    if len(valid_words) >= 10:
-                        return text.strip()
-                except Exception:
-                    pass
-
-            # Fallback: Extract ASCII strings
-            strings = re.findall(rb"[\x20-\x7e]{4,}", data)
-            if strings:
-                extracted = b"\n".join(strings).decode("ascii", errors="ignore")
-                if len(extracted) > 50:
-                    return extracted
-
-            return None
+                encoding = self._detect_encoding(f.read(ENCODING_SAMPLE_SIZE))
+
+                if encoding:
+                    # Hold blocks back until they are known to contain real words
+                    valid_word = re.compile(rf"\S{{{min_word_length},}}")
+                    pending: List[str] = []
+                    words = 0
+                    f.seek(0)
+                    for block in self._decode_blocks(f, encoding, max_text_size):
+                        if words >= MIN_VALID_WORDS:
+                            yield block
+                            continue
+                        pending.append(block)
+                        words += sum(1 for _ in islice(valid_word.finditer(block), MIN_VALID_WORDS - words))
+                        if words >= MIN_VALID_WORDS:
+                            yield from pending
+                            pending = []
+                    if words >= MIN_VALID_WORDS:
+                        return
+
+                # Fallback: Extract ASCII strings
+                f.seek(0)
+                yield from self._ascii_strings(f, max_text_size)
 
         except Exception as e:
             logger.debug(f"Smart text extraction failed for {file_path}: {e}")
+
+    @staticmethod
+    def _detect_encoding(sample: bytes) -> Optional[str]:
+        """Encoding of the sample if detected with confidence."""
+        result = chardet.detect(sample)
+        encoding = result.get("encoding")
+        if not encoding or (result.get("confidence") or 0) <= 0.8:
             return None
+        # An ASCII prefix says nothing about the rest of the file
+        if encoding.lower() == "ascii":
+            return "utf-8"
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            return None
+        return encoding
+
+    @staticmethod
+    def _decode_blocks(f: BinaryIO, encoding: str, max_text_size: int) -> Iterator[str]:
+        """Decode the file block by block, without non-printable characters."""
+        decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+        non_printable = _non_printable_pattern()
+        remaining = max_text_size
+        while remaining > 0:
+            data = f.read(min(BLOCK_SIZE, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            text = decoder.decode(data)
+            if text:
+                yield non_printable.sub("", text)
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield non_printable.sub("", text)
+
+    @staticmethod
+    def _ascii_strings(f: BinaryIO, max_text_size: int) -> Iterator[str]:
+        """Runs of at least 4 printable ASCII characters, one per line."""
+        pending: List[str] = []
+        length = 0
+        carry = b""
+        remaining = max_text_size
+        while True:
+            data = f.read(min(BLOCK_SIZE, remaining)) if remaining > 0 else b""
+            remaining -= len(data)
+            at_end = not data
+            data, carry = carry + data, b""
+            if not at_end:
+                # A printable run at the end of the block may continue in the next one
+                kept = len(data.rstrip(_PRINTABLE_BYTES))
+                data, carry = data[:kept], data[kept:]
+
+            strings = _ASCII_STRINGS.findall(data)
+            if strings:
+                piece = ("\n" if length else "") + b"\n".join(strings).decode("ascii")
+                length += len(piece)
+                pending.append(piece)
+                # Nothing is yielded until the strings add up to enough text
+                if length > MIN_STRINGS_LENGTH:
+                    yield "".join(pending)
+                    pending = []
+            if at_end:
+                break
 
 
 # Verify protocol compliance
-_: ExtractionStrategy = BasicExtractionStrategy()  # type: ignore[assignment]
+_: BlockExtractionStrategy = BasicExtractionStrategy()  # type: ignore[assignment]
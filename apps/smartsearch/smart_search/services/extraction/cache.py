@@ -0,0 +1,163 @@
+"""
+Content-addressed extraction cache
+
+Extracted text and metadata are stored on disk, keyed by the file's content
+hash and the extraction version. Renamed, copied and touched-but-identical
+files, as well as a reindex after reset_collection, reuse the stored result
+instead of going through Tika again.
+
+Entries are zlib-compressed JSON files. The cache is capped in size and
+evicts least recently used entries (a hit refreshes the entry's mtime).
+Sampled ("-quick") hashes do not identify content and are never cached.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from smart_search.api.models.file_event import DocumentContent
+from smart_search.core.config import settings
+from smart_search.core.logging import logger
+from smart_search.core.paths import app_paths
+from smart_search.services.hashing import parse_hash
+
+# Bump when extraction output changes so stale entries are no longer served
+EXTRACTION_VERSION = "2"
+
+# Eviction frees space down to this fraction of the cap
+EVICTION_TARGET = 0.9
+
+ENTRY_SUFFIX = ".json.z"
+
+
+class ExtractionCache:
+    """
+    On-disk LRU cache of DocumentContent keyed by content hash.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # entry path -> size, and the total size of all entries
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for entry in self.directory.glob(f"*/*{ENTRY_SUFFIX}"):
+                size = entry.stat().st_size
+                self._sizes[str(entry)] = size
+                self._total_bytes += size
+        except OSError as e:
+            logger.warning(f"Failed to load extraction cache: {e}")
+
+    def _entry_path(self, file_hash: str) -> Optional[Path]:
+        if not file_hash or parse_hash(file_hash)[1]:
+            return None
+        key = hashlib.sha256(f"{EXTRACTION_VERSION}:{file_hash}".encode()).hexdigest()
+        return self.directory / key[:2] / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, file_hash: str) -> Optional[DocumentContent]:
+        """Cached extraction result for a content hash, if any."""
+        path = self._entry_path(file_hash)
+        if path is None:
+            return None
+        try:
+            data = json.loads(zlib.decompress(path.read_bytes()))
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error) as e:
+            logger.warning(f"Dropping unreadable extraction cache entry {path.name}: {e}")
+            self._remove(str(path))
+            return None
+        return DocumentContent(content=data["content"], metadata=data.get("metadata", {}))
+
+    def put(self, file_hash: str, document: DocumentContent) -> None:
+        """Store an extraction result, evicting old entries past the size cap."""
+        path = self._entry_path(file_hash)
+        if path is None or self.max_bytes <= 0:
+            return
+        payload = zlib.compress(
+            json.dumps({"content": document.content, "metadata": document.metadata}, default=str).encode()
+        )
+        if len(payload) > self.max_bytes:
+            return
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write extraction cache entry: {e}")
+            return
+
+        with self._lock:
+            self._total_bytes += len(payload) - self._sizes.get(str(path), 0)
+            self._sizes[str(path)] = len(payload)
+            over_cap = self._total_bytes > self.max_bytes
+        if over_cap:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache is below the target size."""
+        with self._lock:
+            target = self.max_bytes * EVICTION_TARGET
+            entries: List[Tuple[float, str]] = []
+            for entry in self._sizes:
+                try:
+                    entries.append((os.stat(entry).st_mtime, entry))
+                except OSError:
+                    entries.append((0.0, entry))
+            entries.sort()
+
+            evicted = 0
+            for _, entry in entries:
+                if self._total_bytes <= target:
+                    break
+                self._discard(entry)
+                evicted += 1
+        logger.debug(f"Evicted {evicted} extraction cache entries")
+
+    def _remove(self, entry: str) -> None:
+        with self._lock:
+            self._discard(entry)
+
+    def _discard(self, entry: str) -> None:
+        """Delete one entry (lock held)."""
+        self._total_bytes -= self._sizes.pop(entry, 0)
+        try:
+            os.remove(entry)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        with self._lock:
+            for entry in list(self._sizes):
+                self._discard(entry)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._total_bytes
+
+
+# Global extraction cache instance
+_cache: Optional[ExtractionCache] = None
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """Get or create global extraction cache (None when disabled)"""
+    global _cache
+    if not settings.extraction_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = ExtractionCache(app_paths.extraction_cache_dir, settings.extraction_cache_max_mb * 1024 * 1024)
+    return _cache
@@ -7,12 +7,13 @@ Uses Strategy pattern for pluggable extraction methods.
 
 import mimetypes
 import os
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from smart_search.api.models.file_event import DocumentContent
 from smart_search.core.config import settings
 from smart_search.core.logging import logger
-from smart_search.services.extraction.protocol import ExtractionStrategy
+from smart_search.services.extraction.protocol import DocumentBlocks, ExtractionStrategy
+from smart_search.services.extraction.routing import ROUTE_SKIP, ROUTE_TEXT, ROUTE_TIKA, ExtractionRouter
 
 
 class ContentExtractor:
@@ -22,11 +23,14 @@ class ContentExtractor:
     Uses Strategy pattern to select appropriate extraction method:
     1. Tika extraction for documents, images, and archives
     2. Basic extraction as fallback
+
+    With a router, the strategies are chosen per file (see routing.py).
     """
 
-    def __init__(self, strategies: List[ExtractionStrategy]):
+    def __init__(self, strategies: List[ExtractionStrategy], router: Optional[ExtractionRouter] = None):
         """Initialize the content extractor with extraction strategies."""
         self.strategies = strategies
+        self.router = router
 
     def extract(self, file_path: str) -> DocumentContent:
         """
@@ -42,6 +46,21 @@ class ContentExtractor:
             FileNotFoundError: If file doesn't exist
             Exception: For extraction errors
         """
+        return self._extract(file_path, stream=False)
+
+    def extract_blocks(self, file_path: str) -> Union[DocumentContent, DocumentBlocks]:
+        """
+        Like extract(), but a strategy that reads the file block by block
+        (extract_blocks) returns DocumentBlocks, read as the blocks are consumed.
+        Other strategies return the whole DocumentContent as usual.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            Exception: For extraction errors
+        """
+        return self._extract(file_path, stream=True)
+
+    def _extract(self, file_path: str, stream: bool) -> Union[DocumentContent, DocumentBlocks]:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
@@ -49,10 +68,14 @@ class ContentExtractor:
         last_error = None
         result = None
 
-        for strategy in self.strategies:
+        strategies = self.router.strategies_for(file_path) if self.router else self.strategies
+        for strategy in strategies:
             if strategy.can_extract(file_path):
                 try:
-                    result = strategy.extract(file_path)
+                    if stream and hasattr(strategy, "extract_blocks"):
+                        result = strategy.extract_blocks(file_path)
+                    else:
+                        result = strategy.extract(file_path)
                     break
                 except Exception as e:
                     logger.warning(f"{strategy.__class__.__name__} failed for {file_path}: {e}")
@@ -84,15 +107,25 @@ def get_extractor() -> ContentExtractor:
     global _extractor
     if _extractor is None:
         from smart_search.services.extraction.basic_strategy import BasicExtractionStrategy
+        from smart_search.services.extraction.skip_strategy import SkipExtractionStrategy
+        from smart_search.services.extraction.text_strategy import TextExtractionStrategy
         from smart_search.services.extraction.tika_strategy import TikaExtractionStrategy
 
         tika_endpoint = settings.tika_url if settings.tika_client_only else None
 
         # Create strategies
-        strategies = [
-            TikaExtractionStrategy(tika_endpoint=tika_endpoint),
-            BasicExtractionStrategy(),
-        ]
-        _extractor = ContentExtractor(strategies=strategies)
+        tika = TikaExtractionStrategy(tika_endpoint=tika_endpoint)
+        basic = BasicExtractionStrategy()
+        strategies = [tika, basic]
+
+        # Route cheap formats past Tika
+        router = ExtractionRouter(
+            {
+                ROUTE_TEXT: [TextExtractionStrategy(), basic],
+                ROUTE_TIKA: strategies,
+                ROUTE_SKIP: [SkipExtractionStrategy()],
+            }
+        )
+        _extractor = ContentExtractor(strategies=strategies, router=router)
 
     return _extractor
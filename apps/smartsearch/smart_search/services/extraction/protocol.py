@@ -4,11 +4,43 @@ Extraction Strategy Protocol
 Defines the interface for all extraction strategies.
 """
 
-from typing import Protocol
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, Protocol
 
 from smart_search.api.models.file_event import DocumentContent
 
 
+@dataclass
+class DocumentBlocks:
+    """
+    Extracted text as a lazy sequence of blocks.
+
+    The file is read while the blocks are consumed, so the text is never held
+    in memory as a whole. Read errors while iterating end the text early.
+    """
+
+    blocks: Iterable[str]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def strip_blocks(blocks: Iterable[str]) -> Iterator[str]:
+    """Blocks whose concatenation equals "".join(blocks).strip(), without joining them."""
+    started = False
+    trailing = ""  # Whitespace kept until more text follows it
+    for block in blocks:
+        if not started:
+            block = block.lstrip()
+            if not block:
+                continue
+            started = True
+        text = block.rstrip()
+        if text:
+            yield trailing + text
+            trailing = block[len(text) :]
+        else:
+            trailing += block
+
+
 class ExtractionStrategy(Protocol):
     """Protocol for extraction strategies."""
 
@@ -35,3 +67,22 @@ class ExtractionStrategy(Protocol):
             DocumentContent with extracted content and metadata
         """
         ...
+
+
+class BlockExtractionStrategy(ExtractionStrategy, Protocol):
+    """Protocol for strategies that can also stream the text of a file."""
+
+    def extract_blocks(self, file_path: str) -> DocumentBlocks:
+        """
+        Extract content from the file as text blocks.
+
+        Errors that make the strategy unsuitable for the file (so the next
+        strategy is tried) are raised here, before any block is read.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            DocumentBlocks yielding the same text extract() would return
+        """
+        ...
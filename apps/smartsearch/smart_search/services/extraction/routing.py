@@ -0,0 +1,150 @@
+"""
+Extraction Routing
+
+Sends each file to the cheapest strategy able to handle it:
+- text:    plain text formats and source code, read natively
+- tika:    office documents, PDFs, images and anything unrecognized
+- archive: Tika below extraction_archive_max_mb, skipped above it
+- skip:    formats without readable text (video, executables), indexed by name and metadata
+
+Files are routed by extension first, then by MIME type (guessed from the
+name, or sniffed from the content when libmagic is available). The table can
+be extended or overridden through the extraction_routes setting.
+"""
+
+import mimetypes
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from smart_search.core.config import settings
+from smart_search.core.logging import logger
+from smart_search.services.extraction.protocol import ExtractionStrategy
+
+# Optional content sniffing (needs the libmagic system library)
+try:
+    import magic
+except ImportError:
+    magic = None
+
+ROUTE_TEXT = "text"
+ROUTE_TIKA = "tika"
+ROUTE_ARCHIVE = "archive"
+ROUTE_SKIP = "skip"
+ROUTES = (ROUTE_TEXT, ROUTE_TIKA, ROUTE_ARCHIVE, ROUTE_SKIP)
+
+# Route for files matching no entry
+DEFAULT_ROUTE = ROUTE_TIKA
+
+
+def _routes(route: str, keys: str) -> Dict[str, str]:
+    return {key: route for key in keys.split()}
+
+
+DEFAULT_ROUTING_TABLE: Dict[str, str] = {
+    **_routes(
+        ROUTE_TEXT,
+        ".txt .text .md .markdown .rst .adoc .org .tex .csv .tsv .json .jsonl .ndjson .yaml .yml .toml .ini .cfg "
+        ".conf .properties .log .srt .vtt .xml .svg .sql .graphql .proto "
+        ".py .pyi .ipynb .js .mjs .cjs .ts .tsx .jsx .vue .svelte .css .scss .sass .less "
+        ".java .kt .kts .scala .groovy .gradle .c .h .cc .cpp .cxx .hpp .hh .cs .fs .go .rs .rb .php .pl .pm "
+        ".swift .m .mm .r .jl .lua .dart .ex .exs .erl .hs .clj .elm .nim .zig .sh .bash .zsh .fish .ps1 .bat .cmd "
+        ".dockerfile .makefile .cmake",
+    ),
+    **_routes(
+        ROUTE_TIKA,
+        ".pdf .doc .docx .docm .dot .dotx .xls .xlsx .xlsm .ppt .pptx .pptm .odt .ods .odp .odg .rtf .epub "
+        ".html .htm .xhtml .eml .msg .mbox .pages .numbers .key .vsd .vsdx .one "
+        ".jpg .jpeg .png .gif .bmp .tif .tiff .webp .heic .mp3 .flac .ogg .m4a .wav",
+    ),
+    **_routes(ROUTE_ARCHIVE, ".zip .jar .tar .gz .tgz .bz2 .xz .7z .rar"),
+    **_routes(
+        ROUTE_SKIP,
+        ".mp4 .mkv .avi .mov .wmv .flv .webm .m4v .mpg .mpeg .3gp .iso .img .dmg .vmdk .vdi "
+        ".exe .dll .so .dylib .bin .o .a .lib .class .pyc .pyo .wasm .sqlite .sqlite3 .db .mdb .parquet .npy .pt",
+    ),
+    # MIME types, exact or by major type
+    "text/*": ROUTE_TEXT,
+    "application/json": ROUTE_TEXT,
+    "application/xml": ROUTE_TEXT,
+    "application/x-sh": ROUTE_TEXT,
+    "application/pdf": ROUTE_TIKA,
+    "application/zip": ROUTE_ARCHIVE,
+    "application/gzip": ROUTE_ARCHIVE,
+    "application/x-tar": ROUTE_ARCHIVE,
+    "application/x-7z-compressed": ROUTE_ARCHIVE,
+    "application/vnd.rar": ROUTE_ARCHIVE,
+    "video/*": ROUTE_SKIP,
+    "application/x-executable": ROUTE_SKIP,
+    "application/x-sharedlib": ROUTE_SKIP,
+    "application/x-dosexec": ROUTE_SKIP,
+}
+
+
+class ExtractionRouter:
+    """
+    Maps files to the extraction strategies of their route.
+    """
+
+    def __init__(
+        self,
+        strategies: Dict[str, List[ExtractionStrategy]],
+        overrides: Optional[Dict[str, str]] = None,
+        archive_max_bytes: Optional[int] = None,
+    ):
+        """
+        Args:
+            strategies: Strategies to try, in order, for each of the text, tika and skip routes
+            overrides: Routing entries replacing or extending the default table
+            archive_max_bytes: Size above which archives are skipped
+        """
+        self.strategies = strategies
+        self.table = dict(DEFAULT_ROUTING_TABLE)
+        overrides = settings.extraction_routes if overrides is None else overrides
+        for key, route in overrides.items():
+            if route not in ROUTES:
+                logger.warning(f"Ignoring extraction route '{route}' for '{key}' (expected one of {ROUTES})")
+                continue
+            self.table[key.lower()] = route
+        if archive_max_bytes is None:
+            archive_max_bytes = settings.extraction_archive_max_mb * 1024 * 1024
+        self.archive_max_bytes = archive_max_bytes
+
+    def route(self, file_path: str) -> str:
+        """Route of a file, with archives resolved to tika or skip by size."""
+        route = self._lookup(file_path)
+        if route == ROUTE_ARCHIVE:
+            try:
+                size = os.path.getsize(file_path)
+            except OSError:
+                size = 0
+            route = ROUTE_SKIP if size > self.archive_max_bytes else ROUTE_TIKA
+        return route
+
+    def strategies_for(self, file_path: str) -> List[ExtractionStrategy]:
+        """Strategies to try, in order, for a file."""
+        return self.strategies[self.route(file_path)]
+
+    def _lookup(self, file_path: str) -> str:
+        path = Path(file_path)
+        suffix = path.suffix.lower() or f".{path.name.lower()}"  # Dockerfile, Makefile
+        route = self.table.get(suffix)
+        if route:
+            return route
+
+        mime_type = mimetypes.guess_type(file_path)[0] or self._sniff(file_path)
+        if mime_type:
+            route = self.table.get(mime_type) or self.table.get(f"{mime_type.split('/')[0]}/*")
+            if route:
+                return route
+        return DEFAULT_ROUTE
+
+    @staticmethod
+    def _sniff(file_path: str) -> Optional[str]:
+        if magic is None:
+            return None
+        try:
+            return magic.from_file(file_path, mime=True)
+        except Exception as e:
+            logger.debug(f"Cannot sniff MIME type of {file_path}: {e}")
+            return None
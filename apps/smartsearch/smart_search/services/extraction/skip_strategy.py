@@ -0,0 +1,33 @@
+"""
+Skip Extraction Strategy
+
+Indexes files without readable text (video, large archives, executables)
+by name and metadata only.
+"""
+
+from smart_search.api.models.file_event import DocumentContent
+from smart_search.core.logging import logger
+from smart_search.services.extraction.protocol import ExtractionStrategy
+
+
+class SkipExtractionStrategy:
+    """Strategy that extracts no content."""
+
+    def can_extract(self, file_path: str) -> bool:
+        """Files are routed here by the extraction router."""
+        return True
+
+    def extract(self, file_path: str) -> DocumentContent:
+        """Return empty content with a note explaining why."""
+        logger.debug(f"Skipping content extraction for {file_path}")
+        return DocumentContent(
+            content="",
+            metadata={
+                "extraction_method": "skipped",
+                "extraction_note": "Content extraction skipped for this file type",
+            },
+        )
+
+
+# Verify protocol compliance
+_: ExtractionStrategy = SkipExtractionStrategy()  # type: ignore[assignment]
@@ -0,0 +1,120 @@
+"""
+Tika Server Client
+
+Sends files to the Tika server's recursive metadata endpoint (/rmeta/text)
+over a pooled HTTP connection. Files are streamed from disk rather than read
+into memory, the number of simultaneous extractions is capped, and each file
+gets a timeout.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from smart_search.core.config import settings
+from smart_search.core.logging import logger
+
+# Key holding the extracted text of each document in an /rmeta response
+CONTENT_KEY = "X-TIKA:content"
+
+# Upload chunk size
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class TikaClient:
+    """
+    Thread-safe client for the Tika server, shared by all extraction workers.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        http_client: Optional[httpx.Client] = None,
+    ):
+        self.base_url = (base_url or settings.tika_url).rstrip("/")
+        self.max_concurrency = max(1, max_concurrency or settings.tika_max_concurrency)
+        self.timeout = timeout or settings.tika_timeout
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._client = http_client or httpx.Client(
+            timeout=httpx.Timeout(self.timeout, connect=settings.tika_connection_timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+
+    def extract(self, file_path: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Extract the text and metadata of a file.
+
+        Text of embedded documents (archive members, attachments) is appended
+        to the container's text. Metadata is that of the container document.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            (content, raw Tika metadata)
+
+        Raises:
+            TimeoutError: If no extraction slot frees up within the timeout
+            httpx.HTTPError: If the request fails or times out
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError(f"No Tika extraction slot available for {file_path}")
+        try:
+            started = time.monotonic()
+            documents = self._request_rmeta(file_path)
+            logger.debug(f"Tika parsed {file_path} in {time.monotonic() - started:.2f}s")
+        finally:
+            self._slots.release()
+
+        if not documents:
+            return "", {}
+
+        contents = [doc.get(CONTENT_KEY) or "" for doc in documents]
+        metadata = {key: value for key, value in documents[0].items() if key != CONTENT_KEY}
+        return "\n".join(content for content in contents if content.strip()), metadata
+
+    def _request_rmeta(self, file_path: str) -> List[Dict[str, Any]]:
+        headers = {
+            "Accept": "application/json",
+            "Content-Length": str(os.path.getsize(file_path)),
+        }
+        file_name = os.path.basename(file_path)
+        if file_name.isascii():
+            # Lets Tika use the file name when detecting the type
+            headers["Content-Disposition"] = f'attachment; filename="{file_name}"'
+        with open(file_path, "rb") as f:
+            response = self._client.put(f"{self.base_url}/rmeta/text", content=_iter_file(f), headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._client.close()
+
+
+def _iter_file(f) -> Iterator[bytes]:
+    while chunk := f.read(STREAM_CHUNK_SIZE):
+        yield chunk
+
+
+# Global Tika client instances, one per server URL
+_tika_clients: Dict[str, TikaClient] = {}
+_tika_client_lock = threading.Lock()
+
+
+def get_tika_client(base_url: Optional[str] = None) -> TikaClient:
+    """Get or create the global Tika client for a server (settings.tika_url by default)"""
+    base_url = (base_url or settings.tika_url).rstrip("/")
+    with _tika_client_lock:
+        client = _tika_clients.get(base_url)
+        if client is None:
+            client = _tika_clients[base_url] = TikaClient(base_url=base_url)
+        return client
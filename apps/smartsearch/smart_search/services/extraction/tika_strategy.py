@@ -10,6 +10,7 @@ from smart_search.api.models.file_event import DocumentContent
 from smart_search.core.config import settings
 from smart_search.core.logging import logger
 from smart_search.services.extraction.protocol import ExtractionStrategy
+from smart_search.services.extraction.tika_client import get_tika_client
 
 
 class TikaExtractionStrategy:
@@ -23,29 +24,15 @@ class TikaExtractionStrategy:
         return settings.tika_enabled
 
     def extract(self, file_path: str) -> DocumentContent:
-        """Extract content using Tika."""
-        from tika import parser
-
+        """Extract content using the shared Tika client."""
         logger.info(f"Extracting with Tika: {file_path}")
 
-        if self.tika_endpoint:
-            logger.debug(f"Using Tika endpoint: {self.tika_endpoint}")
-            parsed = parser.from_file(file_path, self.tika_endpoint)
-        else:
-            parsed = parser.from_file(file_path)
-
-        if not parsed or "content" not in parsed:
-            raise ValueError(f"Tika returned empty result for {file_path}")
-
-        content = parsed.get("content")
-        if content is None:
-            content = ""
+        content, raw_metadata = get_tika_client(self.tika_endpoint).extract(file_path)
 
         content = content.strip()
         if not content:
             raise ValueError(f"Tika extracted empty content for {file_path}")
 
-        raw_metadata = parsed.get("metadata", {})
         metadata = self._process_metadata(raw_metadata)
 
         if self.tika_endpoint:
@@ -0,0 +1,164 @@
+"""
+File content hashing.
+
+Hashes are tagged with the algorithm that produced them ("xxh3_128:<hex>"),
+so an index holding hashes from different algorithms (or untagged legacy MD5
+hashes) is still compared correctly.
+
+The default algorithm is the fastest one available: xxHash (xxh3_128) or
+BLAKE3 when installed, otherwise BLAKE2b from the standard library. Files are
+read through one reusable buffer, or memory-mapped when large.
+
+Quick hashes ("<algorithm>-quick:<hex>") sample the head, middle and tail of a
+file plus its size. They are opt-in (file_hash_quick_threshold_mb) because an
+edit outside the sampled regions goes unnoticed.
+"""
+
+import hashlib
+import mmap
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from smart_search.core.config import settings
+
+# Optional fast hash implementations
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+LEGACY_ALGORITHM = "md5"
+QUICK_SUFFIX = "-quick"
+
+# Algorithm name -> hasher factory, in order of preference for "auto"
+_ALGORITHMS: Dict[str, Callable[[], Any]] = {}
+if xxhash is not None:
+    _ALGORITHMS["xxh3_128"] = xxhash.xxh3_128
+if blake3 is not None:
+    _ALGORITHMS["blake3"] = blake3.blake3
+_ALGORITHMS["blake2b"] = lambda: hashlib.blake2b(digest_size=16)
+_ALGORITHMS["sha256"] = hashlib.sha256
+_ALGORITHMS[LEGACY_ALGORITHM] = hashlib.md5
+
+
+def available_algorithms() -> List[str]:
+    """Hash algorithms usable in this environment, fastest first."""
+    return list(_ALGORITHMS)
+
+
+def default_algorithm() -> str:
+    """Configured hash algorithm, resolving 'auto' (or an unavailable one) to the fastest available."""
+    configured = settings.file_hash_algorithm.lower()
+    if configured in _ALGORITHMS:
+        return configured
+    return next(iter(_ALGORITHMS))
+
+
+def parse_hash(value: str) -> Tuple[str, bool, str]:
+    """
+    Split a stored hash into (algorithm, quick, digest).
+
+    Untagged values are legacy MD5 hashes.
+    """
+    if ":" not in value:
+        return LEGACY_ALGORITHM, False, value
+    tag, digest = value.split(":", 1)
+    quick = tag.endswith(QUICK_SUFFIX)
+    if quick:
+        tag = tag[: -len(QUICK_SUFFIX)]
+    return tag, quick, digest
+
+
+def hash_file(file_path: str, algorithm: Optional[str] = None, quick: Optional[bool] = None) -> str:
+    """
+    Hash a file's content and return the tagged hash.
+
+    Args:
+        file_path: File to hash
+        algorithm: Algorithm name (defaults to default_algorithm())
+        quick: Force (True) or disable (False) sampled hashing; None applies
+            the configured size threshold
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the algorithm is not available
+    """
+    algorithm = algorithm or default_algorithm()
+    if algorithm not in _ALGORITHMS:
+        raise ValueError(f"Hash algorithm not available: {algorithm}")
+
+    hasher = _ALGORITHMS[algorithm]()
+    buffer_size = max(settings.file_hash_buffer_size, 64 * 1024)
+
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+
+        if quick is None:
+            quick_threshold = settings.file_hash_quick_threshold_mb * 1024 * 1024
+            quick = quick_threshold > 0 and size >= quick_threshold
+
+        if quick:
+            _update_sampled(hasher, f, size, buffer_size)
+        elif settings.file_hash_mmap_threshold and size >= settings.file_hash_mmap_threshold:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+        else:
+            _update_buffered(hasher, f, buffer_size)
+
+    tag = f"{algorithm}{QUICK_SUFFIX}" if quick else algorithm
+    if algorithm == LEGACY_ALGORITHM and not quick:
+        # Keep legacy hashes untagged so they compare equal to existing index entries
+        return hasher.hexdigest()
+    return f"{tag}:{hasher.hexdigest()}"
+
+
+def hash_matches(file_path: str, stored_hash: Optional[str], current_hash: str) -> bool:
+    """
+    Whether a file still has the content recorded by stored_hash.
+
+    current_hash is the file's hash with the current algorithm; when stored_hash
+    was produced differently, the file is re-hashed the stored way to compare.
+    """
+    if not stored_hash:
+        return False
+    if stored_hash == current_hash:
+        return True
+
+    stored_algorithm, stored_quick, _ = parse_hash(stored_hash)
+    current_algorithm, current_quick, _ = parse_hash(current_hash)
+    if (stored_algorithm, stored_quick) == (current_algorithm, current_quick):
+        return False
+    if stored_algorithm not in _ALGORITHMS:
+        return False
+
+    try:
+        return hash_file(file_path, algorithm=stored_algorithm, quick=stored_quick) == stored_hash
+    except OSError:
+        return False
+
+
+def _update_buffered(hasher: Any, f, buffer_size: int) -> None:
+    """Feed the whole file through one reusable buffer."""
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    while True:
+        read = f.readinto(buffer)
+        if not read:
+            break
+        hasher.update(view[:read])
+
+
+def _update_sampled(hasher: Any, f, size: int, sample_size: int) -> None:
+    """Feed the size plus head, middle and tail samples of the file."""
+    hasher.update(size.to_bytes(8, "little"))
+    if size <= sample_size * 3:
+        _update_buffered(hasher, f, sample_size)
+        return
+    for offset in (0, size // 2 - sample_size // 2, size - sample_size):
+        f.seek(offset)
+        hasher.update(f.read(sample_size))
@@ -0,0 +1,129 @@
+"""
+Query embedding cache
+
+Hybrid searches that list the embedding field in query_by make Typesense
+embed the query text on every request, which dominates search latency on
+CPU-only hosts. Instead, each normalized query is embedded once and its
+vector is passed to later searches as an explicit vector_query.
+
+Typesense computes the vector: the query is stored in a small auto-embedding
+collection (same model as the file chunks) and the vector is read back from
+the stored document. Vectors are kept in memory for the most recent queries
+and in that collection for all users and sessions, across restarts. The
+collection is capped at query_embedding_max_stored documents, oldest first.
+"""
+
+import hashlib
+import threading
+import time
+import unicodedata
+from typing import Any, Optional
+
+import typesense
+
+from smart_search.core.config import settings
+from smart_search.core.logging import logger
+from smart_search.core.typesense_schema import get_query_embedding_schema
+from smart_search.services.result_cache import ResultCache
+
+# Stored queries added between two checks of the collection size
+PRUNE_INTERVAL = 100
+
+
+def normalize_query(query: str) -> str:
+    """Cache key of a query: Unicode-normalized, case-folded, single-spaced."""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+class QueryEmbeddingCache:
+    """
+    Embeddings of search queries, keyed by normalized query text.
+    """
+
+    def __init__(self, client: typesense.Client, collection_name: str):
+        """
+        Args:
+            client: Typesense client
+            collection_name: Collection storing query embeddings (created on first use)
+        """
+        self.client = client
+        self.collection_name = collection_name
+        # Normalized query -> vector formatted for vector_query
+        self._vectors: ResultCache[str] = ResultCache(settings.query_embedding_cache_size, float("inf"))
+        self._collection_ready = False
+        self._lock = threading.Lock()
+        self._added = 0
+
+    def get_vector(self, query: str) -> Optional[str]:
+        """
+        Embedding of a query as a comma-separated vector for vector_query.
+
+        Returns:
+            The vector, or None if it could not be computed (the caller
+            falls back to letting Typesense embed the query)
+        """
+        normalized = normalize_query(query)
+        if not normalized:
+            return None
+        try:
+            return self._vectors.get_or_load(normalized, lambda: self._load(normalized))
+        except Exception as e:
+            logger.warning(f"Cannot get query embedding: {e}")
+            return None
+
+    def get_cached_vector(self, query: str) -> Optional[str]:
+        """Vector of a query if it is in memory; never calls Typesense."""
+        normalized = normalize_query(query)
+        return self._vectors.get(normalized) if normalized else None
+
+    def _load(self, normalized: str) -> str:
+        documents = self._documents()
+        doc_id = hashlib.sha1(normalized.encode()).hexdigest()
+        try:
+            document = documents[doc_id].retrieve()
+        except typesense.exceptions.ObjectNotFound:
+            document = documents.upsert({"id": doc_id, "query": normalized, "created_at": int(time.time())})
+            self._added += 1
+            if self._added % PRUNE_INTERVAL == 0:
+                self._prune()
+            if "embedding" not in document:
+                document = documents[doc_id].retrieve()
+        return ",".join(str(value) for value in document["embedding"])
+
+    def _documents(self) -> Any:
+        """Documents API of the collection, created if missing."""
+        if not self._collection_ready:
+            with self._lock:
+                if not self._collection_ready:
+                    try:
+                        self.client.collections[self.collection_name].retrieve()
+                    except typesense.exceptions.ObjectNotFound:
+                        self.client.collections.create(get_query_embedding_schema(self.collection_name))
+                        logger.info(f"Created query embedding collection '{self.collection_name}'")
+                    self._collection_ready = True
+        return self.client.collections[self.collection_name].documents
+
+    def _prune(self) -> None:
+        """Delete the oldest stored queries beyond query_embedding_max_stored."""
+        try:
+            collection = self.client.collections[self.collection_name]
+            excess = collection.retrieve().get("num_documents", 0) - settings.query_embedding_max_stored
+            if excess <= 0:
+                return
+            # The created_at of the newest document to drop
+            results = collection.documents.search(
+                {
+                    "q": "*",
+                    "sort_by": "created_at:asc",
+                    "include_fields": "created_at",
+                    "per_page": 1,
+                    "page": excess,
+                }
+            )
+            hits = results.get("hits", [])
+            if hits:
+                cutoff = hits[0]["document"]["created_at"]
+                response = collection.documents.delete({"filter_by": f"created_at:<={cutoff}"})
+                logger.debug(f"Pruned {response.get('num_deleted', 0)} stored query embedding(s)")
+        except Exception as e:
+            logger.warning(f"Failed to prune query embeddings: {e}")
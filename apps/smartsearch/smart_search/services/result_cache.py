@@ -0,0 +1,157 @@
+"""
+In-memory result cache
+
+LRU cache with a time-to-live, used for read-heavy Typesense queries. Entries
+are dropped as a whole when the index is written to (invalidate), and
+concurrent requests for a missing key share a single load instead of each
+querying Typesense.
+
+Cached values are shared between callers and must be treated as read-only.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """A load in progress, waited on by requests for the same key."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class ResultCache(Generic[T]):
+    """
+    Thread-safe LRU + TTL cache with single-flight loading.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        """
+        Args:
+            max_entries: Entries kept before the least recently used is evicted (0 disables caching)
+            ttl_seconds: Age after which an entry is loaded again
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, T]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, _Flight] = {}
+        # Bumped by invalidate(); loads started before a bump are not stored
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T], cacheable: Optional[Callable[[T], bool]] = None) -> T:
+        """
+        Cached value for a key, loading it if missing or expired.
+
+        If the same key is already being loaded, waits for that load instead
+        of starting another one. Errors are raised to every waiting caller
+        and are not cached.
+
+        Args:
+            key: Cache key
+            loader: Computes the value on a miss
+            cacheable: Tells whether a loaded value may be stored (all values by default)
+
+        Returns:
+            The cached or loaded value
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if time.monotonic() - entry[0] < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+
+            flight = self._in_flight.get(key)
+            if flight is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                flight = self._in_flight[key] = _Flight()
+                generation = self._generation
+                self.misses += 1
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+                if (
+                    flight.error is None
+                    and generation == self._generation
+                    and self.max_entries > 0
+                    and (cacheable is None or cacheable(flight.value))
+                ):
+                    self._store(key, flight.value)
+            flight.done.set()
+        return flight.value
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """Cached value for a key, or None if missing or expired (never waits for a load)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations so far; pass it to put() to store a value loaded since."""
+        return self._generation
+
+    def put(self, key: Hashable, value: T, generation: int) -> None:
+        """
+        Store a value loaded by the caller (e.g. asynchronously).
+
+        Args:
+            key: Cache key
+            value: Loaded value
+            generation: The generation read before the load started; the value
+                is dropped if the cache was invalidated meanwhile
+        """
+        with self._lock:
+            if generation == self._generation and self.max_entries > 0:
+                self._store(key, value)
+
+    def invalidate(self) -> None:
+        """Drop every entry; loads in progress are served to their callers but not stored."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._in_flight.clear()
+
+    def _store(self, key: Hashable, value: T) -> None:
+        """Add an entry, evicting the least recently used; the lock must be held."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
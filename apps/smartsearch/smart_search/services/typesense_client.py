@@ -3,14 +3,89 @@ Typesense client for search operations
 """
 
 import hashlib
+import json
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
 
+import httpx
 import typesense
 
 from smart_search.core.config import settings
 from smart_search.core.logging import logger
-from smart_search.core.typesense_schema import get_collection_schema
+from smart_search.core.typesense_schema import EMBEDDING_SOURCE_FIELDS, get_collection_schema
+from smart_search.services.events import TOPIC_INDEX, get_event_bus
+from smart_search.services.query_embeddings import QueryEmbeddingCache
+from smart_search.services.result_cache import ResultCache
+
+# Fields searched by default (the embedding makes searches hybrid)
+SEARCH_QUERY_BY = "file_path,content,title,description,subject,keywords,author,comments,producer,application,embedding"
+
+SEARCH_MODE_KEYWORD = "keyword"
+SEARCH_MODE_HYBRID = "hybrid"
+SEARCH_MODE_SEMANTIC = "semantic"
+SEARCH_MODES = (SEARCH_MODE_KEYWORD, SEARCH_MODE_HYBRID, SEARCH_MODE_SEMANTIC)
+
+# Search parameters handled by multi_search() and not sent to Typesense
+SEARCH_MODE_PARAMS = ("search_mode", "hybrid_alpha")
+
+EMBEDDING_FIELD = "embedding"
+
+# Keys of the cached collection-wide aggregations
+STATS_COLLECTION = "collection_stats"
+STATS_FILE_TYPES = "file_type_distribution"
+STATS_CACHE_KEYS = (STATS_COLLECTION, STATS_FILE_TYPES)
+
+# File count: group_by counts unique files, not chunks
+STATS_COLLECTION_QUERY = {"q": "*", "group_by": "file_path", "group_limit": 1, "per_page": 0}
+# Files per extension, from facet counts only
+STATS_FILE_TYPES_QUERY = {**STATS_COLLECTION_QUERY, "facet_by": "file_extension", "max_facet_values": 100}
+
+
+def collection_stats(results: Dict[str, Any], collection: Dict[str, Any]) -> Dict[str, Any]:
+    """Collection stats from a STATS_COLLECTION_QUERY search and the collection schema."""
+    return {
+        "num_documents": results.get("found", 0),  # File count, not chunk count
+        "schema": collection,
+    }
+
+
+def file_type_distribution(results: Dict[str, Any]) -> Dict[str, int]:
+    """Extension -> file count from a STATS_FILE_TYPES_QUERY search."""
+    distribution = {}
+    for facet in results.get("facet_counts", []):
+        if facet.get("field_name") == "file_extension":
+            for count in facet.get("counts", []):
+                distribution[count.get("value", "unknown")] = count.get("count", 0)
+    return distribution
+
+
+def log_stats_error(method: str, description: str, error: Exception) -> None:
+    """Log a failed stats request; Typesense being unavailable (503, connection errors) is only a debug message."""
+    error_str = str(error)
+    if "503" in error_str or "Not Ready" in error_str or "Lagging" in error_str or "Connection" in error_str:
+        # Debug level to avoid flooding logs during startup/shutdown
+        logger.debug(f"Search engine unavailable in {method}: {error}")
+    else:
+        logger.error(f"Error getting {description}: {error}")
+
+
+# Search and stats caches per collection, shared by every TypesenseClient instance
+_result_caches: Dict[str, Tuple[ResultCache[Dict[str, Any]], ResultCache[Any]]] = {}
+_result_caches_lock = threading.Lock()
+
+
+def _shared_result_caches(collection_name: str) -> Tuple[ResultCache[Dict[str, Any]], ResultCache[Any]]:
+    """The (search results, collection stats) caches of a collection."""
+    with _result_caches_lock:
+        caches = _result_caches.get(collection_name)
+        if caches is None:
+            caches = _result_caches[collection_name] = (
+                ResultCache(settings.search_cache_max_entries, settings.search_cache_ttl_seconds),
+                ResultCache(len(STATS_CACHE_KEYS), settings.stats_cache_ttl_seconds),
+            )
+        return caches
 
 
 class TypesenseClient:
@@ -36,6 +111,34 @@ class TypesenseClient:
         self.collection_name = settings.typesense_collection_name
         # Flag to indicate whether the collection is confirmed ready.
         self.collection_ready = False
+        # Lazily created client with a longer timeout for bulk imports
+        self._import_client: Optional[typesense.Client] = None
+        # Search results and stats (dropped whenever the index is written to), shared by
+        # every client of the collection so a write through any of them invalidates them
+        self.search_cache, self.stats_cache = _shared_result_caches(self.collection_name)
+        # Query vectors, so Typesense does not embed the same query again
+        self.query_embeddings = QueryEmbeddingCache(self.client, f"{self.collection_name}_queries")
+
+    def _index_written(self) -> None:
+        """Drop cached search results and stats and announce that the index changed."""
+        self.search_cache.invalidate()
+        self.stats_cache.invalidate()
+        get_event_bus().publish(TOPIC_INDEX)
+
+    def _collection_created(self) -> None:
+        """
+        Drop local state describing the indexed files once a new, empty collection exists.
+
+        Otherwise catalogued files and unchanged directories would be skipped by
+        the next crawl and never indexed into the new collection.
+        """
+        from smart_search.services.crawler.catalog import get_file_catalog
+        from smart_search.services.crawler.index_stats import get_index_stats
+        from smart_search.services.crawler.snapshots import get_directory_snapshot_store
+
+        get_file_catalog().clear()
+        get_directory_snapshot_store().clear()
+        get_index_stats().clear()
 
     def check_collection_exists(self) -> bool:
         """
@@ -157,6 +260,8 @@ class TypesenseClient:
                         f"(attempt {attempt}/{max_attempts})"
                     )
 
+                    self._collection_created()
+
                     # 4. Finalizing
                     service_manager.set_service_phase(
                         service_name,
@@ -259,7 +364,7 @@ class TypesenseClient:
             logger.error(f"Error getting indexed file: {e}")
             return None
 
-    def index_file(
+    def build_chunk_document(
         self,
         file_path: str,
         content: str,
@@ -274,9 +379,9 @@ class TypesenseClient:
         created_time: int,
         file_hash: str,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> None:
+    ) -> Dict[str, Any]:
         """
-        Index (upsert) a file chunk in Typesense.
+        Build the Typesense document for a single file chunk.
 
         All chunks contain complete metadata for simplified querying and filtering.
 
@@ -293,6 +398,9 @@ class TypesenseClient:
             created_time: Created timestamp in ms
             file_hash: File content hash
             metadata: Additional metadata from extraction (Tika fields)
+
+        Returns:
+            Document dict ready for upsert/import
         """
         doc_id = self.generate_doc_id(file_path, chunk_index)
 
@@ -352,14 +460,230 @@ class TypesenseClient:
             document["content_type"] = ""
             document["keywords"] = []
 
+        return document
+
+    def index_file(
+        self,
+        file_path: str,
+        content: str,
+        chunk_index: int,
+        chunk_total: int,
+        chunk_hash: str,
+        # Metadata (now required for all chunks)
+        file_extension: str,
+        file_size: int,
+        mime_type: str,
+        modified_time: int,
+        created_time: int,
+        file_hash: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Index (upsert) a single file chunk in Typesense.
+
+        Prefer index_chunks() when indexing more than one chunk; this method costs
+        one HTTP round trip (and one embedding call) per chunk.
+
+        Args: see build_chunk_document()
+        """
+        document = self.build_chunk_document(
+            file_path=file_path,
+            content=content,
+            chunk_index=chunk_index,
+            chunk_total=chunk_total,
+            chunk_hash=chunk_hash,
+            file_extension=file_extension,
+            file_size=file_size,
+            mime_type=mime_type,
+            modified_time=modified_time,
+            created_time=created_time,
+            file_hash=file_hash,
+            metadata=metadata,
+        )
+
         try:
             # Use upsert to handle both create and update
             self.client.collections[self.collection_name].documents.upsert(document)
+            self._index_written()
             logger.debug(f"Indexed chunk {chunk_index}/{chunk_total} of: {file_path}")
         except Exception as e:
             logger.error(f"Error indexing chunk {chunk_index} of {file_path}: {e}")
             raise
 
+    def index_chunks(
+        self,
+        documents: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        max_batch_bytes: Optional[int] = None,
+        action: str = "upsert",
+    ) -> Dict[str, Any]:
+        """
+        Upsert many chunk documents (of one or several files) via the bulk import endpoint.
+
+        Documents are serialized to JSONL and split into batches bounded both by
+        document count and by payload size, so one large file does not produce a
+        single oversized request. Each batch costs one HTTP round trip.
+
+        Args:
+            documents: Documents built with build_chunk_document()
+            batch_size: Max documents per import request (default: settings.typesense_import_batch_size)
+            max_batch_bytes: Max JSONL payload per import request (default: settings.typesense_import_max_bytes)
+            action: Import action; "update" applies partial documents (see metadata_update())
+
+        Returns:
+            Dict with 'successful' and 'failed' counts, and 'errors': a list of
+            {'id', 'file_path', 'error'} entries for documents that were rejected.
+        """
+        batch_size = batch_size or settings.typesense_import_batch_size
+        max_batch_bytes = max_batch_bytes or settings.typesense_import_max_bytes
+
+        successful = 0
+        errors: List[Dict[str, Any]] = []
+        import_api = self._get_import_client().collections[self.collection_name].documents
+
+        for batch in self._split_import_batches(documents, batch_size, max_batch_bytes):
+            batch_docs = [doc for doc, _ in batch]
+            try:
+                response = import_api.import_("\n".join(line for _, line in batch), {"action": action})
+                results = [json.loads(line) for line in response.splitlines() if line.strip()]
+            except Exception as e:
+                # Whole batch failed (connection error, timeout, 5xx...)
+                logger.error(f"Error importing batch of {len(batch_docs)} chunk(s): {e}")
+                errors.extend(
+                    {"id": doc.get("id"), "file_path": doc.get("file_path"), "error": str(e)} for doc in batch_docs
+                )
+                continue
+
+            successful += self._collect_import_results(batch_docs, results, errors)
+
+        if successful:
+            self._index_written()
+        logger.debug(f"Imported {successful} chunk(s), {len(errors)} failed")
+        return {"successful": successful, "failed": len(errors), "errors": errors}
+
+    @staticmethod
+    def _collect_import_results(
+        batch_docs: List[Dict[str, Any]], results: List[Dict[str, Any]], errors: List[Dict[str, Any]]
+    ) -> int:
+        """Add the rejected documents of an import batch to errors; returns the number imported."""
+        successful = 0
+        # Typesense returns one result line per document, in input order
+        for doc, result in zip(batch_docs, results):
+            if result.get("success"):
+                successful += 1
+            else:
+                error = result.get("error", "Unknown import error")
+                logger.error(f"Error indexing chunk {doc.get('chunk_index')} of {doc.get('file_path')}: {error}")
+                errors.append({"id": doc.get("id"), "file_path": doc.get("file_path"), "error": error})
+
+        # Guard against a truncated response
+        for doc in batch_docs[len(results) :]:
+            errors.append({"id": doc.get("id"), "file_path": doc.get("file_path"), "error": "No import result"})
+        return successful
+
+    @staticmethod
+    def metadata_update(document: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Partial document refreshing a chunk's file metadata without re-embedding it.
+
+        The embedding source fields are left out, so Typesense keeps the stored embedding.
+        """
+        return {key: value for key, value in document.items() if key not in EMBEDDING_SOURCE_FIELDS}
+
+    def get_chunk_hashes(self, file_paths: List[str]) -> Dict[str, Dict[int, str]]:
+        """
+        Indexed chunk hashes of the given files.
+
+        Paths are looked up through the export endpoint in a few `file_path:=[...]`
+        filters (sized like delete filters). Paths that cannot be quoted in a
+        filter are left out.
+
+        Returns:
+            file_path -> {chunk_index: chunk_hash}
+
+        Raises:
+            httpx.HTTPError: If a request fails
+        """
+        unique_paths = [path for path in dict.fromkeys(file_paths) if self._is_filterable(path)]
+        hashes: Dict[str, Dict[int, str]] = {}
+        for _, filter_by in self._split_path_filters(
+            unique_paths, settings.typesense_delete_batch_size, settings.typesense_delete_max_filter_length
+        ):
+            for doc in self.export_documents(include_fields="file_path,chunk_index,chunk_hash", filter_by=filter_by):
+                hashes.setdefault(doc["file_path"], {})[int(doc.get("chunk_index", 0))] = doc.get("chunk_hash", "")
+        return hashes
+
+    def remove_chunks(self, doc_ids: List[str]) -> int:
+        """
+        Remove chunk documents by id, in batches of typesense_delete_batch_size.
+
+        Returns:
+            Number of documents deleted
+        """
+        documents_api = self.client.collections[self.collection_name].documents
+        deleted = 0
+        try:
+            for start in range(0, len(doc_ids), settings.typesense_delete_batch_size):
+                batch = doc_ids[start : start + settings.typesense_delete_batch_size]
+                response = documents_api.delete({"filter_by": f"id:[{','.join(batch)}]"})
+                deleted += response.get("num_deleted", 0)
+        finally:
+            if deleted:
+                self._index_written()
+        return deleted
+
+    @staticmethod
+    def _split_import_batches(
+        documents: List[Dict[str, Any]], batch_size: int, max_batch_bytes: int
+    ) -> Iterator[List[Tuple[Dict[str, Any], str]]]:
+        """
+        Serialize documents to JSONL lines and group them into import batches.
+
+        A batch is closed when it reaches batch_size documents or when adding the
+        next line would exceed max_batch_bytes. A single document larger than
+        max_batch_bytes is sent on its own.
+        """
+        batch: List[Tuple[Dict[str, Any], str]] = []
+        batch_bytes = 0
+
+        for doc in documents:
+            line = json.dumps(doc)
+            line_bytes = len(line.encode("utf-8")) + 1  # + newline separator
+
+            if batch and (len(batch) >= batch_size or batch_bytes + line_bytes > max_batch_bytes):
+                yield batch
+                batch = []
+                batch_bytes = 0
+
+            batch.append((doc, line))
+            batch_bytes += line_bytes
+
+        if batch:
+            yield batch
+
+    def _get_import_client(self) -> typesense.Client:
+        """
+        Client used for bulk imports.
+
+        Imports embed every document server-side, which can take far longer than
+        the default connection timeout, so they get their own timeout.
+        """
+        if self._import_client is None:
+            self._import_client = typesense.Client(
+                {
+                    "nodes": [
+                        {
+                            "host": settings.typesense_host,
+                            "port": settings.typesense_port,
+                            "protocol": settings.typesense_protocol,
+                        }
+                    ],
+                    "api_key": settings.typesense_api_key,
+                    "connection_timeout_seconds": settings.typesense_import_timeout,
+                }
+            )
+        return self._import_client
+
     def remove_from_index(self, file_path: str) -> None:
         """
         Remove all chunks of a file from index.
@@ -367,12 +691,19 @@ class TypesenseClient:
         Uses filter-based deletion to remove all documents with matching file_path.
         """
         try:
-            # Delete all chunks for this file path
-            self.client.collections[self.collection_name].documents.delete({"filter_by": f"file_path:={file_path}"})
+            if self._is_filterable(file_path):
+                # Delete all chunks for this file path
+                self.client.collections[self.collection_name].documents.delete(
+                    {"filter_by": f"file_path:={self._filter_value(file_path)}"}
+                )
+            else:
+                self._remove_by_chunk_ids(file_path)
             logger.info(f"Removed all chunks from index: {file_path}")
         except Exception as e:
             logger.error(f"Error removing {file_path}: {e}")
             raise
+        finally:
+            self._index_written()
 
     def search_files(
         self,
@@ -382,109 +713,202 @@ class TypesenseClient:
         filter_by: Optional[str] = None,
         sort_by: str = "modified_time:desc",
     ) -> Dict[str, Any]:
-        """Search indexed files"""
-        try:
-            search_parameters = {
-                "q": query,
-                "query_by": "file_path,file_name,content,title,description,subject,author,keywords,comments",
-                "page": page,
-                "per_page": per_page,
-                "sort_by": sort_by,
-            }
+        """Search indexed files (one hit per file, cached)"""
+        search_parameters = {
+            "q": query,
+            "query_by": SEARCH_QUERY_BY,
+            "exclude_fields": "embedding",
+            "group_by": "file_path",
+            "group_limit": 1,
+            "page": page,
+            "per_page": per_page,
+            "sort_by": sort_by,
+        }
 
-            if filter_by:
-                search_parameters["filter_by"] = filter_by
+        if filter_by:
+            search_parameters["filter_by"] = filter_by
 
-            results = self.client.collections[self.collection_name].documents.search(search_parameters)
+        return self.multi_search([search_parameters])["results"][0]
 
-            return results
-        except Exception as e:
-            logger.error(f"Search error: {e}")
-            raise
+    def multi_search(
+        self, searches: List[Dict[str, Any]], common_params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run searches against the collection in one request, through the search cache.
 
-    def get_collection_stats(self) -> Dict[str, Any]:
+        Identical requests are answered from the cache until the index changes
+        or search_cache_ttl_seconds pass; identical concurrent requests share
+        one Typesense call.
+
+        Besides Typesense parameters, searches (or common_params) may set:
+        - search_mode: 'keyword' (embedding left out of query_by), 'hybrid'
+          or 'semantic' (vector only); defaults to the search_mode setting
+        - hybrid_alpha: weight of vector results in hybrid mode
+
+        Searches whose query_by lists the embedding field get the query vector
+        from the query embedding cache instead of having Typesense embed the
+        query text.
+
+        Args:
+            searches: Typesense search parameters, one dict per search (the collection is always this one)
+            common_params: Parameters applied to every search
+
+        Returns:
+            Typesense multi_search response ({"results": [...]}); shared, do not modify
+
+        Raises:
+            ValueError: For an unknown search_mode or an invalid hybrid_alpha
         """
-        Get collection statistics.
+        searches = [{**search, "collection": self.collection_name} for search in searches]
+        common_params = dict(common_params or {})
+        key = json.dumps([searches, common_params], sort_keys=True, default=str)
+
+        def load() -> Dict[str, Any]:
+            prepared = [self._apply_search_mode(search, common_params) for search in searches]
+            params = {name: value for name, value in common_params.items() if name not in SEARCH_MODE_PARAMS}
+            try:
+                return self.client.multi_search.perform({"searches": prepared}, params)
+            except Exception as e:
+                logger.error(f"Search error: {e}")
+                raise
+
+        # Failed searches are reported inside the response; only complete responses are cached
+        return self.search_cache.get_or_load(
+            key, load, lambda response: not any("error" in result for result in response.get("results", []))
+        )
+
+    def _search_mode(self, search: Dict[str, Any], common_params: Dict[str, Any]) -> Tuple[str, float]:
+        """
+        Validated search_mode and hybrid_alpha of a search.
 
-        Returns file count (not chunk count) by grouping by file_path.
+        Raises:
+            ValueError: For an unknown search_mode or an invalid hybrid_alpha
         """
+        mode = search.get("search_mode") or common_params.get("search_mode") or settings.search_mode
+        alpha = search.get("hybrid_alpha")
+        if alpha is None:
+            alpha = common_params.get("hybrid_alpha", settings.search_hybrid_alpha)
+        mode = str(mode).lower()
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search_mode '{mode}' (expected one of {SEARCH_MODES})")
         try:
-            # Use group_by to count unique files
-            results = self.client.collections[self.collection_name].documents.search(
-                {
-                    "q": "*",
-                    "group_by": "file_path",
-                    "group_limit": 1,
-                    "per_page": 0,  # We only need the count
-                }
-            )
-            file_count = results.get("found", 0)
+            alpha = float(alpha)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid hybrid_alpha '{alpha}'")
+        if not 0 <= alpha <= 1:
+            raise ValueError(f"hybrid_alpha must be between 0 and 1, got {alpha}")
+        return mode, alpha
 
-            collection = self.client.collections[self.collection_name].retrieve()
+    @staticmethod
+    def _query_by_fields(search: Dict[str, Any], common_params: Dict[str, Any]) -> List[str]:
+        query_by = search.get("query_by", common_params.get("query_by", ""))
+        return [name.strip() for name in str(query_by).split(",")]
+
+    def _vector_query_text(self, search: Dict[str, Any], common_params: Dict[str, Any]) -> Optional[str]:
+        """Query text whose embedding a search is run with, or None if it needs no query vector."""
+        mode, _ = self._search_mode(search, common_params)
+        query = str(search.get("q", common_params.get("q", ""))).strip()
+        if (
+            mode == SEARCH_MODE_KEYWORD
+            or not query
+            or query == "*"
+            or "vector_query" in search
+            or EMBEDDING_FIELD not in self._query_by_fields(search, common_params)
+        ):
+            return None
+        return query
 
-            # Since we successfully retrieved data, the collection is ready
-            self.collection_ready = True
+    def _apply_search_mode(
+        self,
+        search: Dict[str, Any],
+        common_params: Dict[str, Any],
+        get_vector: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Turn the search_mode of a search into Typesense parameters.
 
-            return {
-                "num_documents": file_count,  # File count, not chunk count
-                "schema": collection,
-            }
+        Args:
+            search: Search parameters, possibly with search_mode and hybrid_alpha
+            common_params: Parameters applied to every search
+            get_vector: Looks up query vectors (the query embedding cache by default)
+        """
+        mode, alpha = self._search_mode(search, common_params)
+        query_text = self._vector_query_text(search, common_params)
+        search = {name: value for name, value in search.items() if name not in SEARCH_MODE_PARAMS}
+        fields = self._query_by_fields(search, common_params)
+        if EMBEDDING_FIELD not in fields or "vector_query" in search:
+            return search
+
+        vector = None
+        if query_text is not None:
+            vector = (get_vector or self.query_embeddings.get_vector)(query_text)
+            if vector is None:
+                # Let Typesense embed the query itself
+                return search
+
+        # Drop the embedding from query_by (and its weight, if weights are given)
+        position = fields.index(EMBEDDING_FIELD)
+        search["query_by"] = ",".join(fields[:position] + fields[position + 1 :])
+        weights = search.get("query_by_weights", common_params.get("query_by_weights"))
+        if weights:
+            weights = str(weights).split(",")
+            search["query_by_weights"] = ",".join(weights[:position] + weights[position + 1 :])
+
+        if vector is None:
+            return search
+        if mode == SEARCH_MODE_SEMANTIC:
+            search["q"] = "*"
+            search["vector_query"] = f"{EMBEDDING_FIELD}:([{vector}])"
+        else:
+            search["vector_query"] = f"{EMBEDDING_FIELD}:([{vector}], alpha: {alpha})"
+        return search
+
+    def get_collection_stats(self) -> Dict[str, Any]:
+        """
+        Get collection statistics.
+
+        Returns file count (not chunk count) by grouping by file_path. The
+        result is cached for stats_cache_ttl_seconds or until the index is
+        written to; concurrent callers share one request.
+        """
+        try:
+            return self.stats_cache.get_or_load(STATS_COLLECTION, self._load_collection_stats)
         except Exception as e:
             # If we failed to get stats, we can't be sure the collection is ready
             # But we don't necessarily want to set it to False if it was previously True
             # (transient errors shouldn't disable readiness flag generally)
-
-            # Check if this is a Typesense unavailability error (503, connection errors, etc.)
-            error_str = str(e)
-            if "503" in error_str or "Not Ready" in error_str or "Lagging" in error_str or "Connection" in error_str:
-                # Log as debug to avoid flooding logs during startup/shutdown
-                logger.debug(f"Search engine unavailable in get_collection_stats: {e}")
-            else:
-                logger.error(f"Error getting stats: {e}")
+            log_stats_error("get_collection_stats", "stats", e)
             raise
 
+    def _load_collection_stats(self) -> Dict[str, Any]:
+        results = self.client.collections[self.collection_name].documents.search(dict(STATS_COLLECTION_QUERY))
+        collection = self.client.collections[self.collection_name].retrieve()
+
+        # Since we successfully retrieved data, the collection is ready
+        self.collection_ready = True
+
+        return collection_stats(results, collection)
+
     def get_file_type_distribution(self) -> Dict[str, int]:
         """
         Get distribution of indexed files by file extension via faceting.
 
-        Returns file count (not chunk count) by grouping by file_path.
+        Returns file count (not chunk count) by grouping by file_path. Cached
+        like get_collection_stats().
 
         Returns:
             Dict mapping file_extension to count, e.g. {".pdf": 42, ".txt": 15}
         """
         try:
-            # Use group_by to get unique files, then facet by extension
-            results = self.client.collections[self.collection_name].documents.search(
-                {
-                    "q": "*",
-                    "group_by": "file_path",
-                    "group_limit": 1,
-                    "facet_by": "file_extension",
-                    "max_facet_values": 100,
-                    "per_page": 0,  # We only want facet counts, not documents
-                }
-            )
-
-            facets = results.get("facet_counts", [])
-            distribution = {}
-
-            for facet in facets:
-                if facet.get("field_name") == "file_extension":
-                    for count in facet.get("counts", []):
-                        ext = count.get("value", "unknown")
-                        cnt = count.get("count", 0)
-                        distribution[ext] = cnt
-
-            return distribution
+            return self.stats_cache.get_or_load(STATS_FILE_TYPES, self._load_file_type_distribution)
         except Exception as e:
-            # Check if this is a Typesense unavailability error
-            error_str = str(e)
-            if "503" in error_str or "Not Ready" in error_str or "Lagging" in error_str or "Connection" in error_str:
-                logger.debug(f"Search engine unavailable in get_file_type_distribution: {e}")
-            else:
-                logger.error(f"Error getting file type distribution: {e}")
+            log_stats_error("get_file_type_distribution", "file type distribution", e)
             return {}
 
+    def _load_file_type_distribution(self) -> Dict[str, int]:
+        results = self.client.collections[self.collection_name].documents.search(dict(STATS_FILE_TYPES_QUERY))
+        return file_type_distribution(results)
+
     def reset_collection(self) -> None:
         """
         Reset the collection by dropping and recreating it.
@@ -520,10 +944,57 @@ class TypesenseClient:
 
             collection_creation_client.collections.create(schema)
             logger.info(f"Recreated Typesense collection '{self.collection_name}' with latest schema")
+            self._collection_created()
             self.collection_ready = True
         except Exception as e:
             logger.error(f"Error resetting collection: {e}")
             raise
+        finally:
+            self._index_written()
+
+    def export_documents(
+        self,
+        include_fields: Optional[str] = None,
+        exclude_fields: Optional[str] = None,
+        filter_by: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream documents from the export endpoint, one document at a time.
+
+        The JSONL response is read incrementally, so memory use does not grow
+        with the collection size (the SDK's export() buffers the whole body).
+
+        Args:
+            include_fields: Comma-separated fields to return
+            exclude_fields: Comma-separated fields to leave out
+            filter_by: Typesense filter expression
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        params = {
+            key: value
+            for key, value in {
+                "include_fields": include_fields,
+                "exclude_fields": exclude_fields,
+                "filter_by": filter_by,
+            }.items()
+            if value
+        }
+        url = f"{settings.typesense_url}/collections/{self.collection_name}/documents/export"
+        timeout = httpx.Timeout(settings.typesense_import_timeout, connect=settings.typesense_connection_timeout)
+
+        with httpx.stream(
+            "GET",
+            url,
+            params=params,
+            headers={"X-TYPESENSE-API-KEY": settings.typesense_api_key},
+            timeout=timeout,
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line.strip():
+                    yield json.loads(line)
 
     def get_all_indexed_files(self, limit: int = 1000, offset: int = 0) -> List[Dict[str, Any]]:
         """
@@ -570,31 +1041,130 @@ class TypesenseClient:
             logger.error(f"Error getting indexed files count: {e}")
             return 0
 
-    def batch_remove_files(self, file_paths: List[str]) -> Dict[str, int]:
+    def batch_remove_files(
+        self,
+        file_paths: List[str],
+        batch_size: Optional[int] = None,
+        max_filter_length: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
-        Remove multiple files from index efficiently.
+        Remove every chunk of many files from index efficiently.
+
+        Paths are grouped into `file_path:=[...]` delete-by-filter requests bounded
+        by path count and by URL-encoded filter length, so each request removes all
+        chunks of up to batch_size files.
 
-        Returns dict with 'successful' and 'failed' counts.
+        Args:
+            file_paths: Files to remove
+            batch_size: Max paths per delete request (default: settings.typesense_delete_batch_size)
+            max_filter_length: Max URL-encoded filter length (default: settings.typesense_delete_max_filter_length)
+
+        Returns:
+            Dict with 'successful' and 'failed' file counts, 'failed_paths' (files whose
+            delete request failed) and 'documents_deleted' chunk count.
         """
+        batch_size = batch_size or settings.typesense_delete_batch_size
+        max_filter_length = max_filter_length or settings.typesense_delete_max_filter_length
+
+        unique_paths = list(dict.fromkeys(file_paths))
+        filterable = [path for path in unique_paths if self._is_filterable(path)]
+        unfilterable = [path for path in unique_paths if not self._is_filterable(path)]
+
         successful = 0
-        failed = 0
+        failed_paths: List[str] = []
+        documents_deleted = 0
+        documents_api = self.client.collections[self.collection_name].documents
 
-        for file_path in file_paths:
+        for paths, filter_by in self._split_path_filters(filterable, batch_size, max_filter_length):
             try:
-                doc_id = self.generate_doc_id(file_path)
-                self.client.collections[self.collection_name].documents[doc_id].delete()
-                successful += 1
-                logger.debug(f"Removed orphaned index entry: {file_path}")
-            except typesense.exceptions.ObjectNotFound:
-                # File already not in index, count as successful
+                response = documents_api.delete({"filter_by": filter_by})
+                documents_deleted += response.get("num_deleted", 0)
+                successful += len(paths)
+            except Exception as e:
+                failed_paths.extend(paths)
+                logger.error(f"Failed to remove batch of {len(paths)} file(s) from index: {e}")
+
+        for file_path in unfilterable:
+            try:
+                documents_deleted += self._remove_by_chunk_ids(file_path)
                 successful += 1
-                logger.debug(f"Orphaned file already removed: {file_path}")
             except Exception as e:
-                failed += 1
-                logger.error(f"Failed to remove orphaned index entry {file_path}: {e}")
+                failed_paths.append(file_path)
+                logger.error(f"Failed to remove index entries of {file_path}: {e}")
+
+        failed = len(failed_paths)
+
+        if documents_deleted:
+            self._index_written()
+
+        logger.info(
+            f"Batch cleanup completed: {successful} successful, {failed} failed, {documents_deleted} chunk(s) deleted"
+        )
+        return {
+            "successful": successful,
+            "failed": failed,
+            "failed_paths": failed_paths,
+            "documents_deleted": documents_deleted,
+        }
+
+    @staticmethod
+    def _is_filterable(value: str) -> bool:
+        """Backtick-quoted filter values cannot contain a backtick."""
+        return "`" not in value
+
+    @staticmethod
+    def _filter_value(value: str) -> str:
+        """Quote a string filter value so commas, spaces and brackets are matched literally."""
+        return f"`{value}`"
+
+    @classmethod
+    def _split_path_filters(
+        cls, file_paths: List[str], batch_size: int, max_filter_length: int
+    ) -> Iterator[Tuple[List[str], str]]:
+        """
+        Group paths into `file_path:=[...]` filters.
+
+        A group is closed when it holds batch_size paths or when adding the next
+        path would push the URL-encoded filter past max_filter_length. A single
+        path longer than the limit is sent on its own.
+        """
+        prefix_length = len(quote("file_path:=[]", safe=""))
+        separator_length = len(quote(",", safe=""))
+
+        batch: List[str] = []
+        values: List[str] = []
+        length = prefix_length
+
+        for file_path in file_paths:
+            value = cls._filter_value(file_path)
+            value_length = len(quote(value, safe="")) + (separator_length if values else 0)
+
+            if batch and (len(batch) >= batch_size or length + value_length > max_filter_length):
+                yield batch, f"file_path:=[{','.join(values)}]"
+                batch, values, length = [], [], prefix_length
+                value_length = len(quote(value, safe=""))
+
+            batch.append(file_path)
+            values.append(value)
+            length += value_length
+
+        if batch:
+            yield batch, f"file_path:=[{','.join(values)}]"
+
+    def _remove_by_chunk_ids(self, file_path: str) -> int:
+        """
+        Remove a file's chunks by id, for paths that cannot be expressed in a filter.
+
+        The chunk count is read from chunk 0. Returns the number of documents deleted.
+        """
+        documents_api = self.client.collections[self.collection_name].documents
+        try:
+            first_chunk = documents_api[self.generate_doc_id(file_path, 0)].retrieve()
+        except typesense.exceptions.ObjectNotFound:
+            return 0
 
-        logger.info(f"Batch cleanup completed: {successful} successful, {failed} failed")
-        return {"successful": successful, "failed": failed}
+        chunk_total = max(int(first_chunk.get("chunk_total") or 1), 1)
+        return self.remove_chunks([self.generate_doc_id(file_path, i) for i in range(chunk_total)])
 
 
 # Global client instance
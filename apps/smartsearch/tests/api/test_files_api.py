@@ -2,6 +2,13 @@
 API tests for /api/v1/files endpoints.
 """
 
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from smart_search.services.async_typesense_client import AsyncTypesenseClient
+from smart_search.services.typesense_client import TypesenseClient
+
 
 def test_get_file_operation_info(client):
     """Returns supported operations."""
@@ -43,3 +50,34 @@ def test_open_folder_not_found(client):
     )
 
     assert response.status_code == 404
+
+
+def test_forget_invalidates_cached_search_results(client, tmp_path):
+    """A forgotten file is not served from the search cache afterwards."""
+    path = tmp_path / "report.txt"
+    path.write_text("quarterly report")
+    typesense_client = TypesenseClient()
+    typesense_client.client = MagicMock()
+    searches = []
+
+    def handler(request):
+        searches.append(request)
+        return httpx.Response(200, json={"results": [{"found": 1, "hits": [{"document": {"file_path": str(path)}}]}]})
+
+    async_client = AsyncTypesenseClient(sync_client=typesense_client, transport=httpx.MockTransport(handler))
+    search = {"searches": [{"q": "report", "query_by": "content"}]}
+    with (
+        patch("smart_search.services.typesense_client._client", typesense_client),
+        patch("smart_search.api.v1.endpoints.search.get_async_typesense_client", return_value=async_client),
+        patch("smart_search.api.v1.endpoints.files.get_file_catalog"),
+        patch("smart_search.api.v1.endpoints.files.get_index_stats"),
+        patch("smart_search.api.v1.endpoints.files.get_directory_snapshot_store"),
+    ):
+        assert client.post("/api/v1/search/multi_search", json=search).status_code == 200
+        assert client.post("/api/v1/search/multi_search", json=search).status_code == 200
+        forget = client.post("/api/v1/files/forget", json={"file_path": str(path), "operation": "forget"})
+        assert client.post("/api/v1/search/multi_search", json=search).status_code == 200
+
+    assert forget.status_code == 200
+    typesense_client.client.collections.__getitem__.return_value.documents.delete.assert_called_once()
+    assert len(searches) == 2
@@ -0,0 +1,92 @@
+"""
+API tests for /api/v1/index endpoints.
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import typesense
+
+from smart_search.api.v1.endpoints.index import export_index
+
+
+def _typesense(documents=(), error=None, closed=None):
+    client = MagicMock()
+
+    async def export_documents(**kwargs):
+        try:
+            for document in documents:
+                yield document
+            if error is not None:
+                raise error
+        finally:
+            if closed is not None:
+                closed.append(True)
+
+    client.export_documents = MagicMock(side_effect=export_documents)
+    return patch("smart_search.api.v1.endpoints.index.get_async_typesense_client", return_value=client)
+
+
+def test_export_streams_json_lines(client):
+    documents = [{"id": "a", "file_path": "/a.txt"}, {"id": "b", "file_path": "/b.txt"}]
+    with _typesense(documents) as get_client:
+        response = client.get("/api/v1/index/export?filter_by=chunk_index:=0&include_fields=id,file_path")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in response.text.splitlines()] == documents
+    get_client.return_value.export_documents.assert_called_once_with(
+        include_fields="id,file_path", exclude_fields="embedding", filter_by="chunk_index:=0"
+    )
+
+
+def test_export_empty_index(client):
+    with _typesense():
+        response = client.get("/api/v1/index/export")
+
+    assert response.status_code == 200
+    assert response.text == ""
+
+
+def test_export_malformed_filter(client):
+    with _typesense(error=typesense.exceptions.RequestMalformed("Could not parse the filter query")):
+        response = client.get("/api/v1/index/export?filter_by=nope")
+
+    assert response.status_code == 400
+
+
+def test_export_typesense_unavailable(client):
+    with _typesense(error=typesense.exceptions.ServiceUnavailable("Not Ready")):
+        response = client.get("/api/v1/index/export")
+
+    assert response.status_code == 503
+
+
+def test_export_interrupted_mid_stream_aborts_response(client):
+    """A failure after the first document aborts the transfer instead of ending it cleanly."""
+    closed = []
+    documents = [{"id": "a"}, {"id": "b"}]
+    with _typesense(documents, error=typesense.exceptions.ServiceUnavailable("Not Ready"), closed=closed):
+        with pytest.raises(typesense.exceptions.ServiceUnavailable):
+            client.get("/api/v1/index/export")
+
+    assert closed == [True]
+
+
+def test_export_closes_typesense_stream_on_disconnect():
+    """Closing the response body early (client gone) closes the export request."""
+    closed = []
+
+    async def read_one_document():
+        response = await export_index(include_fields=None, exclude_fields="embedding", filter_by=None)
+        first = await anext(response.body_iterator)
+        await response.body_iterator.aclose()
+        return first, list(closed)
+
+    with _typesense([{"id": str(i)} for i in range(100)], closed=closed):
+        first, closed_before_exit = asyncio.run(read_one_document())
+
+    assert json.loads(first) == {"id": "0"}
+    assert closed_before_exit == [True]
@@ -0,0 +1,54 @@
+"""
+API tests for /api/v1/search endpoints.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import typesense
+
+
+def _typesense(response=None, error=None):
+    client = MagicMock()
+    client.multi_search = AsyncMock(return_value=response or {"results": [{"found": 0, "hits": []}]}, side_effect=error)
+    return patch("smart_search.api.v1.endpoints.search.get_async_typesense_client", return_value=client)
+
+
+def test_multi_search_proxies_instantsearch_requests(client):
+    with _typesense() as get_client:
+        response = client.post(
+            "/api/v1/search/multi_search?x-typesense-api-key=backend&per_page=24",
+            json={"searches": [{"collection": "files", "q": "report", "query_by": "content"}]},
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"results": [{"found": 0, "hits": []}]}
+    get_client.return_value.multi_search.assert_awaited_once_with(
+        [{"collection": "files", "q": "report", "query_by": "content"}], {"per_page": "24"}
+    )
+
+
+def test_multi_search_requires_searches(client):
+    response = client.post("/api/v1/search", json={})
+
+    assert response.status_code == 422
+
+
+def test_multi_search_malformed_request(client):
+    with _typesense(error=typesense.exceptions.RequestMalformed("bad query_by")):
+        response = client.post("/api/v1/search", json={"searches": [{"q": "x"}]})
+
+    assert response.status_code == 400
+
+
+def test_multi_search_typesense_unavailable(client):
+    with _typesense(error=typesense.exceptions.ServiceUnavailable("Not Ready")):
+        response = client.post("/api/v1/search", json={"searches": [{"q": "x"}]})
+
+    assert response.status_code == 503
+
+
+def test_multi_search_unknown_mode(client):
+    with _typesense(error=ValueError("Unknown search_mode 'fuzzy'")):
+        response = client.post("/api/v1/search", json={"searches": [{"q": "x", "search_mode": "fuzzy"}]})
+
+    assert response.status_code == 400
@@ -15,8 +15,24 @@ from smart_search.core.config import settings
 
 # Import models BEFORE creating Base to ensure they're registered
 from smart_search.core.factory import create_app
-from smart_search.database.models import CrawlerState, Setting, WatchPath, WizardState  # noqa: F401
+from smart_search.database.models import (  # noqa: F401
+    CrawlerState,
+    DirectorySnapshot,
+    FileState,
+    IndexedFile,
+    Setting,
+    StatsAggregate,
+    WatchPath,
+    WizardState,
+)
 from smart_search.database.models.base import Base, get_db
+from smart_search.services import typesense_client
+
+
+@pytest.fixture(autouse=True)
+def fresh_result_caches(monkeypatch):
+    """Give each test its own shared Typesense search and stats caches."""
+    monkeypatch.setattr(typesense_client, "_result_caches", {})
 
 
 @pytest.fixture(autouse=True)
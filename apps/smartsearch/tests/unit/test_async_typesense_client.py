@@ -0,0 +1,188 @@
+"""
+Unit tests for the asyncio Typesense client.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+import typesense
+
+from smart_search.core.config import Settings, settings
+from smart_search.services import async_typesense_client
+from smart_search.services.async_typesense_client import AsyncTypesenseClient
+from smart_search.services.typesense_client import TypesenseClient
+
+
+def _run(coroutine_function, handler):
+    """Run a coroutine function with a client whose requests go to handler."""
+    requests = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    async def main():
+        client = AsyncTypesenseClient(sync_client=TypesenseClient(), transport=httpx.MockTransport(record))
+        try:
+            return await coroutine_function(client)
+        finally:
+            await client.aclose()
+
+    return asyncio.run(main()), requests
+
+
+def test_multi_search_forces_collection_and_caches():
+    response = {"results": [{"found": 1, "hits": []}]}
+
+    async def search_twice(client):
+        first = await client.multi_search([{"q": "report", "query_by": "content"}], {"per_page": "10"})
+        second = await client.multi_search([{"q": "report", "query_by": "content"}], {"per_page": "10"})
+        return first, second
+
+    (first, second), requests = _run(search_twice, lambda request: httpx.Response(200, json=response))
+
+    assert first == second == response
+    assert len(requests) == 1
+    assert requests[0].url.path == "/multi_search"
+    assert requests[0].url.params["per_page"] == "10"
+    body = json.loads(requests[0].content)
+    assert body["searches"][0]["collection"] == TypesenseClient().collection_name
+
+
+def test_concurrent_stats_share_one_request():
+    def handler(request):
+        if request.url.path.endswith("/documents/search"):
+            return httpx.Response(200, json={"found": 7})
+        return httpx.Response(200, json={"name": "files"})
+
+    async def concurrent(client):
+        return await asyncio.gather(*(client.get_collection_stats() for _ in range(5)))
+
+    results, requests = _run(concurrent, handler)
+
+    assert [result["num_documents"] for result in results] == [7] * 5
+    assert len(requests) == 2  # one search and one collection retrieve
+
+
+def test_writes_invalidate_cached_stats():
+    counts = iter([3, 2])
+
+    def handler(request):
+        if request.method == "DELETE":
+            return httpx.Response(200, json={"num_deleted": 1})
+        if request.url.path.endswith("/documents/search"):
+            return httpx.Response(200, json={"found": next(counts)})
+        return httpx.Response(200, json={})
+
+    async def delete_between(client):
+        before = await client.get_collection_stats()
+        deleted = await client.delete_documents("file_path:=/a.txt")
+        after = await client.get_collection_stats()
+        return before["num_documents"], deleted, after["num_documents"]
+
+    result, _ = _run(delete_between, handler)
+
+    assert result == (3, 1, 2)
+
+
+def test_request_after_write_does_not_join_older_load():
+    """A stats request made after an index write loads again instead of sharing a load started before it."""
+    counts = iter([3, 2])
+    entered = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.url.path.endswith("/documents/search"):
+            found = next(counts)
+            if found == 3:
+                entered.set()
+                await release.wait()
+            return httpx.Response(200, json={"found": found})
+        return httpx.Response(200, json={})
+
+    async def write_during_load(client):
+        before = asyncio.ensure_future(client.get_collection_stats())
+        await entered.wait()
+        client.sync_client._index_written()
+        after = asyncio.ensure_future(client.get_collection_stats())
+        await asyncio.sleep(0)
+        release.set()
+        return (await before)["num_documents"], (await after)["num_documents"]
+
+    result, _ = _run(write_during_load, handler)
+
+    assert result == (3, 2)
+
+
+def test_index_chunks_reports_rejected_documents():
+    def handler(request):
+        assert request.url.params["action"] == "upsert"
+        return httpx.Response(200, text='{"success": true}\n{"success": false, "error": "Bad field"}')
+
+    documents = [{"id": "a", "file_path": "/a.txt"}, {"id": "b", "file_path": "/b.txt"}]
+    result, requests = _run(lambda client: client.index_chunks(documents), handler)
+
+    assert result["successful"] == 1
+    assert result["errors"] == [{"id": "b", "file_path": "/b.txt", "error": "Bad field"}]
+    assert requests[0].content.decode().splitlines() == [json.dumps(doc) for doc in documents]
+
+
+def test_export_documents_streams_jsonl():
+    def handler(request):
+        assert request.url.params["filter_by"] == "chunk_index:=0"
+        return httpx.Response(200, text='{"file_path": "/a"}\n\n{"file_path": "/b"}\n')
+
+    async def export(client):
+        return [doc async for doc in client.export_documents(filter_by="chunk_index:=0")]
+
+    documents, _ = _run(export, handler)
+
+    assert documents == [{"file_path": "/a"}, {"file_path": "/b"}]
+
+
+@pytest.mark.parametrize(
+    "response, error",
+    [
+        (httpx.Response(400, json={"message": "Bad query_by"}), typesense.exceptions.RequestMalformed),
+        (httpx.Response(503, json={"message": "Not Ready or Lagging"}), typesense.exceptions.ServiceUnavailable),
+    ],
+)
+def test_error_responses_raise_sdk_exceptions(response, error):
+    with pytest.raises(error):
+        _run(lambda client: client.search({"q": "*"}), lambda request: response)
+
+
+def test_connection_error_raises_service_unavailable():
+    def handler(request):
+        raise httpx.ConnectError("refused")
+
+    with pytest.raises(typesense.exceptions.ServiceUnavailable):
+        _run(lambda client: client.search({"q": "*"}), handler)
+
+
+def test_export_connection_error_raises_service_unavailable():
+    def handler(request):
+        raise httpx.ConnectError("refused")
+
+    async def export(client):
+        return [doc async for doc in client.export_documents()]
+
+    with pytest.raises(typesense.exceptions.ServiceUnavailable):
+        _run(export, handler)
+
+
+def test_http2_is_opt_in(monkeypatch):
+    """HTTP/2 is off by default, and stays off without the h2 package even when enabled."""
+    assert Settings.model_fields["typesense_http2"].default is False
+
+    monkeypatch.setattr(settings, "typesense_http2", True)
+    monkeypatch.setattr(settings, "typesense_protocol", "https")
+    monkeypatch.setattr(async_typesense_client, "_http2_available", lambda: False)
+    with patch.object(async_typesense_client.httpx, "AsyncClient", wraps=httpx.AsyncClient) as http_client:
+        client = AsyncTypesenseClient(sync_client=TypesenseClient())
+    asyncio.run(client.aclose())
+
+    assert http_client.call_args.kwargs["http2"] is False
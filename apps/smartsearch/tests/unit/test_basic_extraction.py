@@ -0,0 +1,82 @@
+"""
+Unit tests for the streaming basic extraction strategy.
+"""
+
+import pytest
+
+from smart_search.services.extraction import basic_strategy
+from smart_search.services.extraction.basic_strategy import BasicExtractionStrategy
+from smart_search.services.extraction.protocol import strip_blocks
+
+TEXT = "Plain words in a small document\x07 with a bell, ​zero width and ünïcödé 日本語 text.\n" * 20
+
+
+@pytest.fixture(params=[7, 256 * 1024], ids=["tiny_blocks", "default_blocks"])
+def block_size(request, monkeypatch):
+    monkeypatch.setattr(basic_strategy, "BLOCK_SIZE", request.param)
+    return request.param
+
+
+def test_text_is_decoded_without_non_printables(tmp_path, block_size):
+    path = tmp_path / "doc.dat"
+    path.write_bytes(TEXT.encode("utf-8"))
+
+    result = BasicExtractionStrategy().extract(str(path))
+
+    expected = "".join(c for c in TEXT if c.isprintable() or c in "\n\r\t").strip()
+    assert result.content == expected
+    assert result.metadata["extraction_method"] == "smart_text"
+
+
+def test_text_is_yielded_in_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(basic_strategy, "BLOCK_SIZE", 64)
+    path = tmp_path / "doc.dat"
+    path.write_bytes(TEXT.encode("utf-8"))
+
+    blocks = list(BasicExtractionStrategy().iter_text(str(path)))
+
+    assert len(blocks) > 1
+    assert "".join(blocks).strip() == BasicExtractionStrategy().extract(str(path)).content
+
+
+def test_binary_falls_back_to_ascii_strings(tmp_path, block_size):
+    path = tmp_path / "blob.bin"
+    path.write_bytes(
+        bytes(range(0x80, 0x100))
+        + b"\x00first readable string\x01\x02second readable string\xff"
+        + b"\x00abc\x00a third one that is long\x00"
+    )
+
+    content = BasicExtractionStrategy().extract(str(path)).content
+
+    assert "first readable string\nsecond readable string" in content
+    assert "a third one that is long" in content
+    assert "\nabc\n" not in content
+
+
+def test_no_text_found(tmp_path):
+    path = tmp_path / "noise.bin"
+    path.write_bytes(b"\x00\x01\x02ab\x00cd\xff" * 10)
+
+    result = BasicExtractionStrategy().extract(str(path))
+
+    assert result.content == ""
+    assert result.metadata["extraction_method"] == "basic_fallback"
+
+
+def test_extract_blocks_streams_the_extracted_text(tmp_path, monkeypatch):
+    monkeypatch.setattr(basic_strategy, "BLOCK_SIZE", 64)
+    path = tmp_path / "doc.dat"
+    path.write_bytes(("  \n" + TEXT + "\n\n").encode("utf-8"))
+
+    document = BasicExtractionStrategy().extract_blocks(str(path))
+    blocks = list(document.blocks)
+
+    assert len(blocks) > 1
+    assert "".join(blocks) == BasicExtractionStrategy().extract(str(path)).content
+    assert document.metadata["extraction_method"] == "smart_text"
+
+
+@pytest.mark.parametrize("blocks", [[], [" ", "\n"], [" a", "b ", " ", "c\n", " "], ["\n x \n"]])
+def test_strip_blocks_matches_str_strip(blocks):
+    assert "".join(strip_blocks(blocks)) == "".join(blocks).strip()
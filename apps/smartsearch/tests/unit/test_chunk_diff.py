@@ -0,0 +1,126 @@
+"""
+Unit tests for chunk-level diffing in the indexer's upsert stage.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from smart_search.api.models.file_event import DocumentContent
+from smart_search.api.models.operations import CrawlOperation, OperationType
+from smart_search.core.config import settings
+from smart_search.services.crawler.indexer import FileIndexer, FileJob
+from smart_search.services.extraction.protocol import DocumentBlocks
+from smart_search.services.typesense_client import TypesenseClient
+
+
+@pytest.fixture
+def indexer(monkeypatch):
+    monkeypatch.setattr(settings, "extraction_cache_enabled", False)
+    monkeypatch.setenv("CHUNK_SIZE", "200")
+    monkeypatch.setenv("CHUNK_OVERLAP", "0")
+    indexer = FileIndexer()
+    real_client = TypesenseClient()
+    indexer.typesense = MagicMock()
+    indexer.typesense.build_chunk_document.side_effect = real_client.build_chunk_document
+    indexer.typesense.generate_doc_id.side_effect = TypesenseClient.generate_doc_id
+    indexer.typesense.metadata_update.side_effect = TypesenseClient.metadata_update
+    indexer.typesense.index_chunks.return_value = {"successful": 0, "failed": 0, "errors": []}
+    indexer.catalog = MagicMock()
+    indexer.index_stats = MagicMock()
+    return indexer
+
+
+def _chunked_job(indexer, content, title="App log", path="/logs/app.log"):
+    job = FileJob(
+        operation=CrawlOperation(operation=OperationType.EDIT, file_path=path, file_size=len(content), source="crawl"),
+        file_hash="xxh3_128:new",
+        document=DocumentContent(content=content, metadata={"title": title}),
+    )
+    indexer.chunk(job)
+    return job
+
+
+def _lines(count):
+    return "".join(f"line {i:04d} of the application log\n" for i in range(count))
+
+
+def test_appended_file_only_upserts_changed_chunks(indexer):
+    """Unchanged chunks get a metadata update; only the tail is re-embedded."""
+    previous = _chunked_job(indexer, _lines(40))
+    indexer.typesense.get_chunk_hashes.return_value = {
+        "/logs/app.log": {doc["chunk_index"]: doc["chunk_hash"] for doc in previous.documents}
+    }
+
+    job = _chunked_job(indexer, _lines(45))
+    total = len(job.documents)
+    indexer.upsert([job])
+
+    calls = {call.kwargs.get("action"): call.args[0] for call in indexer.typesense.index_chunks.call_args_list}
+    unchanged_count = len(previous.documents) - 1
+    assert len(calls["update"]) == unchanged_count
+    assert all("content" not in doc and doc["chunk_total"] == total for doc in calls["update"])
+    assert [doc["chunk_index"] for doc in calls["upsert"]] == list(range(unchanged_count, total))
+    indexer.typesense.remove_chunks.assert_not_called()
+    assert job.result is True
+    assert [facts.path for facts in indexer.index_stats.record.call_args.args[0]] == ["/logs/app.log"]
+
+
+def test_shrunk_file_removes_trailing_chunks(indexer):
+    previous = _chunked_job(indexer, _lines(40))
+    indexer.typesense.get_chunk_hashes.return_value = {
+        "/logs/app.log": {doc["chunk_index"]: doc["chunk_hash"] for doc in previous.documents}
+    }
+
+    job = _chunked_job(indexer, _lines(10))
+    total = len(job.documents)
+    indexer.upsert([job])
+
+    removed = indexer.typesense.remove_chunks.call_args.args[0]
+    expected = range(total, len(previous.documents))
+    assert removed == [TypesenseClient.generate_doc_id("/logs/app.log", i) for i in expected]
+
+
+def test_changed_embedding_metadata_reembeds_every_chunk(indexer):
+    previous = _chunked_job(indexer, _lines(20))
+    indexer.typesense.get_chunk_hashes.return_value = {
+        "/logs/app.log": {doc["chunk_index"]: doc["chunk_hash"] for doc in previous.documents}
+    }
+
+    job = _chunked_job(indexer, _lines(20), title="Renamed")
+    indexer.upsert([job])
+
+    (call,) = indexer.typesense.index_chunks.call_args_list
+    assert call.kwargs["action"] == "upsert"
+    assert len(call.args[0]) == len(previous.documents)
+
+
+def test_lookup_failure_upserts_everything(indexer):
+    indexer.typesense.get_chunk_hashes.side_effect = ConnectionError("down")
+
+    job = _chunked_job(indexer, _lines(20))
+    indexer.upsert([job])
+
+    (call,) = indexer.typesense.index_chunks.call_args_list
+    assert call.kwargs["action"] == "upsert"
+    assert job.result is True
+
+
+def test_streamed_blocks_chunk_like_whole_content(indexer):
+    """Text streamed from the extractor yields the same chunk documents as the joined text."""
+    content = _lines(40)
+    whole = _chunked_job(indexer, content)
+    blocks = (content[i : i + 97] for i in range(0, len(content), 97))
+    streamed = FileJob(
+        operation=whole.operation,
+        file_hash=whole.file_hash,
+        document=DocumentBlocks(blocks=blocks, metadata={"title": "App log"}),
+    )
+
+    indexer.chunk(streamed)
+
+    def chunks(job):
+        return [(doc["content"], doc["chunk_hash"], doc["chunk_total"]) for doc in job.documents]
+
+    assert chunks(streamed) == chunks(whole)
+    assert streamed.document is None
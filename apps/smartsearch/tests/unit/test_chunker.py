@@ -2,7 +2,26 @@
 Unit tests for the text chunking service.
 """
 
-from smart_search.services.chunker import chunk_text, generate_chunk_hash, get_chunk_config
+import random
+
+import pytest
+
+from smart_search.services.chunker import (
+    SPECIAL_TOKENS,
+    FixedSizeChunker,
+    SemanticChunker,
+    benchmark_chunking,
+    chunk_text,
+    estimate_tokens,
+    generate_chunk_hash,
+    get_chunk_config,
+    get_chunker,
+    iter_chunks,
+)
+
+
+def _blocks(content, size):
+    return (content[i : i + size] for i in range(0, len(content), size))
 
 
 def test_chunk_empty_content():
@@ -78,3 +97,137 @@ def test_get_chunk_config_defaults():
     # Default values from the function
     assert chunk_size == 1000
     assert overlap == 200
+
+
+@pytest.mark.parametrize(
+    ("content", "chunk_size", "overlap"),
+    [
+        ("", 1000, 200),
+        ("This is a small piece of text.", 1000, 200),
+        ("  padded  ", 1000, 200),
+        ("word " * 500, 1000, 200),
+        ("word1 word2 word3 " * 100, 100, 20),
+        ("a" * 500, 100, 20),
+        ("line one\nline two\n" * 300, 250, 50),
+    ],
+)
+@pytest.mark.parametrize("block_size", [1, 7, 64, 1000, 100_000])
+def test_iter_chunks_matches_chunk_text(content, chunk_size, overlap, block_size):
+    """Streaming the content in blocks of any size yields the same chunks."""
+    streamed = list(iter_chunks(_blocks(content, block_size) if content else iter([]), chunk_size, overlap))
+
+    assert streamed == chunk_text(content, chunk_size, overlap)
+
+
+def test_iter_chunks_matches_chunk_text_on_random_text():
+    rng = random.Random(42)
+    alphabet = ["a", "bb", "ccc", " ", "  ", "\n", "word", "\t"]
+    for _ in range(200):
+        content = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 3000)))
+        chunk_size = rng.randint(150, 600)
+        overlap = rng.randint(0, 40)
+        block_size = rng.randint(1, 700)
+
+        streamed = list(iter_chunks(_blocks(content, block_size), chunk_size, overlap))
+
+        assert streamed == chunk_text(content, chunk_size, overlap)
+
+
+DOCUMENT = (
+    "# Installation\n\n"
+    "Download the installer for your platform. Run it and follow the prompts. "
+    "The first start downloads the embedding model, which takes a few minutes.\n\n"
+    "# Usage\n\n"
+    "Add a folder to watch. Files are indexed in the background! "
+    "Search by keywords or describe what you are looking for.\n\n"
+    "Results show the matching passage of each file.\n"
+)
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("the cat sat.") == 4
+    assert estimate_tokens("internationalization") == 4
+    assert estimate_tokens("日本語") == 3
+
+
+@pytest.mark.parametrize("strategy", ["sentence", "paragraph", "heading"])
+def test_semantic_chunks_fit_the_token_budget(strategy):
+    chunks = list(SemanticChunker(strategy, max_tokens=24, overlap_tokens=0).chunk((DOCUMENT * 3,)))
+
+    assert len(chunks) > 3
+    assert all(estimate_tokens(chunk) + SPECIAL_TOKENS <= 24 for chunk in chunks)
+
+
+@pytest.mark.parametrize("strategy", ["sentence", "paragraph", "heading"])
+def test_semantic_chunks_end_at_sentence_boundaries(strategy):
+    chunks = list(SemanticChunker(strategy, max_tokens=40, overlap_tokens=0).chunk((DOCUMENT,)))
+
+    assert all(chunk[-1] in ".!" or chunk.startswith("#") for chunk in chunks)
+    # Without overlap, chunks are the document's text in order
+    assert " ".join(" ".join(chunks).split()) == " ".join(DOCUMENT.split())
+
+
+def test_paragraph_chunks_keep_short_paragraphs_whole():
+    chunks = list(SemanticChunker("paragraph", max_tokens=64, overlap_tokens=0).chunk((DOCUMENT,)))
+
+    assert "Results show the matching passage of each file." in chunks[-1]
+    assert all(not chunk.endswith("Files are indexed in the background!") for chunk in chunks)
+
+
+def test_heading_chunks_do_not_cross_sections():
+    chunks = list(SemanticChunker("heading", max_tokens=120, overlap_tokens=0).chunk((DOCUMENT,)))
+
+    assert [chunk.splitlines()[0] for chunk in chunks] == ["# Installation", "# Usage"]
+
+
+def test_semantic_overlap_repeats_trailing_sentences():
+    text = " ".join(f"Sentence number {i} is here." for i in range(20))
+    chunks = list(SemanticChunker("sentence", max_tokens=30, overlap_tokens=8).chunk((text,)))
+
+    for previous, chunk in zip(chunks, chunks[1:]):
+        last_sentence = previous.rsplit(". ", 1)[-1]
+        assert chunk.startswith(last_sentence.rstrip("."))
+
+
+def test_semantic_chunker_cuts_text_without_sentence_breaks():
+    chunks = list(SemanticChunker("paragraph", max_tokens=20, overlap_tokens=0).chunk(("word " * 200,)))
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) + SPECIAL_TOKENS <= 20 for chunk in chunks)
+    assert sum(chunk.count("word") for chunk in chunks) == 200
+
+
+@pytest.mark.parametrize("strategy", ["sentence", "paragraph", "heading"])
+@pytest.mark.parametrize("block_size", [1, 13, 100, 100_000])
+def test_semantic_chunks_do_not_depend_on_block_size(strategy, block_size):
+    chunker = SemanticChunker(strategy, max_tokens=32, overlap_tokens=6)
+    content = DOCUMENT * 5
+
+    assert list(chunker.chunk(_blocks(content, block_size))) == list(chunker.chunk((content,)))
+
+
+def test_semantic_chunker_yields_one_empty_chunk_for_empty_content():
+    assert list(SemanticChunker("sentence").chunk(iter([]))) == [""]
+    assert list(SemanticChunker("paragraph").chunk(("\n\n  ",))) == [""]
+
+
+def test_get_chunker(monkeypatch):
+    from smart_search.core.config import settings
+
+    assert isinstance(get_chunker(), FixedSizeChunker)
+    assert get_chunker("heading").name == "heading"
+
+    monkeypatch.setattr(settings, "chunk_strategy", "sentence")
+    assert get_chunker().name == "sentence"
+
+    monkeypatch.setattr(settings, "chunk_strategy", "bogus")
+    assert isinstance(get_chunker(), FixedSizeChunker)
+
+
+def test_benchmark_chunking_reports_every_strategy():
+    results = benchmark_chunking([DOCUMENT * 20], [FixedSizeChunker(1000, 200), SemanticChunker("paragraph")])
+
+    assert set(results) == {"fixed", "paragraph"}
+    assert results["paragraph"]["coverage"] == 1.0
+    assert results["fixed"]["tokens"] > results["paragraph"]["tokens"]  # overlap is embedded twice
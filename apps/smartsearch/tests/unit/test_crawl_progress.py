@@ -0,0 +1,55 @@
+"""
+Unit tests for crawl progress tracking.
+"""
+
+import threading
+
+from smart_search.services.crawler.progress import CrawlProgressTracker, IndexingProgress
+
+
+def test_increment_is_thread_safe():
+    """Concurrent increments from many workers are not lost."""
+    progress = IndexingProgress()
+
+    def worker():
+        for _ in range(1000):
+            progress.increment("files_indexed")
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert progress.files_indexed == 8000
+
+
+def test_increment_returns_new_value():
+    """increment() returns the updated counter value."""
+    progress = IndexingProgress()
+
+    assert progress.increment("files_failed") == 1
+    assert progress.increment("files_failed", 2) == 3
+
+
+def test_worker_tracking():
+    """Each worker tracks its own current file until finished."""
+    progress = IndexingProgress()
+    progress.start_file("w0", "/a.txt")
+    progress.start_file("w1", "/b.txt")
+
+    assert sorted(progress.get_current_files()) == ["/a.txt", "/b.txt"]
+
+    progress.finish_file("w0")
+    assert progress.get_current_files() == ["/b.txt"]
+
+
+def test_indexing_percent_includes_chunk_progress_of_all_workers():
+    """Partial chunk progress of every busy worker counts towards the percentage."""
+    tracker = CrawlProgressTracker()
+    tracker.discovery.files_found = 10
+    tracker.indexing.files_indexed = 4
+    tracker.indexing.update_chunk("w0", 1, 2)
+    tracker.indexing.update_chunk("w1", 1, 2)
+
+    assert tracker.get_indexing_percent() == 50.0
@@ -0,0 +1,133 @@
+"""
+Unit tests for the event bus and the shared crawler status stream.
+"""
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from smart_search.services.crawler.status_stream import CrawlerStatusStream
+from smart_search.services.events import TOPIC_CRAWL_STATUS, TOPIC_INDEX, TOPIC_WATCH_PATHS, EventBus
+
+
+def test_event_bus_delivers_until_unsubscribed():
+    """Handlers get every topic; a failing handler does not stop the others."""
+    bus = EventBus()
+    received = []
+    bus.subscribe(lambda topic: 1 / 0)
+    unsubscribe = bus.subscribe(received.append)
+
+    bus.publish(TOPIC_INDEX)
+    unsubscribe()
+    bus.publish(TOPIC_WATCH_PATHS)
+
+    assert received == [TOPIC_INDEX]
+
+
+@pytest.fixture
+def manager():
+    manager = MagicMock()
+    manager.is_running.return_value = False
+    manager.get_status.return_value = {"running": False, "current_phase": "idle", "files_discovered": 3}
+    with patch("smart_search.services.crawler.manager.get_crawl_job_manager", return_value=manager):
+        yield manager
+
+
+@pytest.fixture
+def typesense(manager):
+    client = MagicMock()
+    client.get_collection_stats.return_value = {"num_documents": 2}
+    client.get_file_type_distribution.return_value = {".txt": 2}
+    with patch("smart_search.services.typesense_client.get_typesense_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def bus():
+    return EventBus()
+
+
+@pytest.fixture
+def stream(bus, typesense):
+    stream = CrawlerStatusStream(bus=bus, refresh_interval=0.01, heartbeat_interval=0.2)
+    with patch.object(CrawlerStatusStream, "_read_watch_paths", return_value=[{"id": 1, "path": "/docs"}]):
+        yield stream
+
+
+def _next_payload(events):
+    message = next(events)
+    assert message.startswith("data: ")
+    return json.loads(message[len("data: ") :])
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+def test_subscribers_share_one_snapshot(stream, typesense):
+    """Every connection gets the same snapshot from a single Typesense read."""
+    first, second = stream.events(), stream.events()
+
+    payload = _next_payload(first)
+    assert _next_payload(second) == payload
+
+    assert payload["stats"]["totals"] == {"discovered": 3, "indexed": 2}
+    assert payload["stats"]["file_types"] == {".txt": 2}
+    assert payload["watch_paths"] == [{"id": 1, "path": "/docs"}]
+    assert typesense.get_collection_stats.call_count == 1
+    first.close()
+    second.close()
+
+
+def test_idle_stream_sends_heartbeats_without_queries(stream, typesense):
+    """Without events, subscribers get heartbeats and Typesense is not queried again."""
+    events = stream.events()
+    _next_payload(events)
+
+    assert next(events) == ":heartbeat\n\n"
+    assert typesense.get_collection_stats.call_count == 1
+    events.close()
+
+
+def test_index_event_pushes_new_snapshot(stream, bus, typesense):
+    """An index write is read back once and pushed to subscribers."""
+    events = stream.events()
+    _next_payload(events)
+
+    typesense.get_collection_stats.return_value = {"num_documents": 5}
+    bus.publish(TOPIC_INDEX)
+
+    payload = _next_payload(events)
+    assert payload["stats"]["totals"]["indexed"] == 5
+    assert typesense.get_collection_stats.call_count == 2
+    events.close()
+
+
+def test_status_event_does_not_query_typesense(stream, bus, manager, typesense):
+    """A crawl status change re-reads the status only."""
+    events = stream.events()
+    _next_payload(events)
+
+    manager.get_status.return_value = {"running": False, "current_phase": "idle", "files_discovered": 9}
+    bus.publish(TOPIC_CRAWL_STATUS)
+
+    assert _next_payload(events)["stats"]["totals"]["discovered"] == 9
+    assert typesense.get_collection_stats.call_count == 1
+    events.close()
+
+
+def test_producer_stops_with_last_subscriber(stream):
+    """The producer thread exits once no connection is left."""
+    events = stream.events()
+    _next_payload(events)
+    assert stream.subscriber_count == 1
+
+    events.close()
+
+    assert stream.subscriber_count == 0
+    _wait_for(lambda: stream._producer is None)
@@ -0,0 +1,110 @@
+"""
+Unit tests for the priority dedup queue.
+"""
+
+import threading
+
+import pytest
+
+from smart_search.api.models.operations import PRIORITY_DELETE, PRIORITY_WATCH, CrawlOperation, OperationType
+from smart_search.services.crawler.queue import DedupQueue
+
+
+def _op(path, operation=OperationType.CREATE, source="crawl", priority=0):
+    return CrawlOperation(operation=operation, file_path=path, source=source, priority=priority)
+
+
+def test_fifo_within_same_priority():
+    """Items of equal priority are served in arrival order."""
+    queue = DedupQueue[CrawlOperation]()
+    for path in ["/a", "/b", "/c"]:
+        queue.put(path, _op(path))
+
+    assert [queue.get().file_path for _ in range(3)] == ["/a", "/b", "/c"]
+
+
+def test_watch_and_delete_events_overtake_crawl():
+    """Higher-priority items are served before an existing backlog."""
+    queue = DedupQueue[CrawlOperation]()
+    queue.put("/crawl1", _op("/crawl1"))
+    queue.put("/crawl2", _op("/crawl2"))
+    queue.put("/saved", _op("/saved", OperationType.EDIT, "watch", PRIORITY_WATCH))
+    queue.put("/removed", _op("/removed", OperationType.DELETE, "watch", PRIORITY_DELETE))
+
+    assert [queue.get().file_path for _ in range(4)] == ["/removed", "/saved", "/crawl1", "/crawl2"]
+
+
+def test_duplicate_key_replaces_item():
+    """A duplicate key replaces the queued item without queueing it twice."""
+    queue = DedupQueue[CrawlOperation]()
+    queue.put("/a", _op("/a"))
+    queue.put("/b", _op("/b"))
+    queue.put("/a", _op("/a", OperationType.EDIT))
+
+    assert queue.qsize() == 2
+    first = queue.get()
+    assert (first.file_path, first.operation) == ("/a", OperationType.EDIT)
+    assert queue.get().file_path == "/b"
+    assert queue.qsize() == 0
+
+
+def test_duplicate_key_keeps_highest_priority():
+    """A watch event raises a queued crawl item; a later crawl item does not lower it."""
+    queue = DedupQueue[CrawlOperation]()
+    queue.put("/a", _op("/a"))
+    queue.put("/b", _op("/b"))
+    queue.put("/b", _op("/b", OperationType.EDIT, "watch", PRIORITY_WATCH))
+    queue.put("/b", _op("/b"))
+
+    second = queue.get()
+    assert second.file_path == "/b"
+    assert second.source == "crawl"
+    assert queue.get().file_path == "/a"
+    assert queue.qsize() == 0
+
+
+def test_get_blocks_until_put():
+    """get() waits for an item to arrive."""
+    queue = DedupQueue[str]()
+    results = []
+    consumer = threading.Thread(target=lambda: results.append(queue.get()))
+    consumer.start()
+
+    queue.put("/a", "item", priority=5)
+    consumer.join(timeout=2)
+
+    assert results == ["item"]
+
+
+def test_task_done_counts_unfinished_items():
+    """task_done() cannot be called more often than items were queued."""
+    queue = DedupQueue[str]()
+    queue.put("/a", "1")
+    queue.put("/a", "2")
+    queue.get()
+    queue.task_done()
+
+    with pytest.raises(ValueError):
+        queue.task_done()
+
+
+def test_key_in_process_is_held_back():
+    """An item for a key still being processed is served only after task_done(key)."""
+    queue = DedupQueue[CrawlOperation]()
+    queue.put("/a", _op("/a", OperationType.EDIT))
+    queue.put("/b", _op("/b"))
+    assert queue.get().file_path == "/a"
+
+    queue.put("/a", _op("/a", OperationType.DELETE, "watch", PRIORITY_DELETE))
+    assert queue.get().file_path == "/b"
+
+    results = []
+    consumer = threading.Thread(target=lambda: results.append(queue.get()))
+    consumer.start()
+    consumer.join(timeout=0.1)
+    assert results == []
+
+    queue.task_done("/a")
+    consumer.join(timeout=2)
+
+    assert [(op.file_path, op.operation) for op in results] == [("/a", OperationType.DELETE)]
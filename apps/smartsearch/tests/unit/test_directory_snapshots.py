@@ -0,0 +1,111 @@
+"""
+Unit tests for incremental discovery with directory snapshots.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+
+from smart_search.core.config import settings
+from smart_search.database.models import WatchPath
+from smart_search.services.crawler.catalog import FileCatalog
+from smart_search.services.crawler.discoverer import FileDiscoverer
+from smart_search.services.crawler.snapshots import DirectorySnapshotStore, DirectoryState
+
+
+@pytest.fixture
+def session_factory(db_session):
+    @contextmanager
+    def factory():
+        yield db_session
+
+    return factory
+
+
+def _age(path, seconds=60):
+    """Backdate a path's mtime so it is outside the snapshot grace window."""
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+def _make_tree(root):
+    (root / "sub").mkdir()
+    (root / "a.txt").write_text("a")
+    (root / "sub" / "b.txt").write_text("b")
+    _age(root / "sub")
+    _age(root)
+
+
+def _discover(root, session_factory):
+    watch_path = WatchPath(path=str(root), include_subdirectories=True, is_excluded=False)
+    discoverer = FileDiscoverer(
+        [watch_path],
+        catalog=FileCatalog(session_factory),
+        snapshot_store=DirectorySnapshotStore(session_factory),
+    )
+    paths = sorted(op.file_path for op in discoverer.discover())
+    return discoverer, paths
+
+
+def test_store_round_trip(session_factory):
+    """Saved snapshots load back, minus excluded directories."""
+    store = DirectorySnapshotStore(session_factory)
+    state = DirectoryState(mtime_ns=5, entry_count=2, subdirectories=("x",))
+
+    store.save({"/a": state, "/b": state}, full_walk=True, exclude={"/b"})
+
+    assert store.load() == {"/a": state}
+    assert store.full_walk_due() is False
+
+
+def test_full_walk_due_without_snapshot(session_factory):
+    """A full walk is due when none was ever recorded or incremental discovery is off."""
+    store = DirectorySnapshotStore(session_factory)
+    assert store.full_walk_due() is True
+
+    store.save({}, full_walk=True)
+    with patch.object(settings, "incremental_discovery", False):
+        assert store.full_walk_due() is True
+
+
+def test_unchanged_directories_are_not_listed(tmp_path, session_factory):
+    """After a completed crawl, unchanged directories are skipped but still counted."""
+    _make_tree(tmp_path)
+
+    first, paths = _discover(tmp_path, session_factory)
+    first.save_snapshot()
+    assert paths == [str(tmp_path / "a.txt"), str(tmp_path / "sub" / "b.txt")]
+
+    second, paths = _discover(tmp_path, session_factory)
+    assert paths == []
+    assert second.files_found == 2
+    assert second.files_skipped == 2
+
+
+def test_changed_directory_is_listed_again(tmp_path, session_factory):
+    """Adding a file changes the directory mtime, so only that directory is listed."""
+    _make_tree(tmp_path)
+    first, _ = _discover(tmp_path, session_factory)
+    first.save_snapshot()
+
+    (tmp_path / "sub" / "c.txt").write_text("c")
+    _age(tmp_path / "sub", seconds=30)
+
+    second, paths = _discover(tmp_path, session_factory)
+
+    assert paths == [str(tmp_path / "sub" / "b.txt"), str(tmp_path / "sub" / "c.txt")]
+    assert second.files_found == 3
+
+
+def test_excluded_failed_directory_is_listed_again(tmp_path, session_factory):
+    """Directories excluded from the saved snapshot are listed on the next crawl."""
+    _make_tree(tmp_path)
+    first, _ = _discover(tmp_path, session_factory)
+    first.save_snapshot(exclude_dirs={str(tmp_path / "sub")})
+
+    _, paths = _discover(tmp_path, session_factory)
+
+    assert paths == [str(tmp_path / "sub" / "b.txt")]
@@ -0,0 +1,66 @@
+"""
+Unit tests for the content-addressed extraction cache.
+"""
+
+import os
+
+from smart_search.api.models.file_event import DocumentContent
+from smart_search.services.extraction.cache import ExtractionCache
+
+
+def _document(text):
+    return DocumentContent(content=text, metadata={"mime_type": "text/plain", "page_count": 2})
+
+
+def test_put_and_get_roundtrip(tmp_path):
+    """Stored results are returned for the same content hash only."""
+    cache = ExtractionCache(tmp_path, max_bytes=1024 * 1024)
+    cache.put("xxh3_128:abc", _document("hello world"))
+
+    cached = cache.get("xxh3_128:abc")
+
+    assert cached.content == "hello world"
+    assert cached.metadata == {"mime_type": "text/plain", "page_count": 2}
+    assert cache.get("xxh3_128:other") is None
+
+
+def test_quick_hashes_are_not_cached(tmp_path):
+    """Sampled hashes do not identify content, so they never hit."""
+    cache = ExtractionCache(tmp_path, max_bytes=1024 * 1024)
+    cache.put("xxh3_128-quick:abc", _document("partial"))
+
+    assert cache.get("xxh3_128-quick:abc") is None
+    assert cache.size_bytes == 0
+
+
+def test_size_survives_reload(tmp_path):
+    """A new cache instance accounts for entries already on disk."""
+    cache = ExtractionCache(tmp_path, max_bytes=1024 * 1024)
+    cache.put("md5:1", _document("one"))
+
+    reloaded = ExtractionCache(tmp_path, max_bytes=1024 * 1024)
+
+    assert reloaded.size_bytes == cache.size_bytes > 0
+    assert reloaded.get("md5:1").content == "one"
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """Going over the cap evicts the entries that were not read recently."""
+    cache = ExtractionCache(tmp_path, max_bytes=1024 * 1024)
+    texts = {f"sha256:{i}": os.urandom(300).hex() for i in range(3)}
+    for file_hash, text in texts.items():
+        cache.put(file_hash, _document(text))
+    entry_size = cache.size_bytes // 3
+
+    # Age every entry, then read the first one so it becomes the most recent
+    for entry in tmp_path.glob("*/*.json.z"):
+        os.utime(entry, (1, 1))
+    cache.get("sha256:0")
+
+    cache.max_bytes = entry_size * 3
+    cache.put("sha256:3", _document(os.urandom(300).hex()))
+
+    assert cache.get("sha256:0") is not None
+    assert cache.get("sha256:3") is not None
+    assert cache.size_bytes <= cache.max_bytes
+    assert cache.get("sha256:1") is None or cache.get("sha256:2") is None
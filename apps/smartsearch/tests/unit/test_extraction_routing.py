@@ -0,0 +1,134 @@
+"""
+Unit tests for extraction routing and the native text strategy.
+"""
+
+import pytest
+
+from smart_search.services.extraction import text_strategy
+from smart_search.services.extraction.extractor import ContentExtractor
+from smart_search.services.extraction.protocol import DocumentBlocks
+from smart_search.services.extraction.routing import ROUTE_SKIP, ROUTE_TEXT, ROUTE_TIKA, ExtractionRouter
+from smart_search.services.extraction.skip_strategy import SkipExtractionStrategy
+from smart_search.services.extraction.text_strategy import TextExtractionStrategy
+
+
+class RecordingStrategy:
+    """Strategy stand-in recording which files it extracted."""
+
+    def __init__(self):
+        self.paths = []
+
+    def can_extract(self, file_path):
+        return True
+
+    def extract(self, file_path):
+        self.paths.append(file_path)
+        raise ValueError("not expected here")
+
+
+def _router(overrides=None, archive_max_bytes=10):
+    return ExtractionRouter(
+        {ROUTE_TEXT: ["text"], ROUTE_TIKA: ["tika"], ROUTE_SKIP: ["skip"]},
+        overrides=overrides or {},
+        archive_max_bytes=archive_max_bytes,
+    )
+
+
+@pytest.mark.parametrize(
+    ("name", "route"),
+    [
+        ("notes.md", ROUTE_TEXT),
+        ("main.PY", ROUTE_TEXT),
+        ("Dockerfile", ROUTE_TEXT),
+        ("report.pdf", ROUTE_TIKA),
+        ("unknown.weird", ROUTE_TIKA),
+        ("movie.mkv", ROUTE_SKIP),
+        ("clip.qt", ROUTE_SKIP),  # video/* by MIME type
+    ],
+)
+def test_route_by_extension_and_mime(tmp_path, name, route):
+    assert _router().route(str(tmp_path / name)) == route
+
+
+def test_archives_are_skipped_over_size_limit(tmp_path):
+    small = tmp_path / "small.zip"
+    large = tmp_path / "large.zip"
+    small.write_bytes(b"x" * 10)
+    large.write_bytes(b"x" * 11)
+
+    router = _router()
+
+    assert router.route(str(small)) == ROUTE_TIKA
+    assert router.route(str(large)) == ROUTE_SKIP
+
+
+def test_overrides_replace_defaults_and_ignore_unknown_routes(tmp_path):
+    router = _router({".LOG": "skip", ".pdf": "nonsense", "application/x-custom": "text"})
+
+    assert router.route(str(tmp_path / "server.log")) == ROUTE_SKIP
+    assert router.route(str(tmp_path / "report.pdf")) == ROUTE_TIKA
+
+
+def test_extractor_uses_routed_strategies(tmp_path):
+    """Text files never reach the default (Tika) strategy list."""
+    path = tmp_path / "notes.md"
+    path.write_text("# Title\nSome notes", encoding="utf-8")
+    tika = RecordingStrategy()
+    router = ExtractionRouter(
+        {ROUTE_TEXT: [TextExtractionStrategy()], ROUTE_TIKA: [tika], ROUTE_SKIP: [SkipExtractionStrategy()]},
+        overrides={},
+    )
+
+    result = ContentExtractor(strategies=[tika], router=router).extract(str(path))
+
+    assert result.content == "# Title\nSome notes"
+    assert result.metadata["extraction_method"] == "text"
+    assert result.metadata["mime_type"] == "text/markdown"
+    assert tika.paths == []
+
+
+def test_text_strategy_decodes_legacy_encodings(tmp_path):
+    path = tmp_path / "legacy.txt"
+    path.write_bytes("Café crème brûlée, déjà vu à la française".encode("latin-1"))
+
+    result = TextExtractionStrategy().extract(str(path))
+
+    assert "crème" in result.content
+
+
+def test_text_strategy_rejects_binary_content(tmp_path):
+    path = tmp_path / "fake.txt"
+    path.write_bytes(b"\x00\x01\x02binary")
+
+    with pytest.raises(ValueError):
+        TextExtractionStrategy().extract(str(path))
+
+
+def test_extract_blocks_streams_routed_text(tmp_path, monkeypatch):
+    """Text files are streamed block by block."""
+    monkeypatch.setattr(text_strategy, "BLOCK_SIZE", 16)
+    path = tmp_path / "notes.md"
+    path.write_text("\n# Title\n" + "Some notes, déjà vu. " * 20 + "\n", encoding="utf-8")
+    router = ExtractionRouter(
+        {ROUTE_TEXT: [TextExtractionStrategy()], ROUTE_TIKA: [], ROUTE_SKIP: [SkipExtractionStrategy()]},
+        overrides={},
+    )
+    extractor = ContentExtractor(strategies=[], router=router)
+
+    document = extractor.extract_blocks(str(path))
+    blocks = list(document.blocks)
+
+    assert isinstance(document, DocumentBlocks)
+    assert len(blocks) > 1
+    assert "".join(blocks) == extractor.extract(str(path)).content
+    assert document.metadata["mime_type"] == "text/markdown"
+
+
+def test_extract_blocks_returns_whole_content_of_other_strategies(tmp_path):
+    path = tmp_path / "report.pdf"
+    path.write_bytes(b"%PDF")
+
+    result = ContentExtractor(strategies=[SkipExtractionStrategy()]).extract_blocks(str(path))
+
+    assert not isinstance(result, DocumentBlocks)
+    assert result.metadata["mime_type"] == "application/pdf"
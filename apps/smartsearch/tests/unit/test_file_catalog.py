@@ -0,0 +1,92 @@
+"""
+Unit tests for the file-state catalog.
+"""
+
+import os
+from contextlib import contextmanager
+
+import pytest
+
+from smart_search.database.models import WatchPath
+from smart_search.database.repositories.file_state import FileStateRepository
+from smart_search.services.crawler.catalog import FileCatalog, FileSignature
+from smart_search.services.crawler.discoverer import FileDiscoverer
+from smart_search.services.crawler.snapshots import DirectorySnapshotStore
+
+
+@pytest.fixture
+def session_factory(db_session):
+    @contextmanager
+    def factory():
+        yield db_session
+
+    return factory
+
+
+@pytest.fixture
+def catalog(session_factory):
+    return FileCatalog(session_factory)
+
+
+def test_repository_upsert_updates_existing(db_session):
+    """Upserting an existing path replaces its state."""
+    repo = FileStateRepository(db_session)
+    repo.upsert_many([{"path": "/a.txt", "size": 1, "mtime_ns": 1, "inode": 1, "file_hash": "h1"}])
+    repo.upsert_many([{"path": "/a.txt", "size": 2, "mtime_ns": 2, "inode": 1, "file_hash": "h2"}])
+
+    states = repo.get_by_paths(["/a.txt", "/missing.txt"])
+
+    assert list(states) == ["/a.txt"]
+    assert states["/a.txt"].size == 2
+    assert states["/a.txt"].file_hash == "h2"
+
+
+def test_find_unchanged(catalog):
+    """Only paths with an identical signature are unchanged."""
+    catalog.record(
+        [
+            ("/same.txt", FileSignature(10, 100, 1), "h1"),
+            ("/touched.txt", FileSignature(10, 100, 2), "h2"),
+        ]
+    )
+
+    unchanged = catalog.find_unchanged(
+        {
+            "/same.txt": FileSignature(10, 100, 1),
+            "/touched.txt": FileSignature(10, 200, 2),
+            "/new.txt": FileSignature(5, 100, 3),
+        }
+    )
+
+    assert unchanged == ["/same.txt"]
+    assert catalog.get_entry("/touched.txt").file_hash == "h2"
+
+
+def test_forget_and_clear(catalog):
+    """Forgotten and cleared paths are no longer catalogued."""
+    catalog.record([("/a.txt", FileSignature(1, 1, 1), "h"), ("/b.txt", FileSignature(1, 1, 2), "h")])
+
+    catalog.forget(["/a.txt"])
+    assert catalog.get_entry("/a.txt") is None
+    assert catalog.get_entry("/b.txt") is not None
+
+    catalog.clear()
+    assert catalog.get_entry("/b.txt") is None
+
+
+def test_discoverer_skips_catalogued_files(tmp_path, catalog, session_factory):
+    """Unchanged files are counted as skipped and not yielded."""
+    unchanged = tmp_path / "unchanged.txt"
+    changed = tmp_path / "changed.txt"
+    unchanged.write_text("same")
+    changed.write_text("new")
+    catalog.record([(str(unchanged), FileSignature.from_stat(os.stat(unchanged)), "h")])
+
+    watch_path = WatchPath(path=str(tmp_path), include_subdirectories=True, is_excluded=False)
+    discoverer = FileDiscoverer([watch_path], catalog=catalog, snapshot_store=DirectorySnapshotStore(session_factory))
+
+    paths = [op.file_path for op in discoverer.discover()]
+
+    assert paths == [str(changed)]
+    assert discoverer.files_found == 2
+    assert discoverer.files_skipped == 1
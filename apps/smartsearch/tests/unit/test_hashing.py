@@ -0,0 +1,86 @@
+"""
+Unit tests for file content hashing.
+"""
+
+import hashlib
+from unittest.mock import patch
+
+from smart_search.core.config import settings
+from smart_search.services.hashing import (
+    available_algorithms,
+    default_algorithm,
+    hash_file,
+    hash_matches,
+    parse_hash,
+)
+
+
+def test_hash_is_tagged_with_algorithm(tmp_path):
+    """Hashes carry the algorithm that produced them."""
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"hello")
+
+    algorithm, quick, digest = parse_hash(hash_file(str(path)))
+
+    assert algorithm == default_algorithm()
+    assert quick is False
+    assert digest
+
+
+def test_blake2b_matches_stdlib(tmp_path):
+    """Buffered reads produce the same digest as hashing the whole content."""
+    data = b"x" * (3 * 1024 * 1024 + 17)
+    path = tmp_path / "big.bin"
+    path.write_bytes(data)
+
+    assert hash_file(str(path), algorithm="blake2b") == f"blake2b:{hashlib.blake2b(data, digest_size=16).hexdigest()}"
+
+
+def test_mmap_and_buffered_agree(tmp_path):
+    """Memory-mapped hashing gives the same result as buffered hashing."""
+    path = tmp_path / "big.bin"
+    path.write_bytes(b"abc" * 100_000)
+
+    with patch.object(settings, "file_hash_mmap_threshold", 1):
+        mapped = hash_file(str(path))
+    with patch.object(settings, "file_hash_mmap_threshold", 0):
+        buffered = hash_file(str(path))
+
+    assert mapped == buffered
+
+
+def test_quick_hash_samples_large_files(tmp_path):
+    """Quick hashes are tagged and ignore edits between the samples."""
+    size = 8 * 1024 * 1024
+    path = tmp_path / "video.bin"
+    data = bytearray(size)
+    path.write_bytes(data)
+
+    with patch.object(settings, "file_hash_quick_threshold_mb", 1):
+        before = hash_file(str(path))
+        full_before = hash_file(str(path), quick=False)
+        data[size // 4] = 1
+        path.write_bytes(data)
+        after = hash_file(str(path))
+        full_after = hash_file(str(path), quick=False)
+
+    assert parse_hash(before)[1] is True
+    assert before == after
+    assert full_before != full_after
+
+
+def test_legacy_md5_hash_matches(tmp_path):
+    """Untagged MD5 hashes from older indexes are recognised."""
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"content")
+    legacy = hashlib.md5(b"content").hexdigest()
+
+    assert parse_hash(legacy) == ("md5", False, legacy)
+    assert hash_matches(str(path), legacy, hash_file(str(path)))
+    assert not hash_matches(str(path), hashlib.md5(b"other").hexdigest(), hash_file(str(path)))
+
+
+def test_unknown_configured_algorithm_falls_back():
+    """An unavailable configured algorithm resolves to the fastest available one."""
+    with patch.object(settings, "file_hash_algorithm", "does-not-exist"):
+        assert default_algorithm() == available_algorithms()[0]
@@ -0,0 +1,138 @@
+"""
+Unit tests for the materialized index statistics.
+"""
+
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from smart_search.services.crawler.index_stats import DAY_MS, HOUR_MS, IndexedFileFacts, IndexStatsStore
+
+NOW_MS = int(time.time() * 1000)
+
+
+@pytest.fixture
+def store(db_session):
+    @contextmanager
+    def session_factory():
+        yield db_session
+
+    return IndexStatsStore(session_factory)
+
+
+def _facts(path, extension=".txt", size=100, age_days=0, indexed_ago_ms=0):
+    return IndexedFileFacts(
+        path=path,
+        extension=extension,
+        size=size,
+        modified_time=NOW_MS - age_days * DAY_MS,
+        indexed_at=NOW_MS - indexed_ago_ms,
+    )
+
+
+def test_record_counts_extensions_and_bytes(store):
+    """Files are counted and sized per extension."""
+    store.record([_facts("/a.txt"), _facts("/b.txt", size=50), _facts("/c.pdf", extension=".pdf", size=1000)])
+
+    assert store.total_files() == 3
+    assert store.extension_counts() == {".txt": 2, ".pdf": 1}
+    assert store.storage_by_extension() == {".txt": 150, ".pdf": 1000}
+
+
+def test_reindexed_file_replaces_its_contribution(store):
+    """An edited file is counted once, with its latest size, extension and age."""
+    store.record([_facts("/a.txt", size=100, age_days=400)])
+    store.record([_facts("/a.txt", size=300)])
+    store.record([_facts("/a.md", extension=".md"), _facts("/a.md", extension=".md", size=7)])
+
+    assert store.total_files() == 2
+    assert store.storage_by_extension() == {".txt": 300, ".md": 7}
+    assert store.age_distribution(NOW_MS) == {"30d": 2, "90d": 0, "1y": 0, "older": 0}
+
+
+def test_forget_uncounts_files(store):
+    """Removed files leave the statistics; unknown paths are ignored."""
+    store.record([_facts("/a.txt"), _facts("/b.pdf", extension=".pdf")])
+
+    store.forget(["/a.txt", "/never-indexed.txt"])
+
+    assert store.total_files() == 1
+    assert store.extension_counts() == {".pdf": 1}
+    activity, total = store.indexing_activity(hourly=True, now_ms=NOW_MS)
+    assert total == 1
+
+
+def test_age_distribution_buckets(store):
+    """Files fall into the bucket of their modification age in days."""
+    store.record(
+        [
+            _facts("/new", age_days=1),
+            _facts("/recent", age_days=45),
+            _facts("/old", age_days=200),
+            _facts("/ancient", age_days=2000),
+            _facts("/ancient2", age_days=366),
+        ]
+    )
+
+    assert store.age_distribution(NOW_MS) == {"30d": 1, "90d": 1, "1y": 1, "older": 2}
+
+
+def test_indexing_activity_hourly_and_daily(store):
+    """Activity has 24 hourly or 7 daily buckets ending with the current one."""
+    store.record(
+        [
+            _facts("/now"),
+            _facts("/hours-ago", indexed_ago_ms=3 * HOUR_MS),
+            _facts("/days-ago", indexed_ago_ms=3 * DAY_MS),
+            _facts("/weeks-ago", indexed_ago_ms=30 * DAY_MS),
+        ]
+    )
+
+    hourly, hourly_total = store.indexing_activity(hourly=True, now_ms=NOW_MS)
+    assert len(hourly) == 24
+    assert hourly[-1]["timestamp"] == NOW_MS // HOUR_MS * HOUR_MS
+    assert hourly[-1]["count"] == 1
+    assert hourly[-4]["count"] == 1
+    assert hourly_total == 2
+
+    daily, daily_total = store.indexing_activity(hourly=False, now_ms=NOW_MS)
+    assert len(daily) == 7
+    assert daily[-4]["count"] == 1
+    assert daily_total == 3
+
+
+def test_ensure_initialized_counts_existing_index_once(store):
+    """An existing index is counted from the export on first use only."""
+    exported = [
+        {
+            "file_path": "/a.txt",
+            "file_extension": ".txt",
+            "file_size": 10,
+            "modified_time": NOW_MS,
+            "indexed_at": NOW_MS,
+        },
+        {"file_path": "/b", "file_size": None},
+    ]
+    calls = []
+
+    def export():
+        calls.append(1)
+        return iter(exported)
+
+    store.ensure_initialized(export)
+    store.ensure_initialized(export)
+
+    assert len(calls) == 1
+    assert store.extension_counts() == {".txt": 1, "unknown": 1}
+
+
+def test_clear_resets_and_skips_backfill(store):
+    """A reset index has empty statistics and needs no export."""
+    store.record([_facts("/a.txt")])
+
+    store.clear()
+    store.ensure_initialized(lambda: pytest.fail("export should not run"))
+
+    assert store.total_files() == 0
+    assert store.extension_counts() == {}
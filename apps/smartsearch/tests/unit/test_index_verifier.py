@@ -0,0 +1,122 @@
+"""
+Unit tests for export-based index verification.
+"""
+
+import os
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from smart_search.services.crawler.catalog import FileCatalog, FileSignature
+from smart_search.services.crawler.index_stats import IndexedFileFacts, IndexStatsStore
+from smart_search.services.crawler.path_utils import PathFilter
+from smart_search.services.crawler.verification import IndexVerifier
+
+
+@pytest.fixture
+def verifier(db_session, tmp_path):
+    @contextmanager
+    def session_factory():
+        yield db_session
+
+    verifier = IndexVerifier()
+    verifier.typesense = MagicMock()
+    verifier.typesense.batch_remove_files.return_value = {"failed_paths": []}
+    verifier.catalog = FileCatalog(session_factory)
+    verifier.index_stats = IndexStatsStore(session_factory)
+    with patch.object(
+        IndexVerifier,
+        "_build_path_filter",
+        return_value=PathFilter(included_paths=[str(tmp_path)], excluded_paths=[str(tmp_path / "excluded")]),
+    ):
+        yield verifier
+
+
+def _doc(path, size=None, mtime=0, file_hash="h"):
+    return {"file_path": str(path), "file_size": size, "modified_time": mtime, "file_hash": file_hash}
+
+
+def _indexed(path):
+    stats = os.stat(path)
+    return _doc(path, size=stats.st_size, mtime=int(stats.st_mtime * 1000))
+
+
+def test_orphans_removed_in_one_batch(verifier, tmp_path):
+    """Missing and excluded files are removed together; duplicates are checked once."""
+    kept = tmp_path / "kept.txt"
+    kept.write_text("x")
+    (tmp_path / "excluded").mkdir()
+    excluded = tmp_path / "excluded" / "e.txt"
+    excluded.write_text("x")
+    missing = tmp_path / "missing.txt"
+
+    docs = [_indexed(kept), _doc(missing), _doc(missing), _indexed(excluded)]
+    verifier.typesense.get_indexed_files_count.return_value = 3
+    verifier.typesense.export_documents.return_value = iter(docs)
+    verifier.index_stats.record([IndexedFileFacts.from_document(doc) for doc in docs])
+
+    verifier.verify_index()
+
+    verifier.typesense.batch_remove_files.assert_called_once_with([str(missing), str(excluded)])
+    assert verifier.progress.processed_count == 3
+    assert verifier.progress.orphaned_count == 2
+    assert verifier.index_stats.total_files() == 1
+    assert verifier.progress.is_complete is True
+
+
+def test_failed_orphan_deletes_are_not_forgotten(verifier, tmp_path):
+    """Orphans whose delete failed keep their catalog entry and stats and are not counted."""
+    removed, stuck = tmp_path / "removed.txt", tmp_path / "stuck.txt"
+    docs = [_doc(removed), _doc(stuck)]
+    verifier.typesense.get_indexed_files_count.return_value = 2
+    verifier.typesense.export_documents.return_value = iter(docs)
+    verifier.typesense.batch_remove_files.return_value = {"failed_paths": [str(stuck)]}
+    verifier.index_stats.record([IndexedFileFacts.from_document(doc) for doc in docs])
+
+    verifier.verify_index()
+
+    assert verifier.progress.orphaned_count == 1
+    assert verifier.progress.verification_errors == 1
+    assert verifier.index_stats.total_files() == 1
+
+
+def test_drifted_files_reported(verifier, tmp_path):
+    """Files whose size or mtime changed since indexing are passed to on_drift."""
+    same = tmp_path / "same.txt"
+    changed = tmp_path / "changed.txt"
+    same.write_text("x")
+    changed.write_text("longer content")
+
+    docs = [_indexed(same), _doc(changed, size=1, mtime=int(os.stat(changed).st_mtime * 1000))]
+    verifier.typesense.get_indexed_files_count.return_value = 2
+    verifier.typesense.export_documents.return_value = iter(docs)
+    drifted = []
+
+    verifier.verify_index(on_drift=drifted.extend)
+
+    assert drifted == [str(changed)]
+    verifier.typesense.batch_remove_files.assert_not_called()
+
+
+def test_catalog_entry_overrides_indexed_mtime(verifier, tmp_path):
+    """A touched file whose catalog entry matches is not drifted; a hash mismatch is."""
+    touched = tmp_path / "touched.txt"
+    out_of_sync = tmp_path / "out_of_sync.txt"
+    touched.write_text("x")
+    out_of_sync.write_text("y")
+    verifier.catalog.record(
+        [
+            (str(touched), FileSignature.from_stat(os.stat(touched)), "h"),
+            (str(out_of_sync), FileSignature.from_stat(os.stat(out_of_sync)), "other"),
+        ]
+    )
+
+    docs = [_doc(touched, size=1, mtime=1), _indexed(out_of_sync)]
+    verifier.typesense.get_indexed_files_count.return_value = 2
+    verifier.typesense.export_documents.return_value = iter(docs)
+    drifted = []
+
+    verifier.verify_index(on_drift=drifted.extend)
+
+    assert drifted == [str(out_of_sync)]
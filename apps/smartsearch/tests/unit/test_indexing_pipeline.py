@@ -0,0 +1,112 @@
+"""
+Unit tests for the staged indexing pipeline.
+"""
+
+import queue
+import threading
+
+from smart_search.api.models.operations import CrawlOperation, OperationType
+from smart_search.services.crawler.indexer import FileJob
+from smart_search.services.crawler.pipeline import IndexingPipeline
+
+
+class FakeIndexer:
+    """Indexer stand-in: files named 'skip*' finish in prepare, 'bad*' fail extraction."""
+
+    def __init__(self):
+        self.upsert_batches = []
+
+    def prepare(self, operation):
+        job = FileJob(operation=operation, file_hash="h")
+        if "skip" in operation.file_path:
+            job.result = True
+        return job
+
+    def extract(self, job):
+        if "bad" in job.file_path:
+            raise RuntimeError("extraction failed")
+        job.document = object()
+
+    def chunk(self, job, progress_callback=None):
+        progress_callback(0, 1)
+        job.documents = [{"file_path": job.file_path}]
+        job.document = None
+
+    def upsert(self, jobs):
+        self.upsert_batches.append([job.file_path for job in jobs])
+        for job in jobs:
+            job.result = True
+
+
+def _run(paths):
+    indexer = FakeIndexer()
+    results = {}
+    done = threading.Event()
+
+    def on_complete(job):
+        results[job.file_path] = job.result
+        if len(results) == len(paths):
+            done.set()
+
+    pipeline = IndexingPipeline(indexer, on_complete=on_complete, extract_workers=2)
+    for path in paths:
+        pipeline.submit(CrawlOperation(operation=OperationType.CREATE, file_path=path, source="crawl"))
+    assert done.wait(5)
+    return pipeline, indexer, results
+
+
+def test_pipeline_completes_every_file():
+    """Each submitted file completes exactly once with its outcome."""
+    paths = [f"/docs/file{i}.txt" for i in range(10)] + ["/docs/skip.txt", "/docs/bad.txt"]
+
+    pipeline, indexer, results = _run(paths)
+
+    assert results["/docs/skip.txt"] is True
+    assert results["/docs/bad.txt"] is False
+    assert all(results[f"/docs/file{i}.txt"] for i in range(10))
+    upserted = [path for batch in indexer.upsert_batches for path in batch]
+    assert sorted(upserted) == sorted(f"/docs/file{i}.txt" for i in range(10))
+
+
+def test_pipeline_stats():
+    """Stats report every stage in order with processed counts."""
+    pipeline, _, _ = _run(["/docs/a.txt", "/docs/b.txt"])
+    pipeline.prepare_stage.queue.join()
+
+    stats = pipeline.get_stats()
+
+    assert [stage["stage"] for stage in stats] == ["prepare", "extract", "chunk", "upsert"]
+    assert stats[0]["processed"] == 2
+    assert stats[1]["workers"] == 2
+
+
+def test_set_extract_workers():
+    """The extraction stage can be resized at runtime."""
+    pipeline, _, _ = _run(["/docs/a.txt"])
+
+    pipeline.set_extract_workers(4)
+
+    assert pipeline.get_stats()[1]["workers"] == 4
+
+
+def test_upsert_batch_keeps_latest_job_per_path():
+    """A drained job for a path already in the batch replaces the earlier job."""
+    indexer = FakeIndexer()
+    completed = []
+    pipeline = IndexingPipeline(indexer, on_complete=completed.append)
+    # Detach the upsert workers (blocked on the old queue) to drain deterministically
+    pipeline.upsert_stage.queue = queue.Queue()
+
+    def job(path, operation=OperationType.EDIT):
+        return FileJob(operation=CrawlOperation(operation=operation, file_path=path, source="crawl"))
+
+    first, other, latest = job("/docs/a.txt"), job("/docs/b.txt"), job("/docs/a.txt", OperationType.CREATE)
+    for queued in (first, other, latest):
+        pipeline.upsert_stage.put(queued)
+    pipeline._upsert("upsert_0", pipeline.upsert_stage.queue.get())
+    pipeline.upsert_stage.queue.task_done()
+
+    assert indexer.upsert_batches == [["/docs/b.txt", "/docs/a.txt"]]
+    assert completed[:2] == [other, latest]
+    assert completed[2] is first and first.result is True
+    assert pipeline.upsert_stage.queue.unfinished_tasks == 0
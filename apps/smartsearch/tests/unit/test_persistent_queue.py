@@ -0,0 +1,99 @@
+"""
+Unit tests for the disk-backed crawl queue.
+"""
+
+import time
+
+import pytest
+
+from smart_search.api.models.operations import PRIORITY_WATCH, CrawlOperation, OperationType
+from smart_search.services.crawler.persistent_queue import PersistentDedupQueue
+
+
+@pytest.fixture
+def open_queue(tmp_path):
+    queues = []
+
+    def factory(**kwargs):
+        queue = PersistentDedupQueue[CrawlOperation](
+            tmp_path / "queue.db",
+            serialize=lambda operation: operation.model_dump_json(),
+            deserialize=CrawlOperation.model_validate_json,
+            **kwargs,
+        )
+        queues.append(queue)
+        return queue
+
+    yield factory
+    for queue in queues:
+        queue.close()
+
+
+def _op(path, operation=OperationType.CREATE, source="crawl", priority=0):
+    return CrawlOperation(operation=operation, file_path=path, source=source, priority=priority)
+
+
+def test_pending_items_survive_restart(open_queue):
+    """Queued items are restored in priority, then arrival order."""
+    queue = open_queue()
+    queue.put("/a", _op("/a"))
+    queue.put("/b", _op("/b"))
+    queue.put("/saved", _op("/saved", OperationType.EDIT, "watch", PRIORITY_WATCH))
+    queue.put("/a", _op("/a", OperationType.EDIT))
+    queue.close()
+
+    restored = open_queue()
+
+    assert restored.qsize() == 3
+    items = [restored.get() for _ in range(3)]
+    assert [item.file_path for item in items] == ["/saved", "/a", "/b"]
+    assert items[1].operation == OperationType.EDIT
+
+
+def test_acknowledged_items_are_removed(open_queue):
+    """Only items acknowledged with task_done(key) are dropped from disk."""
+    queue = open_queue()
+    queue.put("/done", _op("/done"))
+    queue.put("/in_flight", _op("/in_flight"))
+    queue.get()
+    queue.task_done("/done")
+    queue.get()
+    queue.close()
+
+    restored = open_queue()
+
+    assert restored.qsize() == 1
+    assert restored.get().file_path == "/in_flight"
+
+
+def test_acknowledgement_keeps_newer_version(open_queue):
+    """An item queued again while its previous version is processed is not lost."""
+    queue = open_queue()
+    queue.put("/a", _op("/a"))
+    queue.get()
+    queue.put("/a", _op("/a", OperationType.EDIT))
+    queue.task_done("/a")
+    queue.close()
+
+    restored = open_queue()
+
+    assert restored.qsize() == 1
+    assert restored.get().operation == OperationType.EDIT
+
+
+def test_writer_flushes_in_background(open_queue):
+    """Buffered changes reach the database without an explicit flush."""
+    queue = open_queue(batch_size=2, flush_interval_ms=10)
+    for i in range(5):
+        queue.put(f"/{i}", _op(f"/{i}"))
+
+    deadline = time.time() + 2
+    count = 0
+    while time.time() < deadline:
+        with queue._write_lock:
+            count = queue._conn.execute("SELECT COUNT(*) FROM pending_operations").fetchone()[0]
+        if count == 5:
+            break
+        time.sleep(0.01)
+
+    assert count == 5
@@ -0,0 +1,77 @@
+"""
+Unit tests for the query embedding cache.
+"""
+
+from unittest.mock import MagicMock
+
+import typesense
+
+from smart_search.services.query_embeddings import QueryEmbeddingCache, normalize_query
+
+
+def _cache(stored=None):
+    client = MagicMock()
+    documents = client.collections.__getitem__.return_value.documents
+    document = documents.__getitem__.return_value
+    if stored is None:
+        document.retrieve.side_effect = typesense.exceptions.ObjectNotFound("missing")
+    else:
+        document.retrieve.return_value = stored
+    documents.upsert.side_effect = lambda doc: {**doc, "embedding": [0.5, -0.25]}
+    return QueryEmbeddingCache(client, "files_queries"), client, documents
+
+
+def test_normalize_query():
+    assert normalize_query("  Tax   REPORT\t2024 ") == "tax report 2024"
+    assert normalize_query("ｔａｘ") == "tax"
+
+
+def test_stored_vector_is_reused():
+    cache, _, documents = _cache(stored={"query": "tax report", "embedding": [0.1, 0.2]})
+
+    assert cache.get_vector("Tax  Report") == "0.1,0.2"
+    documents.upsert.assert_not_called()
+
+
+def test_new_query_is_embedded_once():
+    cache, _, documents = _cache()
+
+    assert cache.get_vector("tax report") == "0.5,-0.25"
+    assert cache.get_vector("TAX report") == "0.5,-0.25"
+
+    documents.upsert.assert_called_once()
+    assert documents.upsert.call_args.args[0]["query"] == "tax report"
+
+
+def test_missing_collection_is_created():
+    cache, client, _ = _cache()
+    client.collections.__getitem__.return_value.retrieve.side_effect = typesense.exceptions.ObjectNotFound("missing")
+
+    cache.get_vector("tax")
+
+    schema = client.collections.create.call_args.args[0]
+    assert schema["name"] == "files_queries"
+    assert [field["name"] for field in schema["fields"]] == ["query", "created_at", "embedding"]
+
+
+def test_unavailable_typesense_returns_no_vector():
+    cache, _, documents = _cache()
+    documents.upsert.side_effect = typesense.exceptions.ServiceUnavailable("Not Ready")
+
+    assert cache.get_vector("tax") is None
+    assert cache.get_vector("") is None
+
+
+def test_prune_deletes_oldest_queries(monkeypatch):
+    from smart_search.core.config import settings
+
+    monkeypatch.setattr(settings, "query_embedding_max_stored", 10)
+    cache, client, documents = _cache()
+    collection = client.collections.__getitem__.return_value
+    collection.retrieve.return_value = {"num_documents": 13}
+    documents.search.return_value = {"hits": [{"document": {"created_at": 1700}}]}
+
+    cache._prune()
+
+    assert documents.search.call_args.args[0]["page"] == 3
+    documents.delete.assert_called_once_with({"filter_by": "created_at:<=1700"})
@@ -0,0 +1,121 @@
+"""
+Unit tests for the in-memory result cache.
+"""
+
+import threading
+import time
+
+import pytest
+
+from smart_search.services.result_cache import ResultCache
+
+
+def test_hit_after_load():
+    cache = ResultCache(max_entries=10, ttl_seconds=60)
+    calls = []
+
+    assert cache.get_or_load("a", lambda: calls.append(1) or "value") == "value"
+    assert cache.get_or_load("a", lambda: calls.append(1) or "other") == "value"
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_entries_are_reloaded():
+    cache = ResultCache(max_entries=10, ttl_seconds=0.01)
+    cache.get_or_load("a", lambda: 1)
+    time.sleep(0.02)
+
+    assert cache.get_or_load("a", lambda: 2) == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResultCache(max_entries=2, ttl_seconds=60)
+    cache.get_or_load("a", lambda: 1)
+    cache.get_or_load("b", lambda: 2)
+    cache.get_or_load("a", lambda: 0)  # a is now the most recently used
+    cache.get_or_load("c", lambda: 3)
+
+    assert len(cache) == 2
+    assert cache.get_or_load("a", lambda: 0) == 1
+    assert cache.get_or_load("b", lambda: 0) == 0
+
+
+def test_invalidate_drops_entries():
+    cache = ResultCache(max_entries=10, ttl_seconds=60)
+    cache.get_or_load("a", lambda: 1)
+    cache.invalidate()
+
+    assert len(cache) == 0
+    assert cache.get_or_load("a", lambda: 2) == 2
+
+
+def test_load_started_before_invalidate_is_not_stored():
+    cache = ResultCache(max_entries=10, ttl_seconds=60)
+
+    def load():
+        cache.invalidate()  # an index write lands while the query runs
+        return "stale"
+
+    assert cache.get_or_load("a", load) == "stale"
+    assert cache.get_or_load("a", lambda: "fresh") == "fresh"
+
+
+def test_concurrent_requests_share_one_load():
+    cache = ResultCache(max_entries=10, ttl_seconds=60)
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("a", load))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while cache.coalesced < 7:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+
+
+def test_errors_reach_waiting_callers_and_are_not_cached():
+    cache = ResultCache(max_entries=10, ttl_seconds=60)
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise RuntimeError("down")
+
+    errors = []
+
+    def request():
+        try:
+            cache.get_or_load("a", fail)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=request) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while cache.coalesced < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 3
+    assert cache.get_or_load("a", lambda: "ok") == "ok"
+
+
+@pytest.mark.parametrize("max_entries", [0, 10])
+def test_uncacheable_values_are_not_stored(max_entries):
+    cache = ResultCache(max_entries=max_entries, ttl_seconds=60)
+    cache.get_or_load("a", lambda: "partial", cacheable=lambda value: False)
+
+    assert cache.get_or_load("a", lambda: "full") == "full"
@@ -0,0 +1,94 @@
+"""
+Unit tests for the Tika server client.
+"""
+
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from smart_search.services.extraction.tika_client import TikaClient, get_tika_client
+
+
+def _client(handler, **kwargs):
+    return TikaClient(
+        base_url="http://tika:9998/", http_client=httpx.Client(transport=httpx.MockTransport(handler)), **kwargs
+    )
+
+
+def test_extract_streams_file_to_rmeta(tmp_path):
+    """The file is PUT to /rmeta/text and embedded document text is appended."""
+    path = tmp_path / "report.docx"
+    path.write_bytes(b"binary-content")
+    requests = []
+
+    def handler(request: httpx.Request):
+        requests.append((request.method, str(request.url), request.headers.copy(), request.read()))
+        return httpx.Response(
+            200,
+            json=[
+                {"Content-Type": "application/zip", "dc:title": "Report", "X-TIKA:content": "container"},
+                {"Content-Type": "text/plain", "X-TIKA:content": "embedded"},
+                {"Content-Type": "image/png", "X-TIKA:content": "  "},
+            ],
+        )
+
+    content, metadata = _client(handler).extract(str(path))
+
+    method, url, headers, body = requests[0]
+    assert (method, url, body) == ("PUT", "http://tika:9998/rmeta/text", b"binary-content")
+    assert headers["content-length"] == "14"
+    assert 'filename="report.docx"' in headers["content-disposition"]
+    assert content == "container\nembedded"
+    assert metadata == {"Content-Type": "application/zip", "dc:title": "Report"}
+
+
+def test_extract_raises_on_server_error(tmp_path):
+    """Tika errors surface as HTTP errors so the next strategy can take over."""
+    path = tmp_path / "broken.pdf"
+    path.write_bytes(b"x")
+
+    client = _client(lambda request: httpx.Response(422, text=json.dumps({"error": "parse"})))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.extract(str(path))
+
+
+def test_concurrency_is_capped(tmp_path):
+    """No more than max_concurrency extractions run at once."""
+    path = tmp_path / "a.txt"
+    path.write_text("a")
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return httpx.Response(200, json=[{"X-TIKA:content": "a"}])
+
+    client = _client(handler, max_concurrency=2)
+    threads = [threading.Thread(target=client.extract, args=(str(path),)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+
+
+def test_global_client_per_server_url():
+    """Each server URL gets its own shared client."""
+    default = get_tika_client()
+    other = get_tika_client("http://other-tika:9998/")
+
+    assert get_tika_client("http://other-tika:9998") is other
+    assert other is not default
+    assert other.base_url == "http://other-tika:9998"
@@ -0,0 +1,433 @@
+"""
+Unit tests for TypesenseClient bulk operations.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import typesense
+
+from smart_search.services.typesense_client import TypesenseClient
+
+
+def _make_client(import_responses):
+    """Create a client whose import endpoint returns the given JSONL responses in order."""
+    client = TypesenseClient()
+    import_api = MagicMock()
+    import_api.import_.side_effect = import_responses
+    import_client = MagicMock()
+    import_client.collections.__getitem__.return_value.documents = import_api
+    client._import_client = import_client
+    return client, import_api
+
+
+def _docs(client, count, file_path="/docs/file.txt", content="text"):
+    return [
+        client.build_chunk_document(
+            file_path=file_path,
+            content=content,
+            chunk_index=i,
+            chunk_total=count,
+            chunk_hash=f"hash{i}",
+            file_extension=".txt",
+            file_size=100,
+            mime_type="text/plain",
+            modified_time=0,
+            created_time=0,
+            file_hash="abc",
+        )
+        for i in range(count)
+    ]
+
+
+def _ok(count):
+    return "\n".join(json.dumps({"success": True}) for _ in range(count))
+
+
+def test_build_chunk_document_defaults():
+    """Missing metadata produces empty defaults and chunk ids."""
+    client = TypesenseClient()
+    doc = _docs(client, 1)[0]
+
+    assert doc["id"] == TypesenseClient.generate_doc_id("/docs/file.txt", 0)
+    assert doc["title"] == ""
+    assert doc["keywords"] == []
+
+
+def test_build_chunk_document_keywords_string():
+    """Comma-separated keywords are split into a list."""
+    client = TypesenseClient()
+    doc = client.build_chunk_document(
+        file_path="/docs/a.pdf",
+        content="x",
+        chunk_index=0,
+        chunk_total=1,
+        chunk_hash="h",
+        file_extension=".pdf",
+        file_size=1,
+        mime_type="application/pdf",
+        modified_time=0,
+        created_time=0,
+        file_hash="abc",
+        metadata={"title": "Report", "keywords": "a, b"},
+    )
+
+    assert doc["title"] == "Report"
+    assert doc["keywords"] == ["a", "b"]
+
+
+def test_index_chunks_single_request():
+    """All chunks go out in one import call with upsert action."""
+    client, import_api = _make_client([_ok(5)])
+
+    result = client.index_chunks(_docs(client, 5), batch_size=100)
+
+    assert result == {"successful": 5, "failed": 0, "errors": []}
+    assert import_api.import_.call_count == 1
+    payload, params = import_api.import_.call_args[0]
+    assert len(payload.split("\n")) == 5
+    assert params == {"action": "upsert"}
+
+
+def test_index_chunks_splits_by_count():
+    """Batches are capped at batch_size documents."""
+    client, import_api = _make_client([_ok(2), _ok(2), _ok(1)])
+
+    result = client.index_chunks(_docs(client, 5), batch_size=2)
+
+    assert result["successful"] == 5
+    assert import_api.import_.call_count == 3
+
+
+def test_index_chunks_splits_by_size():
+    """Batches are capped at max_batch_bytes."""
+    client, import_api = _make_client([_ok(1), _ok(1), _ok(1)])
+    docs = _docs(client, 3, content="x" * 1000)
+
+    result = client.index_chunks(docs, batch_size=100, max_batch_bytes=1500)
+
+    assert result["successful"] == 3
+    assert import_api.import_.call_count == 3
+
+
+def test_index_chunks_reports_per_document_errors():
+    """Rejected documents are reported with their id and path."""
+    response = "\n".join(
+        [
+            json.dumps({"success": True}),
+            json.dumps({"success": False, "error": "Bad field"}),
+        ]
+    )
+    client, _ = _make_client([response])
+    docs = _docs(client, 2)
+
+    result = client.index_chunks(docs)
+
+    assert result["successful"] == 1
+    assert result["failed"] == 1
+    assert result["errors"] == [{"id": docs[1]["id"], "file_path": "/docs/file.txt", "error": "Bad field"}]
+
+
+def test_index_chunks_batch_failure_marks_all_failed():
+    """A failed request marks every document of that batch as failed."""
+    client, _ = _make_client([ConnectionError("refused"), _ok(1)])
+
+    result = client.index_chunks(_docs(client, 3), batch_size=2)
+
+    assert result["successful"] == 1
+    assert result["failed"] == 2
+
+
+def _make_delete_client(responses):
+    """Create a client whose delete-by-filter endpoint returns the given responses in order."""
+    client = TypesenseClient()
+    documents_api = MagicMock()
+    documents_api.delete.side_effect = responses
+    client.client = MagicMock()
+    client.client.collections.__getitem__.return_value.documents = documents_api
+    return client, documents_api
+
+
+def test_batch_remove_files_single_filter_request():
+    """All chunks of many files are removed with one quoted file_path filter."""
+    client, documents_api = _make_delete_client([{"num_deleted": 7}])
+
+    result = client.batch_remove_files(["/docs/a, b.txt", "/docs/c.txt", "/docs/c.txt"])
+
+    assert result == {"successful": 2, "failed": 0, "failed_paths": [], "documents_deleted": 7}
+    documents_api.delete.assert_called_once_with({"filter_by": "file_path:=[`/docs/a, b.txt`,`/docs/c.txt`]"})
+
+
+def test_batch_remove_files_splits_by_count_and_length():
+    """Filters are split by path count and by URL-encoded length."""
+    client, documents_api = _make_delete_client([{"num_deleted": 1}] * 10)
+    paths = [f"/docs/{i:03d}.txt" for i in range(5)]
+
+    client.batch_remove_files(paths, batch_size=2, max_filter_length=10_000)
+    assert documents_api.delete.call_count == 3
+
+    documents_api.delete.reset_mock()
+    client.batch_remove_files(paths, batch_size=100, max_filter_length=80)
+    filters = [call.args[0]["filter_by"] for call in documents_api.delete.call_args_list]
+    assert len(filters) > 1
+    assert all(f.count("`") // 2 >= 1 for f in filters)
+    assert sum(f.count("`") // 2 for f in filters) == 5
+
+
+def test_batch_remove_files_counts_failed_batches():
+    """A failed request marks every path of that batch as failed."""
+    client, _ = _make_delete_client([ConnectionError("refused"), {"num_deleted": 1}])
+
+    result = client.batch_remove_files(["/a", "/b", "/c"], batch_size=2)
+
+    assert result["successful"] == 1
+    assert result["failed"] == 2
+    assert result["failed_paths"] == ["/a", "/b"]
+
+
+def test_batch_remove_files_backtick_path_deletes_by_chunk_ids():
+    """Paths that cannot be quoted in a filter are removed by chunk id."""
+    client, documents_api = _make_delete_client([{"num_deleted": 3}])
+    documents_api.__getitem__.return_value.retrieve.return_value = {"chunk_total": 3}
+
+    result = client.batch_remove_files(["/docs/odd`name.txt"])
+
+    assert result["documents_deleted"] == 3
+    ids = [TypesenseClient.generate_doc_id("/docs/odd`name.txt", i) for i in range(3)]
+    documents_api.delete.assert_called_once_with({"filter_by": f"id:[{','.join(ids)}]"})
+
+
+def test_export_documents_streams_jsonl():
+    """Exported JSONL lines are parsed one by one with the given parameters."""
+    client = TypesenseClient()
+    response = MagicMock()
+    response.iter_lines.return_value = iter(['{"file_path": "/a"}', "", '{"file_path": "/b"}'])
+    stream = MagicMock()
+    stream.__enter__.return_value = response
+
+    with patch("smart_search.services.typesense_client.httpx.stream", return_value=stream) as mock_stream:
+        docs = list(client.export_documents(include_fields="file_path", filter_by="chunk_index:=0"))
+
+    assert docs == [{"file_path": "/a"}, {"file_path": "/b"}]
+    assert mock_stream.call_args.kwargs["params"] == {"include_fields": "file_path", "filter_by": "chunk_index:=0"}
+
+
+def test_index_chunks_update_action():
+    """Partial updates go through the import endpoint with the update action."""
+    client, import_api = _make_client([_ok(2)])
+    updates = [TypesenseClient.metadata_update(doc) for doc in _docs(client, 2)]
+
+    client.index_chunks(updates, action="update")
+
+    assert import_api.import_.call_args.args[1] == {"action": "update"}
+    assert all("content" not in doc and "title" not in doc and "keywords" not in doc for doc in updates)
+    assert all(doc["file_hash"] == "abc" and doc["chunk_hash"] for doc in updates)
+
+
+def test_get_chunk_hashes_groups_exported_chunks():
+    """Chunk hashes of several files are read with one export filter."""
+    client = TypesenseClient()
+    exported = [
+        {"file_path": "/a", "chunk_index": 0, "chunk_hash": "a0"},
+        {"file_path": "/a", "chunk_index": 1, "chunk_hash": "a1"},
+        {"file_path": "/b", "chunk_index": 0, "chunk_hash": "b0"},
+    ]
+
+    with patch.object(client, "export_documents", return_value=iter(exported)) as export:
+        hashes = client.get_chunk_hashes(["/a", "/b", "/odd`name"])
+
+    assert hashes == {"/a": {0: "a0", 1: "a1"}, "/b": {0: "b0"}}
+    assert export.call_args.kwargs["filter_by"] == "file_path:=[`/a`,`/b`]"
+
+
+def test_remove_chunks_by_id():
+    client, documents_api = _make_delete_client([{"num_deleted": 2}])
+
+    assert client.remove_chunks(["x_chunk_3", "x_chunk_4"]) == 2
+    documents_api.delete.assert_called_once_with({"filter_by": "id:[x_chunk_3,x_chunk_4]"})
+
+
+def _search_client():
+    client = TypesenseClient()
+    client.client = MagicMock()
+    client.client.multi_search.perform.side_effect = lambda searches, params: {"results": [{"found": 1, "hits": []}]}
+    return client
+
+
+def test_multi_search_caches_identical_requests():
+    client = _search_client()
+
+    first = client.multi_search([{"q": "report", "query_by": "content"}], {"per_page": "10"})
+    second = client.multi_search([{"query_by": "content", "q": "report"}], {"per_page": "10"})
+    client.multi_search([{"q": "reports", "query_by": "content"}], {"per_page": "10"})
+
+    assert first is second
+    assert client.client.multi_search.perform.call_count == 2
+    searches = client.client.multi_search.perform.call_args.args[0]["searches"]
+    assert searches[0]["collection"] == client.collection_name
+
+
+def test_multi_search_cache_is_invalidated_by_index_writes():
+    client = _search_client()
+    documents_api = client.client.collections.__getitem__.return_value.documents
+    documents_api.delete.return_value = {"num_deleted": 1}
+
+    client.multi_search([{"q": "report"}])
+    client.remove_chunks(["abc"])
+    client.multi_search([{"q": "report"}])
+
+    assert client.client.multi_search.perform.call_count == 2
+
+
+def test_multi_search_does_not_cache_failed_searches():
+    client = _search_client()
+    client.client.multi_search.perform.side_effect = lambda searches, params: {"results": [{"error": "Not Ready"}]}
+
+    client.multi_search([{"q": "report"}])
+    client.multi_search([{"q": "report"}])
+
+    assert client.client.multi_search.perform.call_count == 2
+
+
+def test_collection_stats_cached_until_index_write():
+    client = TypesenseClient()
+    client.client = MagicMock()
+    collection = client.client.collections.__getitem__.return_value
+    collection.documents.search.return_value = {"found": 3, "facet_counts": []}
+    collection.documents.delete.return_value = {"num_deleted": 1}
+
+    assert client.get_collection_stats()["num_documents"] == 3
+    assert client.get_collection_stats()["num_documents"] == 3
+    assert collection.retrieve.call_count == 1
+
+    client.remove_chunks(["abc"])
+    collection.documents.search.return_value = {"found": 2, "facet_counts": []}
+
+    assert client.get_collection_stats()["num_documents"] == 2
+    assert collection.retrieve.call_count == 2
+
+
+def test_file_type_distribution_failure_is_not_cached():
+    client = TypesenseClient()
+    client.client = MagicMock()
+    documents_api = client.client.collections.__getitem__.return_value.documents
+    documents_api.search.side_effect = [
+        Exception("Connection refused"),
+        {"facet_counts": [{"field_name": "file_extension", "counts": [{"value": ".pdf", "count": 4}]}]},
+    ]
+
+    assert client.get_file_type_distribution() == {}
+    assert client.get_file_type_distribution() == {".pdf": 4}
+    assert client.get_file_type_distribution() == {".pdf": 4}
+    assert documents_api.search.call_count == 2
+
+
+def test_search_files_queries_schema_fields():
+    client = _search_client()
+
+    assert client.search_files("report") == {"found": 1, "hits": []}
+    search = client.client.multi_search.perform.call_args.args[0]["searches"][0]
+    assert "file_name" not in search["query_by"]
+    assert search["group_by"] == "file_path"
+
+
+def _sent_search(client, search, common_params=None, vector="0.1,0.2"):
+    client.query_embeddings = MagicMock()
+    client.query_embeddings.get_vector.return_value = vector
+    client.multi_search([search], common_params)
+    return client.client.multi_search.perform.call_args.args[0]["searches"][0]
+
+
+def test_hybrid_search_uses_cached_query_vector():
+    client = _search_client()
+
+    sent = _sent_search(client, {"q": "Tax Report", "query_by": "content,embedding", "hybrid_alpha": 0.5})
+
+    client.query_embeddings.get_vector.assert_called_once_with("Tax Report")
+    assert sent["query_by"] == "content"
+    assert sent["vector_query"] == "embedding:([0.1,0.2], alpha: 0.5)"
+    assert "hybrid_alpha" not in sent
+
+
+def test_keyword_search_drops_the_embedding():
+    client = _search_client()
+
+    sent = _sent_search(
+        client,
+        {"q": "tax", "query_by": "title,embedding,content", "query_by_weights": "2,1,1"},
+        {"search_mode": "keyword"},
+    )
+
+    client.query_embeddings.get_vector.assert_not_called()
+    assert sent["query_by"] == "title,content"
+    assert sent["query_by_weights"] == "2,1"
+    assert "vector_query" not in sent
+    assert "search_mode" not in client.client.multi_search.perform.call_args.args[1]
+
+
+def test_semantic_search_is_vector_only():
+    client = _search_client()
+
+    sent = _sent_search(client, {"q": "tax", "query_by": "content,embedding", "search_mode": "semantic"})
+
+    assert sent["q"] == "*"
+    assert sent["vector_query"] == "embedding:([0.1,0.2])"
+
+
+def test_hybrid_search_falls_back_to_typesense_embedding():
+    client = _search_client()
+
+    sent = _sent_search(client, {"q": "tax", "query_by": "content,embedding"}, vector=None)
+
+    assert sent["query_by"] == "content,embedding"
+    assert "vector_query" not in sent
+
+
+def test_search_mode_validation():
+    client = _search_client()
+
+    with pytest.raises(ValueError):
+        client.multi_search([{"q": "tax", "search_mode": "fuzzy"}])
+    with pytest.raises(ValueError):
+        client.multi_search([{"q": "tax", "hybrid_alpha": 2}])
+
+
+@pytest.mark.parametrize("exists", [True, False])
+def test_new_collection_clears_local_index_state(exists):
+    """Catalog, snapshots and index stats are dropped only when the collection is created."""
+    client = TypesenseClient()
+    client.client = MagicMock()
+    if not exists:
+        client.client.collections.__getitem__.return_value.retrieve.side_effect = typesense.exceptions.ObjectNotFound(
+            "Not found"
+        )
+
+    with (
+        patch("smart_search.services.typesense_client.typesense.Client"),
+        patch("smart_search.services.service_manager.get_service_manager"),
+        patch("smart_search.services.crawler.catalog.get_file_catalog") as catalog,
+        patch("smart_search.services.crawler.snapshots.get_directory_snapshot_store") as snapshots,
+        patch("smart_search.services.crawler.index_stats.get_index_stats") as index_stats,
+    ):
+        client.initialize_collection(max_attempts=1)
+
+    assert client.collection_ready
+    for store in (catalog, snapshots, index_stats):
+        assert store.return_value.clear.called is not exists
+
+
+def test_index_writes_invalidate_caches_of_every_client():
+    """Stats cached by one client are dropped by a write through another."""
+    client = TypesenseClient()
+    client.client = MagicMock()
+    documents_api = client.client.collections.__getitem__.return_value.documents
+    documents_api.search.return_value = {"found": 3}
+    writer = TypesenseClient()
+    writer.client = MagicMock()
+
+    assert client.get_collection_stats()["num_documents"] == 3
+    writer.remove_from_index("/docs/a.txt")
+    documents_api.search.return_value = {"found": 2}
+
+    assert client.get_collection_stats()["num_documents"] == 2
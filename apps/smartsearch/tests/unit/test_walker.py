@@ -0,0 +1,66 @@
+"""
+Unit tests for the parallel directory walker.
+"""
+
+import threading
+
+from smart_search.services.crawler.path_utils import PathFilter
+from smart_search.services.crawler.walker import ParallelWalker
+
+
+def _make_tree(root):
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "excluded").mkdir()
+    (root / "top.txt").write_text("1")
+    (root / "a" / "one.txt").write_text("22")
+    (root / "a" / "b" / "two.txt").write_text("333")
+    (root / "excluded" / "hidden.txt").write_text("x")
+
+
+def _walk(root, recursive=True, workers=4):
+    walker = ParallelWalker(
+        PathFilter(included_paths=[str(root)], excluded_paths=[str(root / "excluded")]),
+        workers=workers,
+    )
+    found = {}
+    lock = threading.Lock()
+
+    def on_directory(directory, files):
+        with lock:
+            for path, stats in files:
+                found[path] = stats.st_size
+
+    walker.walk([(str(root), recursive)], on_directory)
+    return found
+
+
+def test_walk_finds_all_files_with_stats(tmp_path):
+    """Every file outside excluded directories is reported once with its stat."""
+    _make_tree(tmp_path)
+
+    found = _walk(tmp_path)
+
+    assert found == {
+        str(tmp_path / "top.txt"): 1,
+        str(tmp_path / "a" / "one.txt"): 2,
+        str(tmp_path / "a" / "b" / "two.txt"): 3,
+    }
+
+
+def test_walk_non_recursive(tmp_path):
+    """Non-recursive roots only list their own files."""
+    _make_tree(tmp_path)
+
+    assert list(_walk(tmp_path, recursive=False)) == [str(tmp_path / "top.txt")]
+
+
+def test_walk_single_worker(tmp_path):
+    """A single worker still drains the whole tree."""
+    _make_tree(tmp_path)
+
+    assert len(_walk(tmp_path, workers=1)) == 3
+
+
+def test_walk_missing_root(tmp_path):
+    """A missing root is skipped without error."""
+    assert _walk(tmp_path / "missing") == {}